@@ -0,0 +1,76 @@
+"""Benchmark the objects and bytes allocated per OperationProxy.__call__
+
+The responses are kept alive, hence the traced allocations are the ones
+that a call leaves to the garbage collector: the request, the response
+and everything they hold.
+The peak is the most memory a single call had allocated at once.
+
+Usage:
+    python benchmarks/bench_allocations.py
+"""
+import json
+import pathlib
+import sys
+import tracemalloc
+
+from qlient.core import Settings, Backend, GraphQLRequest, GraphQLResponse
+from qlient.core.proxies import QueryServiceProxy
+from qlient.core.schema.schema import Schema
+
+schema_files_dir = pathlib.Path(__file__).parent.parent / "tests" / "schema_files"
+path_to_swapi_schema = schema_files_dir / "swapi_schema.json"
+
+CALLS = 1000
+
+RESPONSE = {"data": {"film": {"title": "A New Hope"}}}
+
+
+class NoopBackend(Backend):
+    """Backend that answers every request with the same response"""
+
+    def execute_query(self, request: GraphQLRequest) -> GraphQLResponse:
+        return GraphQLResponse(request, RESPONSE)
+
+
+def measure(label: str, call):
+    """Print the objects and bytes that stay allocated and the peak per call"""
+    call()  # warm up the caches
+    responses = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(CALLS):
+        responses.append(call())
+    after = tracemalloc.take_snapshot()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    peak = ""
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        call()
+        peak = f"{tracemalloc.get_traced_memory()[1] - current:8d} B peak"
+    tracemalloc.stop()
+    print(
+        f"{label:<28} "
+        f"{blocks / CALLS:8.1f} objects "
+        f"{size / CALLS:8.0f} B "
+        f"{peak}"
+    )
+
+
+def main():
+    with path_to_swapi_schema.open() as schema_file:
+        raw_schema = json.load(schema_file)
+    schema = Schema(raw_schema, None)
+    proxy = QueryServiceProxy(NoopBackend(), Settings(), schema, [])
+    film = proxy.film.prepare(["title"], ["id"])
+
+    print(f"python {sys.version.split()[0]}, {CALLS} calls")
+    measure("film (explicit)", lambda: proxy.film(["title"], id="1"))
+    measure("film (auto)", lambda: proxy.film(id="1"))
+    measure("film (prepared)", lambda: film(id="1"))
+
+
+if __name__ == "__main__":
+    main()
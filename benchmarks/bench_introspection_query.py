@@ -0,0 +1,67 @@
+"""Benchmark the payload size and parse time of the introspection query variants
+
+The introspection queries are executed with graphql-core
+against a schema that is built from the github schema fixture,
+hence the payloads are the ones a real server would send.
+
+Usage:
+    python benchmarks/bench_introspection_query.py
+"""
+import json
+import pathlib
+import timeit
+
+import graphql
+
+from qlient.core.schema.introspection import build_introspection_query
+from qlient.core.schema.schema import Schema
+
+schema_files_dir = pathlib.Path(__file__).parent.parent / "tests" / "schema_files"
+path_to_github_schema = schema_files_dir / "github_schema.json"
+
+VARIANTS = {
+    "full": {},
+    "no descriptions": {"descriptions": False},
+    "no deprecated": {"include_deprecated": False},
+    "type ref depth 3": {"type_ref_depth": 3},
+    "minimal": {
+        "descriptions": False,
+        "include_deprecated": False,
+        "type_ref_depth": 3,
+    },
+}
+
+REPEAT = 5
+NUMBER = 3
+
+
+def best_time(stmt) -> float:
+    """Return the best time per call of the statement"""
+    return min(timeit.repeat(stmt, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main():
+    raw_github_schema = json.loads(path_to_github_schema.read_text())
+    # the github fixture violates a few schema rules, hence skip the validation
+    client_schema = graphql.build_client_schema(
+        raw_github_schema["data"], assume_valid=True
+    )
+    print(f"{'variant':<20} {'payload':>12} {'json':>10} {'parse':>10}")
+    for label, variant in VARIANTS.items():
+        document = graphql.parse(build_introspection_query(**variant))
+        result = graphql.execute(client_schema, document)
+        assert not result.errors, result.errors
+        payload = json.dumps({"data": result.data})
+        decode = best_time(lambda: json.loads(payload))
+        raw_schema = json.loads(payload)["data"]["__schema"]
+        parse = best_time(lambda: Schema(raw_schema, None))
+        print(
+            f"{label:<20} "
+            f"{len(payload.encode()) / 1024:9.0f} KiB "
+            f"{decode * 1000:7.2f} ms "
+            f"{parse * 1000:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
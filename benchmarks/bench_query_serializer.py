@@ -0,0 +1,115 @@
+"""Benchmark the query serializer against the GQLQueryBuilder
+
+Both serialize the same automatically looked up selection
+of an operation of the github schema.
+The text of a prepared selection is memoized by both of them,
+hence every call serializes a freshly prepared selection.
+The preparation itself is not timed.
+
+Usage:
+    python benchmarks/bench_query_serializer.py
+"""
+import json
+import pathlib
+import time
+
+from qlient.core import Settings
+from qlient.core.builder import GQLQueryBuilder, QuerySerializer, RequestBuilder
+from qlient.core.schema.schema import Schema
+
+schema_files_dir = pathlib.Path(__file__).parent.parent / "tests" / "schema_files"
+path_to_github_schema = schema_files_dir / "github_schema.json"
+
+OPERATIONS = {
+    "repository": {"owner": "String!", "name": "String!"},
+    "viewer": {},
+}
+
+REPEAT = 20
+
+
+def best_time(serialize, prepare) -> float:
+    """Return the best time of serializing a freshly prepared selection"""
+    times = []
+    for _ in range(REPEAT):
+        selection = prepare()
+        start = time.perf_counter()
+        serialize(selection)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def build_with_query_builder(operation_name, variable_types, selection) -> str:
+    """Build the query the way the request builder used to"""
+    query_builder = GQLQueryBuilder()
+    query_builder.operation(
+        "query",
+        operation_name,
+        {f"${key}": value for key, value in variable_types.items()},
+    )
+    query_builder.action(operation_name, {key: f"${key}" for key in variable_types})
+    query_builder.fields(selection.__gql__())
+    return query_builder.build()
+
+
+def main():
+    with path_to_github_schema.open() as schema_file:
+        raw_schema = json.load(schema_file)["data"]["__schema"]
+    schema = Schema(raw_schema, None)
+    compact = QuerySerializer()
+    pretty = QuerySerializer(pretty=True)
+
+    print(
+        f"{'operation':<24} {'size':>10} {'builder':>10} "
+        f"{'compact':>10} {'pretty':>10} {'speedup':>8}"
+    )
+    for depth in (1, 2, 3):
+        settings = Settings(lookup_recursion_depth=depth)
+        for operation_name, variable_types in OPERATIONS.items():
+            field = schema.query_type.field_name_to_field[operation_name]
+            builder = RequestBuilder("query", field, schema, settings)
+
+            def prepare():
+                # drop the prepared selections, so nothing is memoized
+                schema.auto_selections.clear()
+                schema.prepared_selections.clear()
+                return builder._auto_build_fields()
+
+            expected = build_with_query_builder(
+                operation_name, variable_types, prepare()
+            )
+            actual = compact.serialize(
+                "query", operation_name, variable_types, prepare()
+            )
+            assert actual == expected
+
+            old = best_time(
+                lambda selection: build_with_query_builder(
+                    operation_name, variable_types, selection
+                ),
+                prepare,
+            )
+            new = best_time(
+                lambda selection: compact.serialize(
+                    "query", operation_name, variable_types, selection
+                ),
+                prepare,
+            )
+            new_pretty = best_time(
+                lambda selection: pretty.serialize(
+                    "query", operation_name, variable_types, selection
+                ),
+                prepare,
+            )
+            print(
+                f"{f'{operation_name} (depth={depth})':<24} "
+                f"{len(actual) / 1024:6.0f} KiB "
+                f"{old * 1000:7.2f} ms "
+                f"{new * 1000:7.2f} ms "
+                f"{new_pretty * 1000:7.2f} ms "
+                f"{old / new:7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark the request build throughput of the operation proxies
+
+Each build creates a new request for an operation of the github schema
+with a deep, automatically looked up selection.
+Prepared operations are compiled once and only bind the variables per build.
+
+Usage:
+    python benchmarks/bench_request_build.py
+"""
+import json
+import pathlib
+import timeit
+
+from qlient.core import Settings, Backend, GraphQLRequest, GraphQLResponse, Fields
+from qlient.core.proxies import QueryServiceProxy
+from qlient.core.schema.schema import Schema
+
+schema_files_dir = pathlib.Path(__file__).parent.parent / "tests" / "schema_files"
+path_to_github_schema = schema_files_dir / "github_schema.json"
+
+REPEAT = 5
+NUMBER = 20
+
+
+class NoopBackend(Backend):
+    """Backend that never sends anything"""
+
+    def execute_query(self, request: GraphQLRequest) -> GraphQLResponse:
+        return GraphQLResponse(request, {})
+
+
+def bench(label: str, stmt) -> float:
+    """Run the statement and print the builds per second"""
+    best = min(timeit.repeat(stmt, repeat=REPEAT, number=NUMBER)) / NUMBER
+    print(f"{label:<40} {1 / best:10.1f} builds/s")
+    return best
+
+
+def scalar_field_names(schema: Schema, type_name: str):
+    """Return the names of all scalar fields of the given type"""
+    return [field.name for field in schema[type_name].fields if field.is_scalar_kind]
+
+
+def main():
+    with path_to_github_schema.open() as schema_file:
+        raw_schema = json.load(schema_file)["data"]["__schema"]
+    schema = Schema(raw_schema, None)
+
+    selection = Fields(
+        *scalar_field_names(schema, "Repository"),
+        owner=scalar_field_names(schema, "RepositoryOwner"),
+        defaultBranchRef=["name", "prefix"],
+    )
+    for cache_size in (0, 256):
+        cache = "cached" if cache_size else "uncached"
+        settings = Settings(request_cache_size=cache_size)
+        proxy = QueryServiceProxy(NoopBackend(), settings, schema, [])
+        bench(
+            f"repository (explicit, wide, {cache})",
+            lambda: proxy.repository.create_request(selection, owner="o", name="n"),
+        )
+
+        for depth in (1, 2):
+            settings = Settings(
+                lookup_recursion_depth=depth, request_cache_size=cache_size
+            )
+            proxy = QueryServiceProxy(NoopBackend(), settings, schema, [])
+            bench(
+                f"repository (auto, depth={depth}, {cache})",
+                lambda: proxy.repository.create_request(
+                    owner="qlient-org", name="core"
+                ),
+            )
+            bench(
+                f"viewer (auto, depth={depth}, {cache})",
+                lambda: proxy.viewer.create_request(),
+            )
+
+    for depth in (1, 2):
+        settings = Settings(lookup_recursion_depth=depth)
+        proxy = QueryServiceProxy(NoopBackend(), settings, schema, [])
+        repository = proxy.repository.prepare(_variables=["owner", "name"])
+        bench(
+            f"repository (auto, depth={depth}, prepared)",
+            lambda: repository.create_request(owner="qlient-org", name="core"),
+        )
+        viewer = proxy.viewer.prepare()
+        bench(
+            f"viewer (auto, depth={depth}, prepared)",
+            lambda: viewer.create_request(),
+        )
+
+
+if __name__ == "__main__":
+    main()
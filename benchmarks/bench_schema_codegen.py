@@ -0,0 +1,74 @@
+"""Benchmark schema loads from json files against generated schema modules
+
+Each module load re-imports the generated module from its cached bytecode,
+just like a freshly started process would.
+
+Usage:
+    python benchmarks/bench_schema_codegen.py
+"""
+import importlib
+import importlib.util
+import pathlib
+import py_compile
+import sys
+import tempfile
+import timeit
+
+from qlient.core.schema.codegen import write_schema_module
+from qlient.core.schema.providers import FileSchemaProvider, ModuleSchemaProvider
+
+schema_files_dir = pathlib.Path(__file__).parent.parent / "tests" / "schema_files"
+SCHEMA_FILES = {
+    "swapi": schema_files_dir / "swapi_schema.json",
+    "github": schema_files_dir / "github_schema.json",
+}
+
+REPEAT = 5
+NUMBER = 3
+
+
+def bench(label: str, stmt) -> float:
+    """Run the statement and print the best time per call"""
+    best = min(timeit.repeat(stmt, repeat=REPEAT, number=NUMBER)) / NUMBER
+    print(f"{label:<24} {best * 1000:10.2f} ms")
+    return best
+
+
+def load_module_schema(module_name: str, lazy: bool = False):
+    """Import the generated module again and load the schema from it"""
+    sys.modules.pop(module_name, None)
+    module = importlib.import_module(module_name)
+    return ModuleSchemaProvider(module, lazy=lazy).load_schema()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as module_dir:
+        sys.path.insert(0, module_dir)
+        for name, schema_file in SCHEMA_FILES.items():
+            module_name = f"bench_{name}_schema"
+            module_file = pathlib.Path(module_dir) / f"{module_name}.py"
+            schema = FileSchemaProvider(schema_file).load_schema()
+            write_schema_module(schema, module_file)
+            # write the bytecode cache, even if PYTHONDONTWRITEBYTECODE is set
+            py_compile.compile(
+                str(module_file),
+                cfile=importlib.util.cache_from_source(str(module_file)),
+            )
+            importlib.invalidate_caches()
+
+            print(f"--- {name}")
+            file_load = bench(
+                "file (json + parse)",
+                lambda: FileSchemaProvider(schema_file).load_schema(),
+            )
+            module_load = bench("module", lambda: load_module_schema(module_name))
+            lazy_module_load = bench(
+                "module (lazy)",
+                lambda: load_module_schema(module_name, lazy=True),
+            )
+            print(f"{'speedup':<24} {file_load / module_load:10.2f} x")
+            print(f"{'speedup (lazy)':<24} {file_load / lazy_module_load:10.2f} x")
+
+
+if __name__ == "__main__":
+    main()
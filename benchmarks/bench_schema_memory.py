@@ -0,0 +1,85 @@
+"""Benchmark the memory that is held by a parsed schema
+
+The raw schema is decoded before tracing starts,
+hence the reported bytes are the ones held by the parsed schema models only.
+
+The peak memory while loading a schema file is reported
+for the default and the streaming mode of the FileSchemaProvider.
+
+Usage:
+    python benchmarks/bench_schema_memory.py
+"""
+import gc
+import json
+import pathlib
+import tracemalloc
+
+from qlient.core.schema.providers import FileSchemaProvider
+from qlient.core.schema.schema import Schema
+
+schema_files_dir = pathlib.Path(__file__).parent.parent / "tests" / "schema_files"
+schemas = {
+    "swapi": schema_files_dir / "swapi_schema.json",
+    "github": schema_files_dir / "github_schema.json",
+}
+
+
+def load_raw_schema(path: pathlib.Path):
+    """Load the raw schema from the given path"""
+    with path.open() as schema_file:
+        raw_schema = json.load(schema_file)
+    if "data" in raw_schema:
+        raw_schema = raw_schema["data"]["__schema"]
+    return raw_schema
+
+
+def resolve_all(schema: Schema):
+    """Resolve every type reference, just like a long-running client would"""
+    for _type in schema.types_registry.values():
+        for field in _type.fields:
+            _ = field.type.leaf_type
+            for arg in field.args:
+                _ = arg.type.leaf_type
+        for input_field in _type.input_fields:
+            _ = input_field.type.leaf_type
+
+
+def measure(raw_schema) -> int:
+    """Return the bytes held by the parsed schema"""
+    gc.collect()
+    tracemalloc.start()
+    schema = Schema(raw_schema, None)
+    resolve_all(schema)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del schema
+    return current
+
+
+def measure_load_peak(path: pathlib.Path, **options) -> int:
+    """Return the peak memory while loading the schema file"""
+    gc.collect()
+    tracemalloc.start()
+    schema = FileSchemaProvider(path, **options).load_schema()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del schema
+    return peak
+
+
+def main():
+    for name, path in schemas.items():
+        raw_schema = load_raw_schema(path)
+        held = measure(raw_schema)
+        print(f"{name:<8} {held / 1024:12.1f} KiB per parsed schema")
+
+    for name, path in schemas.items():
+        default_peak = measure_load_peak(path)
+        streaming_peak = measure_load_peak(path, streaming=True, keep_raw_schema=False)
+        print(f"{name:<8} {default_peak / 1024:12.1f} KiB peak while loading")
+        print(f"{name:<8} {streaming_peak / 1024:12.1f} KiB peak while streaming")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark cold and warm schema loads of the FileSchemaProvider
+
+A cold load decodes the json file and parses the schema.
+A warm load reads the pre-parsed schema snapshot instead.
+
+Usage:
+    python benchmarks/bench_schema_snapshot.py
+"""
+import pathlib
+import tempfile
+import timeit
+
+from qlient.core.schema.providers import FileSchemaProvider
+
+schema_files_dir = pathlib.Path(__file__).parent.parent / "tests" / "schema_files"
+path_to_github_schema = schema_files_dir / "github_schema.json"
+
+REPEAT = 5
+NUMBER = 3
+
+
+def bench(label: str, stmt) -> float:
+    """Run the statement and print the best time per call"""
+    best = min(timeit.repeat(stmt, repeat=REPEAT, number=NUMBER)) / NUMBER
+    print(f"{label:<24} {best * 1000:10.2f} ms")
+    return best
+
+
+def main():
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        cold = bench(
+            "cold (json + parse)",
+            lambda: FileSchemaProvider(path_to_github_schema).load_schema(),
+        )
+        # the first call writes the snapshot
+        FileSchemaProvider(
+            path_to_github_schema, snapshot_dir=snapshot_dir
+        ).load_schema()
+        warm = bench(
+            "warm (snapshot)",
+            lambda: FileSchemaProvider(
+                path_to_github_schema, snapshot_dir=snapshot_dir
+            ).load_schema(),
+        )
+    print(f"{'speedup':<24} {cold / warm:10.2f} x")
+
+
+if __name__ == "__main__":
+    main()
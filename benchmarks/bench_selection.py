@@ -0,0 +1,69 @@
+"""Benchmark composing and hashing selections with thousands of fields
+
+Selections are composed field by field with `+` (including their first hash),
+built at once from the field names
+and nested as a wide tree with sub selections.
+Each selection is hashed twice, just like the query cache does per call.
+
+Usage:
+    python benchmarks/bench_selection.py
+"""
+import timeit
+
+from qlient.core import Field, Fields
+
+SIZES = (1000, 2000, 4000)
+
+REPEAT = 3
+NUMBER = 1
+
+
+def bench(label: str, stmt) -> float:
+    """Run the statement and print the best time per call"""
+    best = min(timeit.repeat(stmt, repeat=REPEAT, number=NUMBER)) / NUMBER
+    print(f"{label:<32} {best * 1e6:12.1f} us")
+    return best
+
+
+def compose(size: int) -> Fields:
+    """Compose the selection one field at a time and hash it"""
+    selection = Fields()
+    for index in range(size):
+        selection = selection + Field(f"field{index}")
+    hash(selection)
+    return selection
+
+
+def nested(size: int) -> Fields:
+    """Build a tree of selections with ten sub fields each"""
+    return Fields(
+        *(
+            Field(
+                f"field{index}",
+                _sub_fields=Fields(*(f"leaf{leaf}" for leaf in range(10))),
+            )
+            for index in range(size // 10)
+        )
+    )
+
+
+def hash_twice(selection: Fields):
+    """Hash the selection twice"""
+    hash(selection)
+    hash(selection)
+
+
+def main():
+    for size in SIZES:
+        names = [f"field{index}" for index in range(size)]
+        print(f"--- {size} fields")
+        bench("compose with +", lambda: compose(size))
+        bench("build at once", lambda: Fields(*names))
+        bench("build nested", lambda: nested(size))
+        tree = nested(size)
+        bench("hash nested (twice)", lambda: hash_twice(tree))
+        bench("wrap nested", lambda: Fields(tree, Field("extra")))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
+import asyncio
+import collections
+import concurrent.futures
+import functools
 import inspect
+import os
+import threading
+from typing import Any, Callable, Hashable, Optional, Union
+
+Executor = Union[str, concurrent.futures.Executor, None]
 
 
 async def await_if_coro(x):
@@ -6,3 +15,145 @@ async def await_if_coro(x):
     if inspect.iscoroutine(x):
         return await x
     return x
+
+
+# the process pool shared by all "process" executor calls and the id of its process
+_process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_process_pool_pid: Optional[int] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Return the process pool shared by all "process" executor calls
+
+    The pool is created on first use and keeps a single worker process alive,
+    hence only the first call pays for starting the process.
+    A broken pool or a pool inherited from a parent process is replaced.
+
+    Returns:
+        the shared process pool
+    """
+    global _process_pool, _process_pool_pid  # skipcq: PYL-W0603
+    with _process_pool_lock:
+        if (
+            _process_pool is None
+            or _process_pool_pid != os.getpid()
+            or getattr(_process_pool, "_broken", False)
+        ):
+            _process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+            _process_pool_pid = os.getpid()
+        return _process_pool
+
+
+async def run_in_executor(
+    executor: Executor, function: Callable, *args, **kwargs
+) -> Any:
+    """Run the function in the executor without blocking the event loop
+
+    Args:
+        executor: holds either "thread" (the default executor of the event loop),
+            "process" (the process pool of :ref:`get_process_pool`),
+            an executor instance or None (call the function right away)
+        function: holds the function to run.
+            It must be picklable when running it in a process.
+        *args: holds the positional arguments of the function
+        **kwargs: holds the keyword arguments of the function
+
+    Returns:
+        the result of the function
+
+    Raises:
+        ValueError when the executor is unknown
+    """
+    if executor is None:
+        return function(*args, **kwargs)
+    if kwargs:
+        function = functools.partial(function, **kwargs)
+    loop = asyncio.get_running_loop()
+    if executor == "thread":
+        return await loop.run_in_executor(None, function, *args)
+    if executor == "process":
+        return await loop.run_in_executor(get_process_pool(), function, *args)
+    if isinstance(executor, concurrent.futures.Executor):
+        return await loop.run_in_executor(executor, function, *args)
+    raise ValueError(f"Unknown executor `{executor}`")
+
+
+class LRUCache:
+    """Class that represents a thread safe, least recently used cache
+
+    Args:
+        maxsize: holds the maximum number of cached values.
+            A size of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._values: "collections.OrderedDict[Hashable, Any]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value
+
+        Args:
+            key: holds the key of the value
+
+        Returns:
+            Either None (if the value is not cached) or the value
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._values.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Cache the value
+
+        Args:
+            key: holds the key of the value
+            value: holds the value to cache
+
+        Returns:
+            the cached value
+        """
+        if self.maxsize <= 0:
+            return value
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop all cached values and reset the counters"""
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the cache"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the cache"""
+        class_name = self.__class__.__name__
+        return (
+            f"<{class_name}("
+            f"hits={self.hits}, "
+            f"misses={self.misses}, "
+            f"size={len(self)}, "
+            f"maxsize={self.maxsize})>"
+        )
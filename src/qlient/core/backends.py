@@ -1,5 +1,6 @@
 """This file contains all backends"""
 import abc
+from typing import Optional
 
 from qlient.core.models import (
     GraphQLRequest,
@@ -11,6 +12,26 @@ from qlient.core.models import (
 class Backend(abc.ABC):
     """Abstract base class for all graphql backends."""
 
+    @property
+    def cache_key(self) -> Optional[str]:
+        """Property to return the key that identifies the graphql server of this backend
+
+        The key is used to cache the introspected schema on disk.
+        By default, it consists of the backend class and the endpoint.
+        Backends without an endpoint have no cache key,
+        as their class alone does not tell the servers apart.
+        Overwrite this property when the default does not identify the server,
+        e.g. when the schema depends on the credentials.
+
+        Returns:
+            Either None (if the server can not be identified) or the cache key
+        """
+        endpoint = getattr(self, "endpoint", None)
+        if endpoint is None:
+            return None
+        cls = self.__class__
+        return f"{cls.__module__}.{cls.__qualname__}:{endpoint}"
+
     @abc.abstractmethod
     def execute_query(self, request: GraphQLRequest) -> GraphQLResponse:
         """Abstract method to execute a query on this backend.
@@ -1,8 +1,16 @@
 """This file contains the query builder and fields"""
-from typing import Optional, List, Dict, Any, Union, Iterable
+from typing import Optional, List, Dict, Any, Union, Iterable, Hashable, Tuple
 
+from qlient.core._internal import LRUCache
 from qlient.core._types import JSON, GraphQLContextType, GraphQLRootType
-from qlient.core.models import Fields, GraphQLRequest, auto, Field, PreparedFields
+from qlient.core.models import (
+    Fields,
+    GraphQLRequest,
+    auto,
+    Field,
+    PreparedFields,
+    query_hash,
+)
 from qlient.core.schema.models import (
     Input as SchemaInput,
     Type as SchemaType,
@@ -148,6 +156,271 @@ class GQLQueryBuilder:
         return self.remove_duplicate_spaces(final_query)
 
 
+class QuerySerializer:
+    """Class to serialize query documents in a single pass
+
+    The operation, the variable definitions and the selection set
+    are written into a single buffer in one traversal.
+    The compact output is exactly the one of the :ref:`GQLQueryBuilder`.
+    The compact text of a prepared selection is written by the same traversal
+    the first time it is serialized and memoized on the selection afterwards.
+
+    Args:
+        pretty: if True, each field is written onto its own, indented line
+        indent: holds the indentation of a single level (pretty output only)
+    """
+
+    def __init__(self, pretty: bool = False, indent: str = "  "):
+        self.pretty: bool = pretty
+        self.indent: str = indent
+
+    # skipcq: PY-D0003
+    def _separator(self, depth: int) -> str:
+        if self.pretty:
+            return "\n" + self.indent * depth
+        return " "
+
+    def serialize(
+        self,
+        operation_type: str,
+        operation_name: str,
+        variable_types: Optional[Dict[str, str]] = None,
+        selection: Optional[PreparedFields] = None,
+    ) -> str:
+        """Method to serialize the query document of a single operation
+
+        Args:
+            operation_type: holds the operation type (query, mutation, subscription)
+            operation_name: holds the name of the operation (and its action)
+            variable_types: optional, holds the variable names
+                mapped to their graphql type representation (e.g. {"id": "ID!"})
+            selection: optional, holds the prepared selection of the operation
+
+        Returns:
+            the query document
+        """
+        arguments = {name: name for name in variable_types or ()}
+        return self.serialize_batch(
+            operation_type,
+            operation_name,
+            variable_types,
+            [(None, operation_name, arguments, selection)],
+        )
+
+    def serialize_batch(
+        self,
+        operation_type: str,
+        operation_name: str,
+        variable_types: Optional[Dict[str, str]],
+        root_fields: Iterable[
+            Tuple[Optional[str], str, Dict[str, str], Optional[PreparedFields]]
+        ],
+    ) -> str:
+        """Method to serialize the query document of one or more root fields
+
+        Args:
+            operation_type: holds the operation type (query, mutation, subscription)
+            operation_name: holds the name of the operation
+            variable_types: optional, holds the variable names
+                mapped to their graphql type representation (e.g. {"id": "ID!"})
+            root_fields: holds the alias, the name, the arguments
+                (mapped to the variable names) and the prepared selection
+                of each root field
+
+        Returns:
+            the query document
+        """
+        buffer: List[str] = [operation_type, " ", operation_name]
+        write = buffer.append
+        if variable_types:
+            write("(")
+            write(
+                ", ".join(
+                    f"${name}: {type_representation}"
+                    for name, type_representation in variable_types.items()
+                )
+            )
+            write(")")
+        write(" {")
+        separator = self._separator(1)
+        for alias, name, arguments, selection in root_fields:
+            write(separator)
+            if alias:
+                write(alias)
+                write(": ")
+            write(name)
+            if arguments:
+                write("(")
+                write(
+                    ", ".join(
+                        f"{argument}: ${variable}"
+                        for argument, variable in arguments.items()
+                    )
+                )
+                write(")")
+            if selection is not None and selection.fields:
+                if self.pretty:
+                    write(" {")
+                    self._write_selection(buffer, selection, 2)
+                    write(separator)
+                    write("}")
+                else:
+                    write(" { ")
+                    write(self._compact_selection(selection))
+                    write(" }")
+        write(self._separator(0))
+        write("}")
+        return "".join(buffer)
+
+    # skipcq: PY-D0003
+    def _compact_selection(self, selection: PreparedFields) -> str:
+        # the memo is the one of `PreparedFields.__gql__`, which has the same text
+        text = selection._gql
+        if text is None:
+            buffer: List[str] = []
+            self._write_selection(buffer, selection, 2)
+            # drop the separator in front of the first field
+            text = selection._gql = "".join(buffer)[1:]
+        return text
+
+    # skipcq: PY-D0003
+    def _write_selection(
+        self, buffer: List[str], selection: PreparedFields, depth: int
+    ):
+        write = buffer.append
+        separator = self._separator(depth)
+        for field in selection.fields:
+            write(separator)
+            if field.alias:
+                write(field.alias)
+                write(": ")
+            write(field.name)
+            if field.directive is not None:
+                write(" ")
+                write(field.directive.__gql__())
+            if field.sub_fields is not None:
+                write(" {")
+                self._write_selection(buffer, field.sub_fields, depth + 1)
+                write(self._separator(depth))
+                write("}")
+
+
+class QueryDocument:
+    """Represents a built query document
+
+    The sha256 hash of the document, as used by persisted queries,
+    is computed once, the first time it is needed.
+
+    Args:
+        query: holds the query document
+    """
+
+    __slots__ = ("query", "_query_hash")
+
+    def __init__(self, query: str):
+        self.query: str = query
+        self._query_hash: Optional[str] = None
+
+    @property
+    def query_hash(self) -> str:
+        """Property to return the sha256 hash of the query document"""
+        if self._query_hash is None:
+            self._query_hash = query_hash(self.query)
+        return self._query_hash
+
+
+class QueryCache(LRUCache):
+    """Class that represents a least recently used cache of built query documents
+
+    Building a query prepares the selected fields against the schema
+    and renders the whole document, every single time.
+    Yet an operation is usually called with the same selection
+    and the same variable names over and over again.
+    The cache maps these to the already built query document.
+
+    Note that the query document of a set of variable names is built only once,
+    hence the order of the variables is the one of the first call.
+    The settings that change the built document are part of every key,
+    hence changing them on the fly never returns an outdated document.
+
+    Args:
+        maxsize: holds the maximum number of cached query documents.
+            A size of 0 disables the cache.
+    """
+
+    @staticmethod
+    def selection_key(fields: _AnyField) -> Tuple[Hashable, _AnyField]:
+        """Create the cache key of the selected fields
+
+        Iterables are turned into a Fields instance first,
+        so they can be hashed and are only consumed once.
+
+        Args:
+            fields: holds the selected fields
+
+        Returns:
+            the key of the selection and the selection to build the query with
+        """
+        if fields is auto:
+            return ("auto",), fields
+        if fields is None:
+            return ("none",), fields
+        if isinstance(fields, (list, tuple)) and all(
+            isinstance(field, str) for field in fields
+        ):
+            return ("names", tuple(fields)), fields
+        if isinstance(fields, Field):
+            fields = Fields(fields)
+        elif not isinstance(fields, Fields) and isinstance(fields, Iterable):
+            fields = Fields(*fields)
+        # the kind is part of the key, hence fields are never compared to others
+        return ("fields", fields), fields
+
+    @staticmethod
+    def settings_key(settings: Settings) -> Tuple[bool, int, bool]:
+        """Create the cache key of the settings that change the built document
+
+        Args:
+            settings: holds the settings the document is built with
+
+        Returns:
+            the key of the settings
+        """
+        return (
+            settings.allow_auto_lookup,
+            settings.lookup_recursion_depth,
+            settings.pretty_queries,
+        )
+
+    def get(self, key: Hashable) -> Optional[QueryDocument]:
+        """Return the cached query document
+
+        Args:
+            key: holds the key of the query document
+
+        Returns:
+            Either None (if the query is not cached) or the query document
+        """
+        return super(QueryCache, self).get(key)
+
+    def put(self, key: Hashable, query: str) -> QueryDocument:
+        """Cache the query document
+
+        Args:
+            key: holds the key of the query document
+            query: holds the built query document
+
+        Returns:
+            the (cached) query document
+        """
+        return super(QueryCache, self).put(key, QueryDocument(query))
+
+
+# the serializers used by the request builder
+SERIALIZER = QuerySerializer()
+PRETTY_SERIALIZER = QuerySerializer(pretty=True)
+
+
 class RequestBuilder:
     """Class that represents a typed GraphQL Query Builder
 
@@ -213,17 +486,37 @@ class RequestBuilder:
         Returns:
             the graphql query string
         """
-        query_builder: GQLQueryBuilder = GQLQueryBuilder()
-        query_builder.operation(self.operation_type, self.operation_name)
-        query_builder.action(self.operation_name)
+        _inputs = self._inputs.copy()
+        _fields = self.prepare_fields()
+        _variable_types = self.variable_types(_inputs)
+
+        query = self.serializer.serialize(
+            self.operation_type,
+            self.operation_name,
+            _variable_types,
+            _fields,
+        )
 
-        _operation_variables: Dict[str, JSON] = {}
-        _action_variables: Dict[str, JSON] = {}
+        return GraphQLRequest(
+            query=query,
+            variables=_inputs,
+            operation_name=self.operation_name,
+            context=self._context,
+            root=self._root,
+        )
 
-        # build fields
-        _fields = self._fields
-        _inputs = self._inputs.copy()
+    @property
+    def serializer(self) -> QuerySerializer:
+        """Property to return the serializer of the query documents"""
+        return PRETTY_SERIALIZER if self.settings.pretty_queries else SERIALIZER
+
+    def prepare_fields(self) -> Optional[PreparedFields]:
+        """Method to prepare the field selection against the operation output type
 
+        Returns:
+            Either None (if nothing is selected) or the prepared selection
+        """
+        _fields = self._fields
         if _fields is auto and self.settings.allow_auto_lookup:
             # automatically build a Fields structure
             _fields = self._auto_build_fields()
@@ -236,55 +529,187 @@ class RequestBuilder:
                 self.operation_output,
                 self.schema,
             )
+        return _fields if isinstance(_fields, PreparedFields) else None
 
-        #
-        if _fields and isinstance(_fields, PreparedFields):
-            query_builder.fields(_fields.__gql__())
+    def variable_types(self, inputs: Dict[str, JSON]) -> Dict[str, str]:
+        """Method to look up the graphql types of the operation inputs
 
-        # add the variables from the input
-        for key in _inputs:
+        Args:
+            inputs: holds the request inputs
+
+        Returns:
+            the input names mapped to their graphql type representation
+
+        Raises:
+            KeyError when the operation does not support one of the inputs
+        """
+        _variable_types: Dict[str, str] = {}
+        for key in inputs:
             if key not in self.operation_inputs:
                 raise KeyError(f"Input {key} not supported for {self.operation_name}")
 
             _input = self.operation_inputs[key]
-            _operation_variables[f"${key}"] = _input.type.graphql_representation
-            _action_variables[key] = f"${key}"
-
-        if _operation_variables is not None:
-            query_builder.operation(
-                self.operation_type, self.operation_name, _operation_variables
-            )
-        if _action_variables is not None:
-            query_builder.action(self.operation_name, _action_variables)
-
-        query = query_builder.build()
-
-        return GraphQLRequest(
-            query=query,
-            variables=_inputs,
-            operation_name=self.operation_name,
-            context=self._context,
-            root=self._root,
-        )
+            _variable_types[key] = _input.type.graphql_representation
+        return _variable_types
 
     # skipcq: PY-D0003
-    def _auto_build_fields(self) -> Fields:
-        return self._lookup_fields_for_type(self.operation_output, 0)
+    def _auto_build_fields(self) -> PreparedFields:
+        # the selection only depends on the type and the depth,
+        # hence it is looked up and prepared once per schema
+        key = (self.operation_output.name, self.settings.lookup_recursion_depth)
+        prepared = self.schema.auto_selections.get(key)
+        if prepared is None:
+            fields = self._lookup_fields_for_type(self.operation_output, 0)
+            prepared = self.schema.auto_selections.setdefault(
+                key, fields.prepare(self.operation_output, self.schema)
+            )
+        return prepared
 
     # skipcq: PY-D0003
     def _lookup_fields_for_type(self, _type: SchemaType, depth: int) -> Fields:
-        _fields = Fields()
+        recurse = depth < self.settings.lookup_recursion_depth
+        if recurse:
+            # load the types of the next level at once (partial schemas only)
+            self.schema.prefetch_types(
+                field.type.leaf_type_ref.name
+                for field in _type.fields
+                if field.is_object_kind
+            )
+        selection: List[Union[str, Field]] = []
         for field in _type.fields:
             if field.is_object_kind:
-                if depth >= self.settings.lookup_recursion_depth:
+                if not recurse:
                     continue
 
-                _fields += {
-                    field.name: self._lookup_fields_for_type(
-                        _type=field.output_type,
-                        depth=depth + 1,
-                    )
-                }
+                sub_fields = self._lookup_fields_for_type(
+                    _type=field.output_type,
+                    depth=depth + 1,
+                )
+                selection.append(Field(field.name, _sub_fields=sub_fields))
             elif field.is_scalar_kind:
-                _fields += field.name
-        return _fields
+                selection.append(field.name)
+        return Fields(*selection)
+
+
+class BatchRequestBuilder:
+    """Class that merges several operations of the same type into a single request
+
+    Each operation is selected under the alias `_<index>`
+    and its variables are renamed to `_<index>_<name>`,
+    hence several calls of the same operation do not clash.
+
+    Args:
+        operation_type: holds the operation type (query or mutation)
+        schema: holds the schema to build the operations against
+        settings: holds the settings
+        operation_name: holds the name of the merged operation
+    """
+
+    # the default name of the merged operation
+    OPERATION_NAME = "batch"
+
+    def __init__(
+        self,
+        operation_type: str,
+        schema: Schema,
+        settings: Settings,
+        operation_name: str = OPERATION_NAME,
+    ):
+        self.operation_type: str = operation_type
+        self.schema: Schema = schema
+        self.settings: Settings = settings
+        self.operation_name: str = operation_name
+
+        self._operations: List[Tuple[SchemaField, _AnyField, Dict[str, JSON]]] = []
+        self._context: Any = None
+        self._root: Any = None
+
+    @staticmethod
+    def alias(index: int) -> str:
+        """Return the alias of the operation at the given index"""
+        return f"_{index}"
+
+    @staticmethod
+    def variable_name(index: int, name: str) -> str:
+        """Return the variable name of an input of the operation at the given index"""
+        return f"_{index}_{name}"
+
+    @classmethod
+    def merge_variables(cls, inputs: Iterable[Dict[str, JSON]]) -> Dict[str, JSON]:
+        """Merge the inputs of the operations into the variables of the batch
+
+        Args:
+            inputs: holds the inputs of each operation
+
+        Returns:
+            the renamed variables of all operations
+        """
+        return {
+            cls.variable_name(index, name): value
+            for index, operation_inputs in enumerate(inputs)
+            for name, value in operation_inputs.items()
+        }
+
+    def context(self, context: GraphQLContextType) -> "BatchRequestBuilder":
+        """Method to set the request context"""
+        self._context = context
+        return self
+
+    def root(self, root: GraphQLRootType) -> "BatchRequestBuilder":
+        """Method to set the request root"""
+        self._root = root
+        return self
+
+    def operation(
+        self,
+        operation_field: SchemaField,
+        fields: _AnyField = auto,
+        **inputs: JSON,
+    ) -> "BatchRequestBuilder":
+        """Method to add an operation to the batch
+
+        Args:
+            operation_field: holds the operation field
+            fields: holds the selected fields
+            **inputs: holds the operation inputs
+        """
+        self._operations.append((operation_field, fields, inputs))
+        return self
+
+    def build(self) -> GraphQLRequest:
+        """Method to build the merged graphql request
+
+        Returns:
+            the graphql request of all operations
+        """
+        variable_types: Dict[str, str] = {}
+        root_fields = []
+        for index, (operation_field, fields, inputs) in enumerate(self._operations):
+            builder = RequestBuilder(
+                self.operation_type, operation_field, self.schema, self.settings
+            ).fields(fields)
+            arguments: Dict[str, str] = {}
+            for name, type_representation in builder.variable_types(inputs).items():
+                variable_name = self.variable_name(index, name)
+                variable_types[variable_name] = type_representation
+                arguments[name] = variable_name
+            root_fields.append(
+                (
+                    self.alias(index),
+                    operation_field.name,
+                    arguments,
+                    builder.prepare_fields(),
+                )
+            )
+
+        serializer = PRETTY_SERIALIZER if self.settings.pretty_queries else SERIALIZER
+        query = serializer.serialize_batch(
+            self.operation_type, self.operation_name, variable_types, root_fields
+        )
+        return GraphQLRequest(
+            query=query,
+            variables=self.merge_variables(inputs for _, _, inputs in self._operations),
+            operation_name=self.operation_name,
+            context=self._context,
+            root=self._root,
+        )
@@ -1,5 +1,8 @@
+import asyncio
+import logging
 from typing import Optional, List
 
+from qlient.core import __meta__
 from qlient.core.backends import Backend
 from qlient.core.exceptions import OutOfAsyncContext
 from qlient.core.plugins import Plugin
@@ -14,6 +17,8 @@ from qlient.core.proxies import (
 from qlient.core.schema.schema import Schema
 from qlient.core.settings import Settings
 
+logger = logging.getLogger(__meta__.__title__)
+
 
 class Client:
     """The qlient Client.
@@ -56,10 +61,56 @@ class Client:
         if self._schema is None:
             from qlient.core.schema.providers import BackendSchemaProvider
 
-            provider = BackendSchemaProvider(self.backend)
-            self._schema = provider.load_schema()
+            provider = self._create_schema_provider(BackendSchemaProvider)
+            if self.settings.share_schema:
+                from qlient.core.registry import schema_registry
+
+                self._schema = schema_registry.get_or_load(
+                    self._shared_schema_key(provider),
+                    provider.load_schema,
+                    share_by_fingerprint=not provider.partial,
+                )
+            else:
+                self._schema = provider.load_schema()
         return self._schema
 
+    # skipcq: PY-D0003
+    def _shared_schema_key(self, provider):
+        from qlient.core.registry import BackendKey
+
+        # the backend instance identifies the server, its class and endpoint do not
+        return BackendKey(self.backend, provider.query_variant)
+
+    # skipcq: PY-D0003
+    def _create_schema_provider(self, provider_class, **kwargs):
+        cache = None
+        if self.settings.introspection_cache_dir is not None:
+            from qlient.core.schema.cache import IntrospectionCache
+
+            cache = IntrospectionCache(
+                self.settings.introspection_cache_dir,
+                ttl=self.settings.introspection_cache_ttl,
+            )
+        return provider_class(
+            self.backend,
+            cache=cache,
+            descriptions=self.settings.introspect_descriptions,
+            include_deprecated=self.settings.introspect_deprecated,
+            type_ref_depth=self.settings.introspection_type_ref_depth,
+            partial=self.settings.partial_introspection,
+            **kwargs,
+        )
+
+    # skipcq: PY-D0003
+    def _create_service_proxy(self, proxy_class):
+        if self.settings.share_schema:
+            from qlient.core.registry import schema_registry
+
+            return schema_registry.get_service_proxy(
+                proxy_class, self.backend, self.settings, self.schema, self.plugins
+            )
+        return proxy_class(self.backend, self.settings, self.schema, self.plugins)
+
     @property
     def query(self) -> QueryServiceProxy:
         """Property to lazy load the query service proxy
@@ -68,10 +119,7 @@ class Client:
             The default query service proxy instance
         """
         if self._query_service is None:
-            schema = self.schema
-            self._query_service = QueryServiceProxy(
-                self.backend, self.settings, schema, self.plugins
-            )
+            self._query_service = self._create_service_proxy(QueryServiceProxy)
         return self._query_service
 
     @property
@@ -82,10 +130,7 @@ class Client:
             The default mutation service proxy instance
         """
         if self._mutation_service is None:
-            schema = self.schema
-            self._mutation_service = MutationServiceProxy(
-                self.backend, self.settings, schema, self.plugins
-            )
+            self._mutation_service = self._create_service_proxy(MutationServiceProxy)
         return self._mutation_service
 
     @property
@@ -96,9 +141,8 @@ class Client:
             The default subscription service proxy instance
         """
         if self._subscription_service is None:
-            schema = self.schema
-            self._subscription_service = SubscriptionServiceProxy(
-                self.backend, self.settings, schema, self.plugins
+            self._subscription_service = self._create_service_proxy(
+                SubscriptionServiceProxy
             )
         return self._subscription_service
 
@@ -120,7 +164,26 @@ class Client:
 
 
 class AsyncClient(Client):
-    """The async qlient Client."""
+    """The async qlient Client.
+
+    When the settings have a `schema_refresh_interval`,
+    the client checks in the background whether the schema has changed
+    and swaps in the new schema as long as the client is in use.
+    Partially introspected schemas are not refreshed in the background,
+    since the check would only cover their root types.
+    See :ref:`refresh_schema` for more information.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        schema: Optional[Schema] = None,
+        plugins: Optional[List[Plugin]] = None,
+        settings: Optional[Settings] = None,
+    ):
+        super(AsyncClient, self).__init__(backend, schema, plugins, settings)
+        self._schema_provider = None
+        self._refresh_task: Optional[asyncio.Future] = None
 
     @property
     def schema(self) -> Schema:
@@ -143,10 +206,7 @@ class AsyncClient(Client):
             The default query service proxy instance
         """
         if self._query_service is None:
-            schema = self.schema
-            self._query_service = AsyncQueryServiceProxy(
-                self.backend, self.settings, schema, self.plugins
-            )
+            self._query_service = self._create_service_proxy(AsyncQueryServiceProxy)
         return self._query_service
 
     @property
@@ -157,9 +217,8 @@ class AsyncClient(Client):
             The default mutation service proxy instance
         """
         if self._mutation_service is None:
-            schema = self.schema
-            self._mutation_service = AsyncMutationServiceProxy(
-                self.backend, self.settings, schema, self.plugins
+            self._mutation_service = self._create_service_proxy(
+                AsyncMutationServiceProxy
             )
         return self._mutation_service
 
@@ -171,9 +230,8 @@ class AsyncClient(Client):
             The default subscription service proxy instance
         """
         if self._subscription_service is None:
-            schema = self.schema
-            self._subscription_service = AsyncSubscriptionServiceProxy(
-                self.backend, self.settings, schema, self.plugins
+            self._subscription_service = self._create_service_proxy(
+                AsyncSubscriptionServiceProxy
             )
         return self._subscription_service
 
@@ -182,9 +240,101 @@ class AsyncClient(Client):
             # load the schema
             from qlient.core.schema.providers import AsyncBackendSchemaProvider
 
-            provider = AsyncBackendSchemaProvider(self.backend)
-            self._schema = await provider.load_schema()
+            provider = self._create_schema_provider(
+                AsyncBackendSchemaProvider,
+                parse_executor=self.settings.schema_parse_executor,
+            )
+            self._schema_provider = provider
+            if self.settings.share_schema:
+                from qlient.core.registry import schema_registry
+
+                self._schema = await schema_registry.get_or_load_async(
+                    self._shared_schema_key(provider),
+                    provider.load_schema,
+                    share_by_fingerprint=not provider.partial,
+                )
+            else:
+                self._schema = await provider.load_schema()
+
+        interval = self.settings.schema_refresh_interval
+        if (
+            interval is not None
+            and self._schema_provider is not None
+            and not self._schema_provider.partial
+            and self._refresh_task is None
+        ):
+            self._refresh_task = asyncio.ensure_future(
+                self._refresh_schema_periodically(interval)
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        pass
+        refresh_task, self._refresh_task = self._refresh_task, None
+        if refresh_task is not None:
+            refresh_task.cancel()
+            try:
+                await refresh_task
+            except asyncio.CancelledError:
+                pass
+
+    async def refresh_schema(self) -> bool:
+        """Check if the schema has changed and swap in the new schema
+
+        Only a cheap revalidation request is sent as long as the schema is unchanged.
+        A changed schema is introspected and parsed off the event loop.
+        Then the schema and the service proxies are swapped at once.
+        Requests that are already in flight keep using the old schema.
+
+        Returns:
+            True if the schema has changed
+        """
+        if self._schema_provider is None:
+            # the schema was handed over, hence there is nothing to refresh
+            return False
+        schema = await self._schema_provider.refresh_schema(self.schema)
+        if schema is None:
+            return False
+        if self.settings.share_schema:
+            from qlient.core.registry import schema_registry
+
+            provider = self._schema_provider
+            schema = schema_registry.register(
+                self._shared_schema_key(provider),
+                schema,
+                share_by_fingerprint=not provider.partial,
+            )
+        self._swap_schema(schema)
+        return True
+
+    # skipcq: PY-D0003
+    def _swap_schema(self, schema: Schema):
+        # only the proxies in use are rebuilt, all before swapping anything.
+        # There must be no await in here, so no request sees a half swapped client.
+        old_schema, self._schema = self._schema, schema
+        try:
+            services = {
+                name: self._create_service_proxy(proxy_class)
+                for name, proxy_class in (
+                    ("_query_service", AsyncQueryServiceProxy),
+                    ("_mutation_service", AsyncMutationServiceProxy),
+                    ("_subscription_service", AsyncSubscriptionServiceProxy),
+                )
+                if getattr(self, name) is not None
+            }
+        except Exception:
+            self._schema = old_schema
+            raise
+        for name, service in services.items():
+            setattr(self, name, service)
+
+    # skipcq: PY-D0003
+    async def _refresh_schema_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await self.refresh_schema():
+                    logger.info(f"Refreshed the schema of `{self.backend}`")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # skipcq: PYL-W0703
+                logger.warning(f"Unable to refresh the schema of `{self.backend}`: {e}")
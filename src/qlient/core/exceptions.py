@@ -1,5 +1,5 @@
 """This file contains all qlient specific exceptions"""
-from typing import Dict
+from typing import Dict, List
 
 
 class QlientException(Exception):
@@ -25,5 +25,21 @@ class NoTypesFound(SchemaParseException):
     """Indicates that the schema does not have any types defined"""
 
 
+class TypeNotLoaded(QlientException):
+    """Indicates that a type of a partially introspected schema is not loaded yet
+
+    This exception gets thrown when the type would have to be introspected
+    but the registry is unable to do so synchronously (e.g. in an async client).
+    Load the types with `await registry.load_async(type_names)` and try again.
+    """
+
+    def __init__(self, registry, type_names: List[str], *args):
+        self.registry = registry
+        self.type_names: List[str] = type_names
+        super(TypeNotLoaded, self).__init__(
+            *(args or (f"The types {type_names} are not loaded yet",))
+        )
+
+
 class OutOfAsyncContext(QlientException):
     """Indicates that you are running out of an async context"""
@@ -1,4 +1,5 @@
 """This module contains the qlient models"""
+import hashlib
 from typing import Optional, List, Dict, Any, Tuple
 
 from qlient.core._types import (
@@ -23,6 +24,8 @@ from qlient.core.schema.schema import Schema
 class Directive:
     """Class to create a directive on a Field."""
 
+    __slots__ = ("name",)
+
     def __init__(self, _name: str):
         self.name: str = _name
 
@@ -59,6 +62,8 @@ class PreparedDirective:
     There should be no more changes made on this directive.
     """
 
+    __slots__ = ("schema_directive", "name")
+
     def __init__(self):
         # the graphql schema directive type
         self.schema_directive: Optional[SchemaDirective] = None
@@ -136,8 +141,17 @@ class Field:
 
     Use this class for more customization.
     If you only make a simple selection, I highly recommend only using the Fields class.
+
+    Selections share a field instead of copying it and cache its hash.
+    Changing a field invalidates the cached hashes of all fields and selections,
+    hence changes are picked up by the selections that already contain it.
     """
 
+    __slots__ = ("_name", "_alias", "_directive", "_sub_fields", "_hash")
+
+    # holds the number of changes made to fields after their creation
+    changes: int = 0
+
     def __init__(
         self,
         _name: str,
@@ -145,12 +159,61 @@ class Field:
         _directive: Optional[Directive] = None,
         _sub_fields: Optional[Any] = None,
     ):
-        self.name: str = _name
-        self.alias: Optional[str] = _alias
-        self.directive: Optional[Directive] = _directive
-        self.sub_fields: Optional["Fields"] = (
-            Fields(_sub_fields) if _sub_fields is not None else None
-        )
+        if _sub_fields is not None and not isinstance(_sub_fields, Fields):
+            _sub_fields = Fields(_sub_fields)
+        self._name: str = _name
+        self._alias: Optional[str] = _alias
+        self._directive: Optional[Directive] = _directive
+        self._sub_fields: Optional["Fields"] = _sub_fields
+        # holds the number of changes and the hash computed at that point
+        self._hash: Optional[Tuple[int, int]] = None
+
+    # skipcq: PY-D0003
+    def _changed(self):
+        self._hash = None
+        Field.changes += 1
+
+    @property
+    def name(self) -> str:
+        """Property to return the name of the field"""
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        self._changed()
+
+    @property
+    def alias(self) -> Optional[str]:
+        """Property to return the alias of the field"""
+        return self._alias
+
+    @alias.setter
+    def alias(self, alias: Optional[str]):
+        self._alias = alias
+        self._changed()
+
+    @property
+    def directive(self) -> Optional[Directive]:
+        """Property to return the directive of the field"""
+        return self._directive
+
+    @directive.setter
+    def directive(self, directive: Optional[Directive]):
+        self._directive = directive
+        self._changed()
+
+    @property
+    def sub_fields(self) -> Optional["Fields"]:
+        """Property to return the sub selection of the field"""
+        return self._sub_fields
+
+    @sub_fields.setter
+    def sub_fields(self, sub_fields: Optional[Any]):
+        if sub_fields is not None and not isinstance(sub_fields, Fields):
+            sub_fields = Fields(sub_fields)
+        self._sub_fields = sub_fields
+        self._changed()
 
     def __and__(self, other) -> "Fields":
         return self.__add__(other)
@@ -192,7 +255,12 @@ class Field:
         return p
 
     def __hash__(self) -> int:
-        return hash((self.alias, self.name, self.directive, self.sub_fields))
+        changes = Field.changes
+        cached = self._hash
+        if cached is None or cached[0] != changes:
+            value = hash((self._alias, self._name, self._directive, self._sub_fields))
+            cached = self._hash = (changes, value)
+        return cached[1]
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -208,6 +276,16 @@ class PreparedField:
     This means that there should be no more changes made to this field.
     """
 
+    __slots__ = (
+        "parent_type",
+        "field_type",
+        "name",
+        "alias",
+        "directive",
+        "sub_fields",
+        "_hash",
+    )
+
     def __init__(self):
         # the field parent type
         self.parent_type: Optional[SchemaType] = None
@@ -221,6 +299,8 @@ class PreparedField:
         self.directive: Optional[PreparedDirective] = None
         # a sub selection of fields of this type
         self.sub_fields: Optional[PreparedFields] = None
+        # the hash, computed once the field is prepared and hashed
+        self._hash: Optional[int] = None
 
     def prepare(
         self,
@@ -255,6 +335,7 @@ class PreparedField:
         """
         if not name:
             raise ValueError("Directive name must have a value.")
+        self._hash = None
         self.name = name
         self.alias = alias
 
@@ -284,6 +365,7 @@ class PreparedField:
         """
         if directive is None:
             return
+        self._hash = None
         self.directive = directive.prepare(schema)
 
     def prepare_sub_fields(
@@ -300,6 +382,7 @@ class PreparedField:
         if sub_fields is None:
             return
         new_parent_type = self.field_type.type.leaf_type
+        self._hash = None
         self.sub_fields = sub_fields.prepare(new_parent_type, schema)
 
     def __gql__(self) -> str:
@@ -312,11 +395,14 @@ class PreparedField:
         if self.directive is not None:
             builder += f" {self.directive.__gql__()}"
         if self.sub_fields is not None:
-            builder += f" {{ {self.sub_fields.__gql__()} }}"
+            sub_fields = self.sub_fields.__gql__()
+            builder += f" {{ {sub_fields} }}" if sub_fields else " { }"
         return builder
 
     def __hash__(self) -> int:
-        return hash((self.alias, self.name, self.directive, self.sub_fields))
+        if self._hash is None:
+            self._hash = hash((self.alias, self.name, self.directive, self.sub_fields))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -331,8 +417,16 @@ class Fields:
 
     Use this class to create a selection of multiple fields
     or combine multiple instances.
+
+    The hash of a selection is cached until a field is changed
+    and combining selections shares the fields instead of copying them.
+    Combining only chains the added fields onto this selection,
+    the chain is flattened once, the first time the fields are needed.
+    Hence composing a selection one field at a time stays linear.
     """
 
+    __slots__ = ("_flat", "_base", "_extra", "_hash")
+
     @classmethod
     def parse_args(
         cls,
@@ -349,7 +443,7 @@ class Fields:
         Returns:
             a dictionary mapped with the hash of the field to the Field itself.
         """
-        fields = fields or {}
+        fields = fields if fields is not None else {}
         for arg in args:
             if isinstance(arg, str):
                 arg = arg.strip()
@@ -364,8 +458,7 @@ class Fields:
             if isinstance(arg, dict):
                 arg = cls(**arg)
             if isinstance(arg, cls):
-                for field in arg.selected_fields:
-                    fields[hash(field)] = field
+                fields.update(arg._fields)
                 continue
             raise TypeError(f"Can't handle type `{type(arg).__name__}`")
 
@@ -387,9 +480,11 @@ class Fields:
         Returns:
             a dictionary mapped with the hash of the field to the Field itself.
         """
-        fields = fields or {}
+        fields = fields if fields is not None else {}
         for key, value in kwargs.items():
-            field = Field(key, _sub_fields=cls(value))
+            field = Field(
+                key, _sub_fields=value if isinstance(value, cls) else cls(value)
+            )
             fields[hash(field)] = field
         return fields
 
@@ -399,11 +494,63 @@ class Fields:
         _fields = self.parse_args(args, _fields)
         _fields = self.parse_kwargs(kwargs, _fields)
 
-        self.selected_fields: List[Field] = list(_fields.values())
+        self._flat: Optional[Dict[int, Field]] = _fields
+        self._base: Optional[Fields] = None
+        self._extra: Optional[Dict[int, Field]] = None
+        self._hash: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def _chain(cls, base: "Fields", extra: Dict[int, Field]) -> "Fields":
+        # skip the parsing, the added fields are already keyed by their hash
+        instance = cls.__new__(cls)
+        instance._flat = None
+        instance._base = base
+        instance._extra = extra
+        instance._hash = None
+        return instance
+
+    @property
+    def _fields(self) -> Dict[int, Field]:
+        """Property to return the fields keyed by their hash"""
+        flat = self._flat
+        if flat is None:
+            flat = self._flatten()
+        return flat
+
+    # skipcq: PY-D0003
+    def _flatten(self) -> Dict[int, Field]:
+        # walk up to the closest flattened selection and replay the additions
+        extras = []
+        node = self
+        while True:
+            flat = node._flat
+            if flat is not None:
+                break
+            base, extra = node._base, node._extra
+            if base is None or extra is None:
+                # another thread has flattened the node meanwhile
+                continue
+            extras.append(extra)
+            node = base
+        fields = dict(flat)
+        for extra in reversed(extras):
+            fields.update(extra)
+        # publish the fields before dropping the chain, see above
+        self._flat = fields
+        self._base = None
+        self._extra = None
+        return fields
+
+    @property
+    def selected_fields(self) -> List[Field]:
+        """Property to list the selected fields"""
+        return list(self._fields.values())
 
     def __contains__(self, item) -> bool:
         if isinstance(item, str):
             item = Field(item)
+        if isinstance(item, Field):
+            return hash(item) in self._fields
         return item in self.selected_fields
 
     def __and__(self, other) -> "Fields":
@@ -428,16 +575,19 @@ class Fields:
         """
         cls = self.__class__
         if other is None:
-            return cls(*self.selected_fields)
-        if isinstance(other, (str, Field)):
+            return self
+        if isinstance(other, Field):
+            return cls._chain(self, {hash(other): other})
+        if isinstance(other, str):
             other = cls(other)
         if isinstance(other, (list, tuple, set)):
             other = cls(*other)
         if isinstance(other, dict):
             other = cls(**other)
         if isinstance(other, cls):
-            args = [*self.selected_fields, *other.selected_fields]
-            return cls(*args)
+            if not other._fields:
+                return self
+            return cls._chain(self, other._fields)
         raise TypeError(f"Can not add {other} to {self}")
 
     def __eq__(self, other):
@@ -448,10 +598,18 @@ class Fields:
         return hash(self) == hash(other)
 
     def __bool__(self) -> bool:
-        return bool(self.selected_fields)
+        return bool(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
 
     def __hash__(self) -> int:
-        return hash(tuple(self.selected_fields))
+        # the hash is recomputed once any field has changed, see `Field`
+        changes = Field.changes
+        cached = self._hash
+        if cached is None or cached[0] != changes:
+            cached = self._hash = (changes, hash(tuple(self._fields.values())))
+        return cached[1]
 
     def prepare(
         self,
@@ -465,15 +623,20 @@ class Fields:
             schema: holds the schema that should be used for validation
 
         Returns:
-            a PreparedFields instance
+            a PreparedFields instance,
+            which is shared with all identical selections on the same parent type
         """
+        key = (self, parent_type.name)
+        p = schema.prepared_selections.get(key)
+        if p is not None:
+            return p
         p = PreparedFields()
         p.prepare(
             parent_type=parent_type,
             schema=schema,
             fields=self.selected_fields,
         )
-        return p
+        return schema.prepared_selections.put(key, p)
 
 
 class PreparedFields:
@@ -482,9 +645,15 @@ class PreparedFields:
     A prepared class should not be changed after preparation.
     """
 
+    __slots__ = ("fields", "_hash", "_gql")
+
     def __init__(self):
         # the prepared fields
         self.fields: Optional[List[PreparedField]] = None
+        # the hash, computed once the fields are prepared and hashed
+        self._hash: Optional[int] = None
+        # the graphql representation, built once the fields are prepared
+        self._gql: Optional[str] = None
 
     def prepare(
         self,
@@ -515,6 +684,8 @@ class PreparedFields:
             fields: holds a list of fields that should be prepared
         """
         fields: List[Field] = fields if fields is not None else []
+        self._hash = None
+        self._gql = None
         self.fields = [
             field.prepare(
                 parent_type,
@@ -529,10 +700,14 @@ class PreparedFields:
         Returns:
             a string with the graphql representation of this fields instance
         """
-        return " ".join(field.__gql__() for field in self.fields)
+        if self._gql is None:
+            self._gql = " ".join(field.__gql__() for field in self.fields)
+        return self._gql
 
     def __hash__(self) -> int:
-        return hash(tuple(self.fields))
+        if self._hash is None:
+            self._hash = hash(tuple(self.fields))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -543,7 +718,28 @@ class PreparedFields:
 
 
 class GraphQLRequest:
-    """Represents the graphql request"""
+    """Represents the graphql request
+
+    Args:
+        query: holds the query document
+        variables: holds the variables of the request
+        operation_name: holds the name of the operation to execute
+        context: holds the request context
+        root: holds the request root
+        extensions: optional, holds the protocol extensions of the request
+            (e.g. `persistedQuery`), backends send them along with the query
+        query_hash: optional, holds the already known sha256 hash of the query
+    """
+
+    __slots__ = (
+        "query",
+        "variables",
+        "operation_name",
+        "context",
+        "root",
+        "extensions",
+        "_query_hash",
+    )
 
     def __init__(
         self,
@@ -552,6 +748,8 @@ class GraphQLRequest:
         operation_name: GraphQLOperationNameType = None,
         context: GraphQLContextType = None,
         root: GraphQLRootType = None,
+        extensions: Optional[Dict[str, Any]] = None,
+        query_hash: Optional[str] = None,
     ):
         if variables is None:
             variables = {}
@@ -560,11 +758,40 @@ class GraphQLRequest:
         self.operation_name: GraphQLOperationNameType = operation_name
         self.context: GraphQLContextType = context
         self.root: GraphQLRootType = root
+        self.extensions: Optional[Dict[str, Any]] = extensions
+        self._query_hash: Optional[str] = query_hash
+
+    @property
+    def query_hash(self) -> Optional[str]:
+        """Property to return the sha256 hash of the query
+
+        The hash is only computed once.
+
+        Returns:
+            Either None (if there is no query) or the hex digest of the query
+        """
+        if self._query_hash is None and self.query is not None:
+            self._query_hash = query_hash(self.query)
+        return self._query_hash
+
+
+def query_hash(query: str) -> str:
+    """Create the sha256 hash of the query document, as used by persisted queries
+
+    Args:
+        query: holds the query document
+
+    Returns:
+        the hex digest of the query
+    """
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
 
 
 class GraphQLSubscriptionRequest(GraphQLRequest):
     """Represents a graphql subscription request"""
 
+    __slots__ = ("subscription_id", "options")
+
     subscription_id: str
     options: Dict[str, Any]
 
@@ -581,6 +808,8 @@ class GraphQLSubscriptionRequest(GraphQLRequest):
 class GraphQLResponse:
     """Represents the graphql response type"""
 
+    __slots__ = ("request", "raw", "data", "errors", "extensions")
+
     def __init__(
         self,
         request: GraphQLRequest,
@@ -0,0 +1,103 @@
+"""This file contains the helpers for automatic persisted queries
+
+With automatic persisted queries, the client sends the sha256 hash of the query
+instead of the query itself.
+If the server does not know the hash yet, it answers with a
+`PersistedQueryNotFound` error and the client sends the query along with its hash,
+which the server then stores for the following requests.
+
+Backends send the `extensions` of a request along with the query
+and omit the query if it is None.
+"""
+from typing import Any, Dict, Optional
+
+from qlient.core.models import GraphQLRequest, GraphQLResponse
+
+PERSISTED_QUERY_VERSION = 1
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+PERSISTED_QUERY_NOT_SUPPORTED = "PersistedQueryNotSupported"
+
+# error codes some servers send in the error extensions instead of the message
+_ERROR_CODES = {
+    "PERSISTED_QUERY_NOT_FOUND": PERSISTED_QUERY_NOT_FOUND,
+    "PERSISTED_QUERY_NOT_SUPPORTED": PERSISTED_QUERY_NOT_SUPPORTED,
+}
+
+
+def persisted_query_extensions(request: GraphQLRequest) -> Dict[str, Any]:
+    """Create the extensions of the request with the `persistedQuery` extension
+
+    Args:
+        request: holds the request with the query to persist
+
+    Returns:
+        the request extensions including the hash of the query
+    """
+    extensions = dict(request.extensions or {})
+    extensions["persistedQuery"] = {
+        "version": PERSISTED_QUERY_VERSION,
+        "sha256Hash": request.query_hash,
+    }
+    return extensions
+
+
+def _copy_request(
+    request: GraphQLRequest, query: Optional[str], extensions: Dict[str, Any]
+) -> GraphQLRequest:
+    return GraphQLRequest(
+        query=query,
+        variables=request.variables,
+        operation_name=request.operation_name,
+        context=request.context,
+        root=request.root,
+        extensions=extensions,
+        query_hash=request.query_hash,
+    )
+
+
+def hash_only_request(request: GraphQLRequest) -> GraphQLRequest:
+    """Create a copy of the request that only sends the hash of the query
+
+    Args:
+        request: holds the request to copy
+
+    Returns:
+        the request without the query
+    """
+    return _copy_request(request, None, persisted_query_extensions(request))
+
+
+def register_query_request(request: GraphQLRequest) -> GraphQLRequest:
+    """Create a copy of the request that sends the query along with its hash
+
+    The server stores the query under its hash for the following requests.
+
+    Args:
+        request: holds the request to copy
+
+    Returns:
+        the request with the query and its hash
+    """
+    return _copy_request(request, request.query, persisted_query_extensions(request))
+
+
+def persisted_query_error(response: GraphQLResponse) -> Optional[str]:
+    """Return the persisted query error of the response
+
+    Args:
+        response: holds the response to check
+
+    Returns:
+        Either None (if the response has no persisted query error),
+        `PersistedQueryNotFound` or `PersistedQueryNotSupported`
+    """
+    for error in response.errors or ():
+        if not isinstance(error, dict):
+            continue
+        message = error.get("message")
+        if message in (PERSISTED_QUERY_NOT_FOUND, PERSISTED_QUERY_NOT_SUPPORTED):
+            return message
+        code = (error.get("extensions") or {}).get("code")
+        if code in _ERROR_CODES:
+            return _ERROR_CODES[code]
+    return None
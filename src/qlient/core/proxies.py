@@ -1,27 +1,182 @@
 """This module contains the operation proxy instances"""
 import abc
 import itertools
-from typing import Dict, Iterable, List, Any, Union
+import functools
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Mapping, Optional
+from typing import Tuple, Union
 
 from qlient.core._internal import await_if_coro
 from qlient.core._types import GraphQLContextType, GraphQLRootType
 from qlient.core.backends import Backend
-from qlient.core.builder import RequestBuilder, Fields
+from qlient.core.builder import (
+    BatchRequestBuilder,
+    QueryCache,
+    QueryDocument,
+    RequestBuilder,
+    Fields,
+)
+from qlient.core.exceptions import QlientException, TypeNotLoaded
 from qlient.core.models import (
     GraphQLResponse,
     GraphQLRequest,
     GraphQLSubscriptionRequest,
+    PreparedFields,
     auto,
 )
+from qlient.core.persisted_queries import (
+    PERSISTED_QUERY_NOT_SUPPORTED,
+    hash_only_request,
+    persisted_query_error,
+    register_query_request,
+)
 from qlient.core.plugins import Plugin, apply_pre, apply_post
-from qlient.core.schema.models import Field as SchemaField
+from qlient.core.schema.models import Field as SchemaField, Type as SchemaType
 from qlient.core.schema.schema import Schema
 from qlient.core.settings import Settings
 
 
+class PreparedOperation:
+    """Represents an operation that is compiled once and called many times
+
+    The query document, the variable types and the selection are built
+    when the operation is prepared, hence a call only binds the variables,
+    creates the request and sends it through the service proxy.
+
+    Args:
+        operation: holds the operation proxy that prepared the operation
+        document: holds the compiled query document
+        variable_types: holds the declared variable names
+            mapped to their graphql type representation
+        selection: holds the prepared selection of the operation
+        context: holds the default request context
+        root: holds the default request root
+    """
+
+    def __init__(
+        self,
+        operation: "OperationProxy",
+        document: QueryDocument,
+        variable_types: Dict[str, str],
+        selection: Optional[PreparedFields],
+        context: GraphQLContextType = None,
+        root: GraphQLRootType = None,
+    ):
+        self.operation: "OperationProxy" = operation
+        self.document: QueryDocument = document
+        self.variable_types: Dict[str, str] = variable_types
+        self.selection: Optional[PreparedFields] = selection
+        self.context: GraphQLContextType = context
+        self.root: GraphQLRootType = root
+        self._query_hash: Optional[str] = (
+            document.query_hash if operation.proxy.settings.persisted_queries else None
+        )
+
+    @property
+    def query(self) -> str:
+        """Property to return the compiled query document"""
+        return self.document.query
+
+    def __str__(self) -> str:
+        """Return a simple string representation of this instance"""
+        class_name = self.__class__.__name__
+        return f"{class_name}(`{self.operation.field.name}`)"
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of this instance"""
+        class_name = self.__class__.__name__
+        return (
+            f"{class_name}("
+            f"field={self.operation.field}, "
+            f"variables={list(self.variable_types)})"
+        )
+
+    def create_request(
+        self,
+        _context: GraphQLContextType = None,
+        _root: GraphQLRootType = None,
+        **inputs,
+    ) -> GraphQLRequest:
+        """Method to bind the inputs to the compiled query document
+
+        Variables that were declared but are not given are omitted,
+        hence their default value applies.
+
+        Args:
+            _context: holds the request context, defaults to the prepared one
+            _root: holds the request root, defaults to the prepared one
+            **inputs: holds the request inputs
+
+        Returns:
+            The GraphQLRequest instance
+
+        Raises:
+            KeyError when an input was not declared when preparing the operation
+        """
+        for key in inputs:
+            if key not in self.variable_types:
+                raise KeyError(
+                    f"Input {key} not prepared for {self.operation.field.name}"
+                )
+        return GraphQLRequest(
+            query=self.document.query,
+            variables=inputs,
+            operation_name=self.operation.field.name,
+            context=self.context if _context is None else _context,
+            root=self.root if _root is None else _root,
+            query_hash=self._query_hash,
+        )
+
+    def __call__(self, *args, **kwargs) -> GraphQLResponse:
+        """Send the request with the given inputs
+
+        For async service proxies, the response has to be awaited.
+        """
+        request = self.create_request(*args, **kwargs)
+        return self.operation.proxy.send(request)
+
+
+class PreparedSubscription(PreparedOperation):
+    """Represents a subscription that is compiled once and called many times"""
+
+    def create_request(
+        self,
+        _context: GraphQLContextType = None,
+        _root: GraphQLRootType = None,
+        _subscription_id: str = None,
+        _options: Dict[str, Any] = None,
+        **inputs,
+    ) -> GraphQLSubscriptionRequest:
+        """Method to bind the inputs to the compiled query document
+
+        Args:
+            _context: holds the request context, defaults to the prepared one
+            _root: holds the request root, defaults to the prepared one
+            _subscription_id: holds the identifier of the subscription
+            _options: holds the subscription options
+            **inputs: holds the request inputs
+
+        Returns:
+            The GraphQLSubscriptionRequest instance
+        """
+        request = super(PreparedSubscription, self).create_request(
+            _context, _root, **inputs
+        )
+        return GraphQLSubscriptionRequest(
+            query=request.query,
+            variables=request.variables,
+            operation_name=request.operation_name,
+            context=request.context,
+            root=request.root,
+            subscription_id=_subscription_id,
+            options=_options,
+        )
+
+
 class OperationProxy:
     """The operation proxy"""
 
+    _prepared_operation_type = PreparedOperation
+
     operation_type: str
     field: SchemaField
     proxy: "ServiceProxy"
@@ -67,18 +222,83 @@ class OperationProxy:
         Returns:
             The GraphQLRequest instance
         """
-        return (
-            RequestBuilder(
-                self.operation_type,
-                self.field,
-                self.proxy.schema,
-                self.proxy.settings,
-            )
-            .context(_context)
-            .root(_root)
-            .fields(_fields)
-            .variables(**inputs)
-        ).build()
+        query_cache = self.proxy.query_cache
+        selection_key, _fields = query_cache.selection_key(_fields)
+        key = (
+            self.operation_type,
+            self.field.name,
+            selection_key,
+            frozenset(inputs),
+            query_cache.settings_key(self.proxy.settings),
+        )
+        document = query_cache.get(key)
+        if document is None:
+            request = (
+                RequestBuilder(
+                    self.operation_type,
+                    self.field,
+                    self.proxy.schema,
+                    self.proxy.settings,
+                )
+                .context(_context)
+                .root(_root)
+                .fields(_fields)
+                .variables(**inputs)
+            ).build()
+            document = query_cache.put(key, request.query)
+
+        return GraphQLRequest(
+            query=document.query,
+            variables=inputs,
+            operation_name=self.field.name,
+            context=_context,
+            root=_root,
+            # the hash of a cached document is only computed once
+            query_hash=(
+                document.query_hash if self.proxy.settings.persisted_queries else None
+            ),
+        )
+
+    def prepare(
+        self,
+        _fields: Union[Fields, Iterable[str], List[str], None] = auto,
+        _variables: Iterable[str] = (),
+        _context: GraphQLContextType = None,
+        _root: GraphQLRootType = None,
+    ) -> PreparedOperation:
+        """Method to compile the operation once for many calls
+
+        Args:
+            _fields: holds the selected fields
+            _variables: holds the names of the inputs the calls will pass
+            _context: holds the default request context
+            _root: holds the default request root
+
+        Returns:
+            the prepared operation
+
+        Raises:
+            KeyError when the operation does not support one of the variables
+        """
+        builder = RequestBuilder(
+            self.operation_type,
+            self.field,
+            self.proxy.schema,
+            self.proxy.settings,
+        ).fields(_fields)
+        selection = builder.prepare_fields()
+        variable_types = builder.variable_types(dict.fromkeys(_variables))
+        query = builder.serializer.serialize(
+            self.operation_type, self.field.name, variable_types, selection
+        )
+        return self._prepared_operation_type(
+            self,
+            QueryDocument(query),
+            variable_types,
+            selection,
+            _context,
+            _root,
+        )
 
     def __call__(
         self,
@@ -92,13 +312,45 @@ class OperationProxy:
 class AsyncOperationProxy(OperationProxy):
     """The async operation proxy"""
 
+    async def create_request_async(self, *args, **kwargs) -> GraphQLRequest:
+        """Method to create the request instance
+
+        Types of partially introspected schemas that are not loaded yet
+        are introspected asynchronously before creating the request again.
+        See :ref:`create_request` for the arguments.
+
+        Returns:
+            The GraphQLRequest instance
+        """
+        while True:
+            try:
+                return self.create_request(*args, **kwargs)
+            except TypeNotLoaded as e:
+                await e.registry.load_async(e.type_names)
+
+    async def prepare_async(self, *args, **kwargs) -> PreparedOperation:
+        """Method to compile the operation once for many calls
+
+        Types of partially introspected schemas that are not loaded yet
+        are introspected asynchronously before preparing the operation again.
+        See :ref:`prepare` for the arguments.
+
+        Returns:
+            the prepared operation, whose calls have to be awaited
+        """
+        while True:
+            try:
+                return self.prepare(*args, **kwargs)
+            except TypeNotLoaded as e:
+                await e.registry.load_async(e.type_names)
+
     # skipcq: PYL-W0236
     async def __call__(
         self,
         *args,
         **kwargs,
     ) -> GraphQLResponse:
-        request = self.create_request(*args, **kwargs)
+        request = await self.create_request_async(*args, **kwargs)
         return await await_if_coro(self.proxy.send(request))
 
 
@@ -137,6 +389,8 @@ class AsyncMutationProxy(MutationProxy, AsyncOperationProxy):
 class SubscriptionProxy(OperationProxy):
     """Represents the operation proxy for subscriptions"""
 
+    _prepared_operation_type = PreparedSubscription
+
     def __init__(self, proxy: "SubscriptionServiceProxy", operation_field: SchemaField):
         super(SubscriptionProxy, self).__init__("subscription", operation_field, proxy)
 
@@ -187,12 +441,246 @@ class AsyncSubscriptionProxy(SubscriptionProxy, AsyncOperationProxy):
         super(SubscriptionProxy, self).__init__("subscription", operation_field, proxy)
 
 
+class LazyOperations(Mapping[str, OperationProxy]):
+    """Represents a mapping of operation names to operation proxies created on demand.
+
+    An operation proxy is only created the first time it is accessed.
+    All operation names are known upfront,
+    so iterating over the names or checking membership is cheap.
+
+    Args:
+        fields: holds the operation names mapped to the root fields
+        create_proxy: holds the function that creates the proxy of a root field
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, SchemaField],
+        create_proxy: Callable[[SchemaField], OperationProxy],
+    ):
+        self._fields: Mapping[str, SchemaField] = fields
+        self._create_proxy: Callable[[SchemaField], OperationProxy] = create_proxy
+        self._proxies: Dict[str, OperationProxy] = {}
+
+    def __getitem__(self, key: str) -> OperationProxy:
+        try:
+            return self._proxies[key]
+        except KeyError:
+            pass
+        proxy = self._create_proxy(self._fields[key])
+        # if another thread was faster, keep the proxy that got registered first
+        return self._proxies.setdefault(key, proxy)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    @property
+    def materialized(self) -> List[str]:
+        """Property to list the names of all operations that have a proxy so far"""
+        return list(self._proxies.keys())
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the mapping"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the mapping"""
+        class_name = self.__class__.__name__
+        return (
+            f"<{class_name}(operations={len(self)}, "
+            f"materialized={len(self._proxies)})>"
+        )
+
+
+class RequestBatch:
+    """Represents several operation calls that are sent as a single request
+
+    The operations are merged into one query document
+    and the result is split back into one response per call.
+    Errors with a path are mapped to the call they belong to,
+    all other errors are added to the responses of all calls.
+    The `request` of each split response is the merged request
+    that was actually sent, not a request of the single call.
+
+    Calls are added by calling the operations on the batch,
+    e.g. `batch.film(id="1")`, and `batch.send()` returns their responses.
+    Operations whose name clashes with an attribute of the batch
+    (e.g. `send` or `add`) are added with `batch.add(proxy["send"], ...)`.
+
+    Args:
+        proxy: holds the service proxy the operations belong to
+        context: holds the request context
+        root: holds the request root
+        operation_name: holds the name of the merged operation
+    """
+
+    def __init__(
+        self,
+        proxy: "ServiceProxy",
+        context: GraphQLContextType = None,
+        root: GraphQLRootType = None,
+        operation_name: str = BatchRequestBuilder.OPERATION_NAME,
+    ):
+        self.proxy: "ServiceProxy" = proxy
+        self.context: GraphQLContextType = context
+        self.root: GraphQLRootType = root
+        self.operation_name: str = operation_name
+        self.calls: List[Tuple[OperationProxy, Any, Dict[str, Any]]] = []
+
+    def __getattr__(self, key: str) -> Callable[..., int]:
+        """Return a function that adds a call of the given operation to the batch
+
+        Raises:
+            AttributeError when the no operation with that key exists.
+        """
+        if key.startswith("__"):
+            raise AttributeError(key)
+        return functools.partial(self.add, self.proxy[key])
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+    def __str__(self) -> str:
+        """Return a simple string representation of this instance"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of this instance"""
+        class_name = self.__class__.__name__
+        operations = [operation.field.name for operation, _, _ in self.calls]
+        return f"{class_name}(operations={operations})"
+
+    def add(
+        self,
+        operation: OperationProxy,
+        _fields: Union[Fields, Iterable[str], List[str], None] = auto,
+        **inputs,
+    ) -> int:
+        """Method to add a call of the operation to the batch
+
+        Args:
+            operation: holds the operation proxy to call
+            _fields: holds the selected fields
+            **inputs: holds the request inputs
+
+        Returns:
+            the index of the response of this call
+        """
+        self.calls.append((operation, _fields, inputs))
+        return len(self.calls) - 1
+
+    def create_request(self) -> GraphQLRequest:
+        """Method to create the merged request of all calls
+
+        Returns:
+            The GraphQLRequest instance
+        """
+        query_cache = self.proxy.query_cache
+        keys = []
+        calls = []
+        for operation, _fields, inputs in self.calls:
+            selection_key, _fields = query_cache.selection_key(_fields)
+            keys.append((operation.field.name, selection_key, frozenset(inputs)))
+            calls.append((operation, _fields, inputs))
+        # iterables were turned into Fields, hence they are not consumed twice
+        self.calls = calls
+        key = (
+            "batch",
+            self.proxy.operation_type,
+            self.operation_name,
+            tuple(keys),
+            query_cache.settings_key(self.proxy.settings),
+        )
+        document = query_cache.get(key)
+        if document is None:
+            builder = BatchRequestBuilder(
+                self.proxy.operation_type,
+                self.proxy.schema,
+                self.proxy.settings,
+                operation_name=self.operation_name,
+            )
+            for operation, _fields, inputs in calls:
+                builder.operation(operation.field, _fields, **inputs)
+            document = query_cache.put(key, builder.build().query)
+
+        return GraphQLRequest(
+            query=document.query,
+            variables=BatchRequestBuilder.merge_variables(
+                inputs for _, _, inputs in self.calls
+            ),
+            operation_name=self.operation_name,
+            context=self.context,
+            root=self.root,
+            query_hash=(
+                document.query_hash if self.proxy.settings.persisted_queries else None
+            ),
+        )
+
+    def split_response(self, response: GraphQLResponse) -> List[GraphQLResponse]:
+        """Method to split the response of the merged request into one per call
+
+        Each split response keeps the merged request as its `request`.
+
+        Args:
+            response: holds the response of the merged request
+
+        Returns:
+            the responses in the order of the calls
+        """
+        data = response.data
+        aliases = {BatchRequestBuilder.alias(index) for index in range(len(self.calls))}
+        errors_by_alias: Dict[Optional[str], List[Dict]] = {}
+        for error in response.errors or ():
+            path = error.get("path") if isinstance(error, dict) else None
+            alias = path[0] if path else None
+            if alias not in aliases:
+                # the error does not belong to a single call
+                alias = None
+            errors_by_alias.setdefault(alias, []).append(error)
+        shared_errors = errors_by_alias.get(None, [])
+
+        responses = []
+        for index, (operation, _, _) in enumerate(self.calls):
+            alias = BatchRequestBuilder.alias(index)
+            name = operation.field.name
+            errors = [
+                {**error, "path": [name, *error["path"][1:]]}
+                for error in errors_by_alias.get(alias, ())
+            ]
+            errors.extend(shared_errors)
+            raw = {
+                "data": {name: data.get(alias)} if isinstance(data, dict) else data,
+                "errors": errors or None,
+                "extensions": response.extensions,
+            }
+            responses.append(GraphQLResponse(response.request, raw))
+        return responses
+
+    def send(self) -> List[GraphQLResponse]:
+        """Method to send all calls as a single request
+
+        Returns:
+            the responses in the order of the calls
+            (awaitable for async service proxies)
+        """
+        return self.proxy.send_batch(self)
+
+
 class ServiceProxy(abc.ABC):
     """Base class for all service proxies"""
 
     backend: Backend
     settings: Settings
     schema: Schema
+    supports_persisted_queries: bool = True
+    operation_type: str
+    _operation_proxy_type: Callable[..., OperationProxy]
 
     def __init__(
         self,
@@ -205,7 +693,11 @@ class ServiceProxy(abc.ABC):
         self.settings = settings
         self.schema = schema
         self.plugins = plugins
-        self.operations: Dict[str, OperationProxy] = self.get_bindings()
+        self.query_cache: QueryCache = QueryCache(settings.request_cache_size)
+        self.use_persisted_queries: bool = (
+            settings.persisted_queries and self.supports_persisted_queries
+        )
+        self.operations: Mapping[str, OperationProxy] = self.get_bindings()
 
     def __contains__(self, key: str) -> bool:
         return key in self.operations
@@ -246,7 +738,10 @@ class ServiceProxy(abc.ABC):
         raise AttributeError(f"No operation found for key {key}")
 
     def __iter__(self):
-        """Return iterator for the services and their callables."""
+        """Return iterator for the services and their callables.
+
+        Note that this creates the proxies of all operations.
+        """
         return iter(self.operations.items())
 
     def __dir__(self) -> Iterable[str]:
@@ -269,9 +764,48 @@ class ServiceProxy(abc.ABC):
         return list(self.operations.keys())
 
     @abc.abstractmethod
-    def get_bindings(self) -> Dict[str, OperationProxy]:
+    def get_bindings(self) -> Mapping[str, OperationProxy]:
         """Abstract base method to get the service bindings"""
 
+    # skipcq: PY-D0003
+    def _lazy_bindings(self, root_type: Optional[SchemaType]) -> LazyOperations:
+        fields = root_type.field_name_to_field if root_type is not None else {}
+        return LazyOperations(
+            fields, functools.partial(self._operation_proxy_type, self)
+        )
+
+    def create_batch(
+        self,
+        _context: GraphQLContextType = None,
+        _root: GraphQLRootType = None,
+        _operation_name: str = BatchRequestBuilder.OPERATION_NAME,
+    ) -> RequestBatch:
+        """Method to start a batch of operation calls sent as a single request
+
+        Args:
+            _context: holds the request context
+            _root: holds the request root
+            _operation_name: holds the name of the merged operation
+
+        Returns:
+            the empty batch
+        """
+        return RequestBatch(self, _context, _root, _operation_name)
+
+    def send_batch(self, batch: RequestBatch) -> List[GraphQLResponse]:
+        """Method to send the calls of the batch as a single request
+
+        Args:
+            batch: holds the batch to send
+
+        Returns:
+            the responses in the order of the calls
+        """
+        if not batch.calls:
+            return []
+        response = self.send(batch.create_request())
+        return batch.split_response(response)
+
     def send(self, request: GraphQLRequest) -> GraphQLResponse:
         """The method that sends the request through plugins onto the backend.
 
@@ -282,10 +816,36 @@ class ServiceProxy(abc.ABC):
             the response from the backend
         """
         request = apply_pre(self.plugins, request)
-        response = self.execute(request)
+        if self.use_persisted_queries and request.query is not None:
+            response = self.execute_persisted(request)
+        else:
+            response = self.execute(request)
         response = apply_post(self.plugins, response)
         return response
 
+    def execute_persisted(self, request: GraphQLRequest) -> GraphQLResponse:
+        """Send the request as automatic persisted query
+
+        At first, only the hash of the query is sent.
+        If the server does not know the hash yet, the query is sent along with it.
+        If the server does not support persisted queries,
+        they are disabled for this proxy.
+
+        Args:
+            request: holds the request to send
+
+        Returns:
+            the response from the backend
+        """
+        response = self.execute(hash_only_request(request))
+        error = persisted_query_error(response)
+        if error is None:
+            return response
+        if error == PERSISTED_QUERY_NOT_SUPPORTED:
+            self.use_persisted_queries = False
+            return self.execute(request)
+        return self.execute(register_query_request(request))
+
     @abc.abstractmethod
     def execute(self, request: GraphQLRequest) -> GraphQLResponse:
         """Abstract base method that sends the query to the backend"""
@@ -305,10 +865,53 @@ class AsyncServiceProxy(ServiceProxy, abc.ABC):
             the awaited response from the backend
         """
         request = apply_pre(self.plugins, request)
-        response = await await_if_coro(self.execute(request))
+        if self.use_persisted_queries and request.query is not None:
+            response = await self.execute_persisted(request)
+        else:
+            response = await await_if_coro(self.execute(request))
         response = apply_post(self.plugins, response)
         return response
 
+    # skipcq: PYL-W0236
+    async def send_batch(self, batch: RequestBatch) -> List[GraphQLResponse]:
+        """Method to send the calls of the batch as a single request asynchronously
+
+        Args:
+            batch: holds the batch to send
+
+        Returns:
+            the awaited responses in the order of the calls
+        """
+        if not batch.calls:
+            return []
+        while True:
+            try:
+                request = batch.create_request()
+                break
+            except TypeNotLoaded as e:
+                await e.registry.load_async(e.type_names)
+        response = await self.send(request)
+        return batch.split_response(response)
+
+    # skipcq: PYL-W0236
+    async def execute_persisted(self, request: GraphQLRequest) -> GraphQLResponse:
+        """Send the request as automatic persisted query asynchronously
+
+        Args:
+            request: holds the request to send
+
+        Returns:
+            the awaited response from the backend
+        """
+        response = await await_if_coro(self.execute(hash_only_request(request)))
+        error = persisted_query_error(response)
+        if error is None:
+            return response
+        if error == PERSISTED_QUERY_NOT_SUPPORTED:
+            self.use_persisted_queries = False
+            return await await_if_coro(self.execute(request))
+        return await await_if_coro(self.execute(register_query_request(request)))
+
     @abc.abstractmethod
     async def execute(  # skipcq: PYL-W0236
         self, request: GraphQLRequest
@@ -319,17 +922,12 @@ class AsyncServiceProxy(ServiceProxy, abc.ABC):
 class QueryServiceProxy(ServiceProxy):
     """Represents the query service"""
 
+    operation_type = "query"
     _operation_proxy_type = QueryProxy
 
-    def get_bindings(self) -> Dict[str, _operation_proxy_type]:
+    def get_bindings(self) -> LazyOperations:
         """Method to get the query service bindings"""
-        bindings = {}
-        if not self.schema.query_type and not self.schema.query_type.fields:
-            return bindings
-
-        for field in self.schema.query_type.fields:
-            bindings[field.name] = self._operation_proxy_type(self, field)
-        return bindings
+        return self._lazy_bindings(self.schema.query_type)
 
     def execute(self, request: GraphQLRequest) -> GraphQLResponse:
         """Send a query to the graphql server"""
@@ -350,21 +948,16 @@ class AsyncQueryServiceProxy(QueryServiceProxy, AsyncServiceProxy):
 class MutationServiceProxy(ServiceProxy):
     """Represents the mutation service"""
 
+    operation_type = "mutation"
     _operation_proxy_type = MutationProxy
 
     def execute(self, request: GraphQLRequest) -> GraphQLResponse:
         """Send a query to the graphql server"""
         return self.backend.execute_mutation(request)
 
-    def get_bindings(self) -> Dict[str, _operation_proxy_type]:
+    def get_bindings(self) -> LazyOperations:
         """Method to get the mutation service bindings"""
-        bindings = {}
-        if not self.schema.mutation_type and not self.schema.mutation_type.fields:
-            return bindings
-
-        for field in self.schema.mutation_type.fields:
-            bindings[field.name] = self._operation_proxy_type(self, field)
-        return bindings
+        return self._lazy_bindings(self.schema.mutation_type)
 
 
 class AsyncMutationServiceProxy(MutationServiceProxy, AsyncServiceProxy):
@@ -381,28 +974,35 @@ class AsyncMutationServiceProxy(MutationServiceProxy, AsyncServiceProxy):
 class SubscriptionServiceProxy(ServiceProxy):
     """Represents the subscription service"""
 
+    operation_type = "subscription"
     _operation_proxy_type = SubscriptionProxy
+    # subscriptions are long-lived, hence sending their hash saves next to nothing
+    supports_persisted_queries = False
+
+    def create_batch(
+        self,
+        _context: GraphQLContextType = None,
+        _root: GraphQLRootType = None,
+        _operation_name: str = BatchRequestBuilder.OPERATION_NAME,
+    ) -> RequestBatch:
+        """Subscriptions can not be batched, they must select a single root field
+
+        Raises:
+            QlientException always
+        """
+        raise QlientException("Subscriptions can not be batched")
 
     def execute(self, request: GraphQLSubscriptionRequest) -> GraphQLResponse:
         """Send a query to the graphql server"""
         return self.backend.execute_subscription(request)
 
-    def get_bindings(self) -> Dict[str, _operation_proxy_type]:
+    def get_bindings(self) -> LazyOperations:
         """Method to get the subscription service bindings
 
         Returns:
-            A dictionary with the service name bound to the subscription service proxy
+            A mapping with the subscription names bound to the operation proxies
         """
-        bindings = {}
-        if (
-            not self.schema.subscription_type
-            and not self.schema.subscription_type.fields
-        ):
-            return bindings
-
-        for field in self.schema.subscription_type.fields:
-            bindings[field.name] = self._operation_proxy_type(self, field)
-        return bindings
+        return self._lazy_bindings(self.schema.subscription_type)
 
 
 class AsyncSubscriptionServiceProxy(SubscriptionServiceProxy, AsyncServiceProxy):
@@ -0,0 +1,313 @@
+"""This file contains the process wide registry of shared schemas
+
+Clients that use the same backend get the very same schema instance
+from this registry, instead of each of them loading and parsing the schema again.
+Clients with other backends load the schema themselves,
+but still get the shared instance if the loaded schema has the same fingerprint.
+The registry only holds weak references,
+hence a schema is dropped as soon as no client uses it anymore.
+"""
+import asyncio
+import logging
+import threading
+import weakref
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from qlient.core import __meta__
+from qlient.core.backends import Backend
+from qlient.core.plugins import Plugin
+from qlient.core.schema.schema import Schema
+from qlient.core.settings import Settings
+
+logger = logging.getLogger(__meta__.__title__)
+
+ServiceProxyType = TypeVar("ServiceProxyType")
+
+
+class BackendKey:
+    """Class that represents the registry key of a backend instance
+
+    Backends are compared by identity, hence two backends of the same class
+    never share a key, even if they do not tell their servers apart.
+    The key keeps the backend alive while a schema is registered under it,
+    so the identity of the backend can not be reused by another one.
+
+    Args:
+        backend: holds the backend of the client
+        variant: holds the variant of the schema, e.g. the cache key of the provider
+    """
+
+    __slots__ = ("backend", "variant")
+
+    def __init__(self, backend: Backend, variant: Hashable = None):
+        self.backend: Backend = backend
+        self.variant: Hashable = variant
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BackendKey):
+            return NotImplemented
+        return self.backend is other.backend and self.variant == other.variant
+
+    def __hash__(self) -> int:
+        return hash((id(self.backend), self.variant))
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the key"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the key"""
+        class_name = self.__class__.__name__
+        return f"<{class_name}(backend={self.backend}, variant={self.variant})>"
+
+
+class SchemaRegistry:
+    """Class that represents a thread safe registry of shared schemas
+
+    Schemas are registered by a key that identifies the backend,
+    usually a :ref:`BackendKey`.
+    When a schema with the same fingerprint is already registered,
+    under the same or under another key, the registered schema is returned instead.
+
+    The registry also shares service proxies between clients
+    that use the same backend, settings and plugins.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # holds the load lock of each key and the number of threads using it
+        self._load_locks: Dict[Hashable, Tuple[threading.Lock, int]] = {}
+        # holds the schema loads in flight by event loop and key
+        self._async_loads: Dict[
+            Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future
+        ] = {}
+        self._schemas: "weakref.WeakValueDictionary[Hashable, Schema]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._fingerprints: "weakref.WeakValueDictionary[str, Schema]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._proxies: "weakref.WeakValueDictionary[Hashable, object]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def get(self, key: Hashable) -> Optional[Schema]:
+        """Return the schema registered under the given key
+
+        Args:
+            key: holds the key that identifies the backend
+
+        Returns:
+            Either None (if no schema is registered) or the schema
+        """
+        return self._schemas.get(key)
+
+    def register(
+        self, key: Hashable, schema: Schema, share_by_fingerprint: bool = True
+    ) -> Schema:
+        """Register the schema under the given key
+
+        Args:
+            key: holds the key that identifies the backend
+            schema: holds the freshly loaded schema
+            share_by_fingerprint: if False, a schema with the same fingerprint
+                is only shared under the same key.
+                Use this for schemas that are bound to their backend,
+                e.g. partially introspected schemas.
+
+        Returns:
+            the registered schema with the same fingerprint
+            or the given schema if there was none
+        """
+        fingerprint = schema.fingerprint
+        with self._lock:
+            registered = self._schemas.get(key)
+            if registered is None or registered.fingerprint != fingerprint:
+                registered = None
+                if share_by_fingerprint and fingerprint is not None:
+                    registered = self._fingerprints.get(fingerprint)
+            if registered is not None:
+                self._schemas[key] = registered
+                return registered
+            self._schemas[key] = schema
+            if share_by_fingerprint and fingerprint is not None:
+                self._fingerprints[fingerprint] = schema
+            return schema
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[], Schema],
+        share_by_fingerprint: bool = True,
+    ) -> Schema:
+        """Return the schema registered under the given key or load it
+
+        Threads that ask for the same key at the same time
+        wait for the first one to load the schema.
+
+        Args:
+            key: holds the key that identifies the backend
+            load: holds the function to load the schema with
+            share_by_fingerprint: see :ref:`register`
+
+        Returns:
+            the shared schema
+        """
+        schema = self.get(key)
+        if schema is not None:
+            return schema
+        with self._lock:
+            load_lock, users = self._load_locks.get(key, (None, 0))
+            if load_lock is None:
+                load_lock = threading.Lock()
+            self._load_locks[key] = (load_lock, users + 1)
+        try:
+            with load_lock:
+                schema = self.get(key)
+                if schema is not None:
+                    return schema
+                logger.debug(f"Loading shared schema for `{key}`")
+                return self.register(key, load(), share_by_fingerprint)
+        finally:
+            with self._lock:
+                load_lock, users = self._load_locks[key]
+                if users == 1:
+                    # the last thread drops the lock, so the locks do not pile up
+                    del self._load_locks[key]
+                else:
+                    self._load_locks[key] = (load_lock, users - 1)
+
+    async def get_or_load_async(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Schema]],
+        share_by_fingerprint: bool = True,
+    ) -> Schema:
+        """Return the schema registered under the given key or load it asynchronously
+
+        Coroutines that ask for the same key at the same time
+        wait for the first one to load the schema.
+        When the first one gets cancelled, the next one loads the schema.
+
+        Args:
+            key: holds the key that identifies the backend
+            load: holds the coroutine function to load the schema with
+            share_by_fingerprint: see :ref:`register`
+
+        Returns:
+            the shared schema
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            schema = self.get(key)
+            if schema is not None:
+                return schema
+            with self._lock:
+                future = self._async_loads.get((loop, key))
+                is_loading = future is None
+                if is_loading:
+                    future = loop.create_future()
+                    self._async_loads[(loop, key)] = future
+            if is_loading:
+                return await self._load_async(
+                    key, load, share_by_fingerprint, loop, future
+                )
+            try:
+                # shielded, so a cancelled waiter does not cancel the load
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # the loading coroutine got cancelled, try again
+
+    # skipcq: PY-D0003
+    async def _load_async(
+        self, key, load, share_by_fingerprint, loop, future
+    ) -> Schema:
+        try:
+            logger.debug(f"Loading shared schema for `{key}`")
+            schema = self.register(key, await load(), share_by_fingerprint)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # the exception is raised here, waiters are optional
+            future.exception()
+            raise
+        else:
+            future.set_result(schema)
+            return schema
+        finally:
+            with self._lock:
+                del self._async_loads[(loop, key)]
+
+    def get_service_proxy(
+        self,
+        proxy_class: Type[ServiceProxyType],
+        backend: Backend,
+        settings: Settings,
+        schema: Schema,
+        plugins: List[Plugin],
+    ) -> ServiceProxyType:
+        """Return the shared service proxy or create it
+
+        A shared service proxy holds its own copy of the plugins list.
+
+        Args:
+            proxy_class: holds the class of the service proxy
+            backend: holds the backend of the client
+            settings: holds the settings of the client
+            schema: holds the (shared) schema of the client
+            plugins: holds the plugins of the client
+
+        Returns:
+            the shared service proxy
+        """
+        # the proxy keeps all of these objects alive, so their ids are unique
+        key = (
+            proxy_class,
+            id(backend),
+            id(settings),
+            id(schema),
+            tuple(id(plugin) for plugin in plugins),
+        )
+        with self._lock:
+            proxy = self._proxies.get(key)
+            if proxy is None:
+                proxy = proxy_class(backend, settings, schema, list(plugins))
+                self._proxies[key] = proxy
+            return proxy
+
+    def clear(self):
+        """Drop all registered schemas and service proxies"""
+        with self._lock:
+            self._schemas.clear()
+            self._fingerprints.clear()
+            self._proxies.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the registry"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the registry"""
+        class_name = self.__class__.__name__
+        return f"<{class_name}(schemas={len(self)})>"
+
+
+# the process wide schema registry used by the clients
+schema_registry = SchemaRegistry()
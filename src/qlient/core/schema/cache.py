@@ -0,0 +1,417 @@
+"""This file contains the persistent introspection cache
+
+The introspection cache stores introspected schemas on disk,
+keyed by the identity of the backend they were introspected from.
+The modification time of a cache file is the time the schema was last validated.
+A cached schema is used as is until its time to live expires.
+After that, the schema is revalidated with a much smaller query
+and only fetched again if the revalidation detects a change.
+"""
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+from typing import Optional, Union, List, Dict
+
+from qlient.core import __meta__
+from qlient.core._types import RawSchema, JSON
+from qlient.core.schema.introspection import (
+    DEFAULT_TYPE_REF_DEPTH,
+    build_type_ref_selection,
+)
+
+logger = logging.getLogger(__meta__.__title__)
+
+# increase this whenever the layout of the cache entries
+# or the computation of the validator changes
+CACHE_FORMAT_VERSION = 3
+CACHE_SUFFIX = ".introspection.json"
+
+SCHEMA_VALIDATOR_OPERATION_NAME = "SchemaValidatorQuery"
+
+
+def build_schema_validator_query(
+    include_deprecated: bool = True,
+    type_ref_depth: int = DEFAULT_TYPE_REF_DEPTH,
+) -> str:
+    """Build the query for the validator of a cached schema
+
+    The query covers everything the introspection query fetches,
+    except for the descriptions:
+    the names, type references and default values, the deprecations
+    and the directives of the schema.
+    Changed descriptions alone are not detected,
+    a cached schema keeps its descriptions until it is fetched again.
+    It must skip the same deprecated fields and enum values
+    and cut the type references off at the same depth
+    as the introspection query of the cached schema.
+
+    Args:
+        include_deprecated: if False, deprecated fields and enum values are skipped
+        type_ref_depth: holds the number of nested `ofType` levels to query
+
+    Returns:
+        the validator query
+    """
+    include = "true" if include_deprecated else "false"
+    deprecation = (
+        "        isDeprecated\n        deprecationReason\n"
+        if include_deprecated
+        else ""
+    )
+    return (
+        f"query {SCHEMA_VALIDATOR_OPERATION_NAME} {{\n"
+        "  __schema {\n"
+        "    queryType { name }\n"
+        "    mutationType { name }\n"
+        "    subscriptionType { name }\n"
+        "    types {\n"
+        "      kind\n"
+        "      name\n"
+        f"      fields(includeDeprecated: {include}) {{\n"
+        "        name\n"
+        "        args { ...InputValue }\n"
+        "        type { ...TypeRef }\n"
+        f"{deprecation}"
+        "      }\n"
+        "      inputFields { ...InputValue }\n"
+        "      interfaces { ...TypeRef }\n"
+        f"      enumValues(includeDeprecated: {include}) {{\n"
+        "        name\n"
+        f"{deprecation}"
+        "      }\n"
+        "      possibleTypes { ...TypeRef }\n"
+        "    }\n"
+        "    directives {\n"
+        "      name\n"
+        "      locations\n"
+        "      args { ...InputValue }\n"
+        "    }\n"
+        "  }\n"
+        "}\n"
+        "fragment InputValue on __InputValue {\n"
+        "  name\n"
+        "  type { ...TypeRef }\n"
+        "  defaultValue\n"
+        "}\n"
+        "fragment TypeRef on __Type {\n"
+        f"{build_type_ref_selection(type_ref_depth)}\n"
+        "}\n"
+    )
+
+
+SCHEMA_VALIDATOR_QUERY = build_schema_validator_query()
+
+
+# skipcq: PY-D0003
+def _project_enum_values(values: Optional[List[Dict]]) -> Optional[List[Dict]]:
+    if values is None:
+        return None
+    return [
+        {
+            "name": value.get("name"),
+            "isDeprecated": value.get("isDeprecated"),
+            "deprecationReason": value.get("deprecationReason"),
+        }
+        for value in values
+    ]
+
+
+# skipcq: PY-D0003
+def _project_type_ref(type_ref: Optional[Dict], depth: int) -> Optional[Dict]:
+    if not type_ref:
+        return None
+    return {
+        "kind": type_ref.get("kind"),
+        "name": type_ref.get("name"),
+        "ofType": (
+            _project_type_ref(type_ref.get("ofType"), depth - 1) if depth else None
+        ),
+    }
+
+
+# skipcq: PY-D0003
+def _project_type_refs(
+    type_refs: Optional[List[Dict]], depth: int
+) -> Optional[List[Dict]]:
+    if type_refs is None:
+        return None
+    return [_project_type_ref(type_ref, depth) for type_ref in type_refs]
+
+
+# skipcq: PY-D0003
+def _project_inputs(values: Optional[List[Dict]], depth: int) -> Optional[List[Dict]]:
+    if values is None:
+        return None
+    return [
+        {
+            "name": value.get("name"),
+            "type": _project_type_ref(value.get("type"), depth),
+            "defaultValue": value.get("defaultValue"),
+        }
+        for value in values
+    ]
+
+
+# skipcq: PY-D0003
+def _project_directives(
+    directives: Optional[List[Dict]], depth: int
+) -> Optional[List[Dict]]:
+    if directives is None:
+        return None
+    return [
+        {
+            "name": directive.get("name"),
+            "locations": directive.get("locations"),
+            "args": _project_inputs(directive.get("args") or [], depth),
+        }
+        for directive in directives
+        if directive
+    ]
+
+
+# skipcq: PY-D0003
+def _project_root_type(root_type: Optional[Dict]) -> Optional[Dict]:
+    if not root_type:
+        return None
+    return {"name": root_type.get("name")}
+
+
+def compute_schema_validator(
+    raw_schema: RawSchema, type_ref_depth: int = DEFAULT_TYPE_REF_DEPTH
+) -> str:
+    """Compute the validator of the given raw schema
+
+    The validator only covers the parts of the schema
+    that are queried by the :ref:`SCHEMA_VALIDATOR_QUERY`.
+    Hence, it can be computed both from a full introspection result
+    and from the (much smaller) result of the validator query.
+
+    Args:
+        raw_schema: holds either the full raw schema or the validator query result
+        type_ref_depth: holds the number of nested `ofType` levels
+            the schema was introspected with
+
+    Returns:
+        the hex digest of the validator
+    """
+    depth = type_ref_depth
+    projection = {
+        "queryType": _project_root_type(raw_schema.get("queryType")),
+        "mutationType": _project_root_type(raw_schema.get("mutationType")),
+        "subscriptionType": _project_root_type(raw_schema.get("subscriptionType")),
+        "types": [
+            {
+                "kind": type_dict.get("kind"),
+                "name": type_dict.get("name"),
+                "fields": (
+                    [
+                        {
+                            "name": field.get("name"),
+                            "args": _project_inputs(field.get("args") or [], depth),
+                            "type": _project_type_ref(field.get("type"), depth),
+                            "isDeprecated": field.get("isDeprecated"),
+                            "deprecationReason": field.get("deprecationReason"),
+                        }
+                        for field in type_dict["fields"]
+                    ]
+                    if type_dict.get("fields") is not None
+                    else None
+                ),
+                "inputFields": _project_inputs(type_dict.get("inputFields"), depth),
+                "interfaces": _project_type_refs(type_dict.get("interfaces"), depth),
+                "enumValues": _project_enum_values(type_dict.get("enumValues")),
+                "possibleTypes": _project_type_refs(
+                    type_dict.get("possibleTypes"), depth
+                ),
+            }
+            for type_dict in raw_schema.get("types") or []
+            if type_dict
+        ],
+        "directives": _project_directives(raw_schema.get("directives"), depth),
+    }
+    serialized = json.dumps(projection, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class IntrospectionCacheEntry:
+    """Represents a single entry of the introspection cache"""
+
+    def __init__(
+        self,
+        key: str,
+        raw_schema: RawSchema,
+        validator: Optional[str],
+        stored_at: float,
+        fingerprint: Optional[str] = None,
+    ):
+        self.key: str = key
+        self.raw_schema: RawSchema = raw_schema
+        self.validator: Optional[str] = validator
+        self.stored_at: float = stored_at
+        self.fingerprint: Optional[str] = fingerprint
+
+    def is_fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        """Check if the entry can be used without revalidation
+
+        Args:
+            ttl: holds the time to live in seconds
+            now: optional, holds the current timestamp
+
+        Returns:
+            True if the entry is younger than the time to live
+        """
+        now = time.time() if now is None else now
+        return now - self.stored_at < ttl
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the cache entry"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the cache entry"""
+        class_name = self.__class__.__name__
+        return f"<{class_name}(key=`{self.key}`, stored_at={self.stored_at})>"
+
+
+class IntrospectionCache:
+    """Class that represents an on-disk cache of introspected schemas
+
+    Args:
+        cache_dir: holds the directory to store the introspected schemas in
+        ttl: holds the time to live of a cached schema in seconds.
+            Once expired, the cached schema gets revalidated before it is used.
+    """
+
+    def __init__(self, cache_dir: Union[str, pathlib.Path], ttl: float = 3600):
+        self.cache_dir: pathlib.Path = pathlib.Path(cache_dir)
+        self.ttl: float = ttl
+
+    def path(self, key: str) -> pathlib.Path:
+        """Return the path of the cache file for the given key
+
+        Args:
+            key: holds the key that identifies the backend
+
+        Returns:
+            the path to the cache file
+        """
+        key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"v{CACHE_FORMAT_VERSION}-{key_hash}{CACHE_SUFFIX}"
+
+    def load(self, key: str) -> Optional[IntrospectionCacheEntry]:
+        """Load the cache entry of the given key
+
+        Args:
+            key: holds the key that identifies the backend
+
+        Returns:
+            Either None (if there is no valid entry) or the cache entry
+        """
+        path = self.path(key)
+        if not path.is_file():
+            return None
+        try:
+            # the modification time of the file is the time of the last (re)validation
+            stored_at = path.stat().st_mtime
+            with path.open("r", encoding="utf-8") as cache_file:
+                content: Dict[str, JSON] = json.load(cache_file)
+            if content.get("key") != key:
+                return None
+            return IntrospectionCacheEntry(
+                key=key,
+                raw_schema=content["schema"],
+                validator=content.get("validator"),
+                stored_at=stored_at,
+                fingerprint=content.get("fingerprint"),
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Unable to load introspection cache `{path}`: {e}")
+            return None
+
+    def store(
+        self,
+        key: str,
+        raw_schema: RawSchema,
+        validator: Optional[str],
+        stored_at: Optional[float] = None,
+        fingerprint: Optional[str] = None,
+    ) -> IntrospectionCacheEntry:
+        """Store the raw schema in the cache
+
+        Args:
+            key: holds the key that identifies the backend
+            raw_schema: holds the introspected raw schema
+            validator: holds the validator of the raw schema
+            stored_at: optional, holds the timestamp to store the entry with
+            fingerprint: optional, holds the content fingerprint of the raw schema
+
+        Returns:
+            the stored cache entry
+        """
+        entry = IntrospectionCacheEntry(
+            key=key,
+            raw_schema=raw_schema,
+            validator=validator,
+            stored_at=time.time() if stored_at is None else stored_at,
+            fingerprint=fingerprint,
+        )
+        path = self.path(key)
+        content = {
+            "key": key,
+            "validator": entry.validator,
+            "fingerprint": entry.fingerprint,
+            "schema": entry.raw_schema,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=str(path.parent))
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as tmp_file:
+                    json.dump(content, tmp_file)
+                os.utime(tmp_path, (entry.stored_at, entry.stored_at))
+                os.replace(tmp_path, str(path))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Unable to write introspection cache `{path}`: {e}")
+        return entry
+
+    def touch(self, entry: IntrospectionCacheEntry) -> IntrospectionCacheEntry:
+        """Mark the entry as revalidated, which restarts its time to live
+
+        Only the modification time of the cache file is updated,
+        the cached schema is not written again.
+
+        Args:
+            entry: holds the entry that was revalidated
+
+        Returns:
+            the refreshed cache entry
+        """
+        stored_at = time.time()
+        path = self.path(entry.key)
+        try:
+            os.utime(str(path), (stored_at, stored_at))
+        except OSError as e:
+            logger.warning(f"Unable to touch introspection cache `{path}`: {e}")
+        return IntrospectionCacheEntry(
+            key=entry.key,
+            raw_schema=entry.raw_schema,
+            validator=entry.validator,
+            stored_at=stored_at,
+            fingerprint=entry.fingerprint,
+        )
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the cache"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the cache"""
+        class_name = self.__class__.__name__
+        return f"<{class_name}(cache_dir=`{self.cache_dir}`, ttl={self.ttl})>"
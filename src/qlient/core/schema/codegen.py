@@ -0,0 +1,319 @@
+"""This file contains the ahead-of-time code generation of schemas
+
+A schema can be turned into a python module that holds
+the types, fields, arguments and type references as constant tables.
+Importing such a module only unmarshals the cached bytecode,
+hence loading the schema from it skips the json decoding and the parsing.
+
+Usage:
+    python -m qlient.core.schema.codegen schema.json my_schema.py
+"""
+import argparse
+import importlib
+import pathlib
+import sys
+import types as builtin_types
+from typing import Dict, List, Mapping, Optional, Tuple, Union, Sequence
+
+from qlient.core.schema.models import (
+    Directive,
+    EnumValue,
+    Field,
+    Input,
+    Type,
+    TypeRef,
+)
+from qlient.core.schema.parser import ParseResult, LazyTypesRegistry, extract_type
+from qlient.core.schema.schema import Schema
+
+# increase this whenever the layout of the generated tables changes
+CODEGEN_FORMAT_VERSION = 1
+
+
+class _TypeRefTable:
+    """Helper to collect the type references of a schema as table
+
+    Each distinct type reference chain gets a single row.
+    Nested type references always come before the rows that refer to them.
+    A missing type reference has the index -1.
+    """
+
+    def __init__(self):
+        self.rows: List[Tuple[Optional[str], Optional[str], int]] = []
+        self._indexes: Dict[tuple, int] = {}
+
+    def index(self, type_ref: Optional[TypeRef]) -> int:
+        """Return the row index of the given type reference
+
+        Args:
+            type_ref: holds the type reference to add to the table
+
+        Returns:
+            Either -1 (if there is no type reference) or the row index
+        """
+        if type_ref is None:
+            return -1
+        row = (
+            type_ref.kind.value if type_ref.kind else None,
+            type_ref.name,
+            self.index(type_ref.of_type_ref),
+        )
+        index = self._indexes.get(row)
+        if index is None:
+            index = self._indexes[row] = len(self.rows)
+            self.rows.append(row)
+        return index
+
+
+def _input_rows(inputs: Optional[List[Input]], type_refs: _TypeRefTable) -> tuple:
+    return tuple(
+        (
+            input_value.name,
+            input_value.description,
+            type_refs.index(input_value.type),
+            input_value.default_value,
+        )
+        for input_value in inputs or []
+    )
+
+
+def _type_row(_type: Type, type_refs: _TypeRefTable) -> tuple:
+    return (
+        _type.kind.value if _type.kind else None,
+        _type.name,
+        _type.description,
+        tuple(
+            (
+                field.name,
+                field.description,
+                _input_rows(field.args, type_refs),
+                type_refs.index(field.type),
+                field.is_deprecated,
+                field.deprecation_reason,
+            )
+            for field in _type.fields or []
+        ),
+        _input_rows(_type.input_fields, type_refs),
+        tuple(type_refs.index(interface) for interface in _type.interfaces or []),
+        tuple(
+            (
+                enum_value.name,
+                enum_value.description,
+                enum_value.is_deprecated,
+                enum_value.deprecation_reason,
+            )
+            for enum_value in _type.enum_values or []
+        ),
+        tuple(type_refs.index(possible) for possible in _type.possible_types or []),
+    )
+
+
+def _write_table(lines: List[str], name: str, rows: Sequence[tuple]):
+    lines.append(f"{name} = (")
+    lines.extend(f"    {row!r}," for row in rows)
+    lines.append(")")
+
+
+def generate_schema_module(schema: Schema) -> str:
+    """Generate the source code of a python module that holds the given schema
+
+    Args:
+        schema: holds the schema to generate the module for
+
+    Returns:
+        the source code of the module
+    """
+    type_refs = _TypeRefTable()
+    type_rows = [
+        _type_row(_type, type_refs) for _type in schema.types_registry.values()
+    ]
+    directive_rows = [
+        (
+            directive.name,
+            directive.description,
+            tuple(directive.locations or []),
+            _input_rows(directive.args, type_refs),
+        )
+        for directive in (schema.directives_registry or {}).values()
+    ]
+
+    def _root_type_name(root_type: Optional[Type]) -> Optional[str]:
+        return root_type.name if root_type is not None else None
+
+    lines = [
+        '"""This module was generated by qlient.core.schema.codegen, do not edit"""',
+        "# fmt: off",
+        f"FORMAT_VERSION = {CODEGEN_FORMAT_VERSION!r}",
+        f"FINGERPRINT = {schema.fingerprint!r}",
+        f"QUERY_TYPE = {_root_type_name(schema.query_type)!r}",
+        f"MUTATION_TYPE = {_root_type_name(schema.mutation_type)!r}",
+        f"SUBSCRIPTION_TYPE = {_root_type_name(schema.subscription_type)!r}",
+        "# (kind, name, index of the nested type reference or -1)",
+    ]
+    _write_table(lines, "TYPE_REFS", type_refs.rows)
+    lines.append(
+        "# (kind, name, description, fields, input fields, "
+        "interfaces, enum values, possible types)"
+    )
+    _write_table(lines, "TYPES", type_rows)
+    lines.append("# (name, description, locations, arguments)")
+    _write_table(lines, "DIRECTIVES", directive_rows)
+    return "\n".join(lines) + "\n"
+
+
+def write_schema_module(schema: Schema, path: Union[str, pathlib.Path]):
+    """Generate the python module for the given schema and write it to the path
+
+    Args:
+        schema: holds the schema to generate the module for
+        path: holds the path to write the module to
+    """
+    pathlib.Path(path).write_text(generate_schema_module(schema), encoding="utf-8")
+
+
+def _build_inputs(rows: tuple, type_refs: List[TypeRef]) -> List[Input]:
+    return [
+        Input(name, description, type_refs[type_ref], default_value)
+        for name, description, type_ref, default_value in rows
+    ]
+
+
+def _build_type(row: tuple, type_refs: List[TypeRef]) -> Type:
+    (
+        kind,
+        name,
+        description,
+        fields,
+        input_fields,
+        interfaces,
+        enum_values,
+        possible_types,
+    ) = row
+    return Type(
+        kind,
+        name,
+        description,
+        fields=[
+            Field(
+                field_name,
+                field_description,
+                _build_inputs(args, type_refs),
+                type_refs[type_ref],
+                is_deprecated,
+                deprecation_reason,
+            )
+            for (
+                field_name,
+                field_description,
+                args,
+                type_ref,
+                is_deprecated,
+                deprecation_reason,
+            ) in fields
+        ],
+        inputFields=_build_inputs(input_fields, type_refs),
+        interfaces=[type_refs[index] for index in interfaces],
+        enumValues=[EnumValue(*enum_value) for enum_value in enum_values],
+        possibleTypes=[type_refs[index] for index in possible_types],
+    )
+
+
+def _build_type_refs(rows: tuple, types: Mapping[str, Type]) -> List[TypeRef]:
+    type_refs: List[TypeRef] = []
+    for kind, name, of_type_ref in rows:
+        type_ref = TypeRef(
+            kind, name, type_refs[of_type_ref] if of_type_ref >= 0 else None
+        )
+        type_ref._types_registry = types
+        type_refs.append(type_ref)
+    # a missing type reference has the index -1, which now maps to None
+    type_refs.append(None)
+    return type_refs
+
+
+class ModuleTypesRegistry(LazyTypesRegistry):
+    """Represents a mapping of type names to types that builds types on demand
+    from the table rows of a generated schema module.
+
+    Args:
+        type_rows: holds the rows of the `TYPES` table
+        type_ref_rows: holds the rows of the `TYPE_REFS` table
+    """
+
+    def __init__(self, type_rows: tuple, type_ref_rows: tuple):
+        super().__init__([])
+        self._raw_types = {row[1]: row for row in type_rows}
+        self.type_refs: List[TypeRef] = _build_type_refs(type_ref_rows, self)
+
+    # skipcq: PY-D0003
+    def _parse_type(self, raw_type: tuple) -> Type:
+        return _build_type(raw_type, self.type_refs)
+
+
+def load_schema_module(
+    module: Union[str, builtin_types.ModuleType],
+    lazy: bool = False,
+) -> ParseResult:
+    """Build the parsed schema from a generated schema module
+
+    Args:
+        module: holds either the generated module or its import name
+        lazy: if True, the types are only built the first time they are accessed
+
+    Returns:
+        the parse result of the schema
+
+    Raises:
+        ValueError when the module was generated with another format version
+    """
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    if getattr(module, "FORMAT_VERSION", None) != CODEGEN_FORMAT_VERSION:
+        raise ValueError(
+            f"The schema module `{module.__name__}` is outdated, "
+            f"please generate it again."
+        )
+
+    if lazy:
+        types = ModuleTypesRegistry(module.TYPES, module.TYPE_REFS)
+        type_refs = types.type_refs
+    else:
+        types = {}
+        type_refs = _build_type_refs(module.TYPE_REFS, types)
+        for row in module.TYPES:
+            types[row[1]] = _build_type(row, type_refs)
+
+    directives = {
+        name: Directive(
+            name, description, list(locations), _build_inputs(args, type_refs)
+        )
+        for name, description, locations, args in module.DIRECTIVES
+    }
+    return ParseResult(
+        query_type=extract_type(module.QUERY_TYPE, types),
+        mutation_type=extract_type(module.MUTATION_TYPE, types),
+        subscription_type=extract_type(module.SUBSCRIPTION_TYPE, types),
+        types=types,
+        directives=directives,
+        fingerprint=module.FINGERPRINT,
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    """Generate a schema module from a schema file
+
+    Args:
+        argv: optional, holds the command line arguments
+    """
+    from qlient.core.schema.providers import FileSchemaProvider
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("schema_file", help="the path to the json schema file")
+    parser.add_argument("module_file", help="the path to write the module to")
+    args = parser.parse_args(argv)
+    schema = FileSchemaProvider(args.schema_file).load_schema()
+    write_schema_module(schema, args.module_file)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
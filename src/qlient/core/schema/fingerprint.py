@@ -0,0 +1,78 @@
+"""This file contains the content fingerprint of raw graphql schemas
+
+The fingerprint only depends on the content of the schema,
+not on the formatting, the key order or the source it was loaded from.
+It can be computed incrementally, one entry of the `types` array at a time,
+which allows computing it while streaming the schema.
+"""
+import hashlib
+import json
+from typing import Dict
+
+from qlient.core._types import JSON, RawSchema
+
+
+def _canonical(value: JSON) -> bytes:
+    # the pure ascii output is considerably faster to encode
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("ascii")
+
+
+class SchemaFingerprint:
+    """Class to incrementally compute the fingerprint of a raw schema
+
+    Each top level key of the schema gets its own digest.
+    The fingerprint combines these digests in the order of the sorted keys.
+    """
+
+    def __init__(self):
+        self._digests: Dict[str, "hashlib._Hash"] = {}
+
+    def update(self, key: str, value: JSON) -> "SchemaFingerprint":
+        """Add a value of the given top level key to the fingerprint
+
+        Values of the same key are added in order.
+        Every entry of the `types` array is added separately.
+
+        Args:
+            key: holds the top level key of the schema
+            value: holds the value to add
+
+        Returns:
+            self
+        """
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = self._digests[key] = hashlib.sha256()
+        digest.update(_canonical(value))
+        return self
+
+    def hexdigest(self) -> str:
+        """Method to return the fingerprint
+
+        Returns:
+            the hex digest of the fingerprint
+        """
+        fingerprint = hashlib.sha256()
+        for key in sorted(self._digests):
+            fingerprint.update(key.encode("utf-8"))
+            fingerprint.update(self._digests[key].digest())
+        return fingerprint.hexdigest()
+
+
+def fingerprint_raw_schema(raw_schema: RawSchema) -> str:
+    """Compute the fingerprint of the given raw schema
+
+    Args:
+        raw_schema: holds the raw schema as a dictionary
+
+    Returns:
+        the hex digest of the fingerprint
+    """
+    fingerprint = SchemaFingerprint()
+    for key, value in raw_schema.items():
+        if key == "types" and isinstance(value, list):
+            for type_dict in value:
+                fingerprint.update(key, type_dict)
+        else:
+            fingerprint.update(key, value)
+    return fingerprint.hexdigest()
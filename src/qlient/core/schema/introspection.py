@@ -0,0 +1,218 @@
+"""This file contains the builder of the introspection query
+
+The introspection query can be reduced to what the client actually needs.
+Descriptions and deprecated fields make up a large share
+of the introspection result of big schemas.
+"""
+
+DEFAULT_TYPE_REF_DEPTH = 7
+
+
+def build_type_ref_selection(depth: int, indent: str = "  ") -> str:
+    """Build the selection of a type reference and its nested type references
+
+    Args:
+        depth: holds the number of nested `ofType` levels
+        indent: holds the indentation of the selection
+
+    Returns:
+        the selection set of the type reference
+
+    Raises:
+        ValueError when the depth is negative
+    """
+    if depth < 0:
+        raise ValueError(f"The type ref depth must not be negative, got {depth}")
+    lines = []
+    for level in range(depth + 1):
+        prefix = indent * (level + 1)
+        if level:
+            lines.append(f"{indent * level}ofType {{")
+        lines.append(f"{prefix}kind")
+        lines.append(f"{prefix}name")
+    for level in range(depth, 0, -1):
+        lines.append(f"{indent * level}}}")
+    return "\n".join(lines)
+
+
+def _description(descriptions: bool, indent: int) -> str:
+    return f"{' ' * indent}description\n" if descriptions else ""
+
+
+def _directives_selection(descriptions: bool) -> str:
+    return (
+        "    directives {\n"
+        "      name\n"
+        f"{_description(descriptions, 6)}"
+        "      locations\n"
+        "      args {\n"
+        "        ...InputValue\n"
+        "      }\n"
+        "    }\n"
+    )
+
+
+def build_introspection_fragments(
+    descriptions: bool = True,
+    include_deprecated: bool = True,
+    type_ref_depth: int = DEFAULT_TYPE_REF_DEPTH,
+) -> str:
+    """Build the fragments `FullType`, `InputValue` and `TypeRef`
+
+    Args:
+        descriptions: if False, no descriptions are queried
+        include_deprecated: if False, deprecated fields and enum values are skipped
+        type_ref_depth: holds the number of nested `ofType` levels to query.
+            Type references that are nested deeper are cut off.
+
+    Returns:
+        the introspection fragments
+    """
+    include = "true" if include_deprecated else "false"
+    deprecation = (
+        "    isDeprecated\n    deprecationReason\n" if include_deprecated else ""
+    )
+    return (
+        "fragment FullType on __Type {\n"
+        "  kind\n"
+        "  name\n"
+        f"{_description(descriptions, 2)}"
+        f"  fields(includeDeprecated: {include}) {{\n"
+        "    name\n"
+        f"{_description(descriptions, 4)}"
+        "    args {\n"
+        "      ...InputValue\n"
+        "    }\n"
+        "    type {\n"
+        "      ...TypeRef\n"
+        "    }\n"
+        f"{deprecation}"
+        "  }\n"
+        "  inputFields {\n"
+        "    ...InputValue\n"
+        "  }\n"
+        "  interfaces {\n"
+        "    ...TypeRef\n"
+        "  }\n"
+        f"  enumValues(includeDeprecated: {include}) {{\n"
+        "    name\n"
+        f"{_description(descriptions, 4)}"
+        f"{deprecation}"
+        "  }\n"
+        "  possibleTypes {\n"
+        "    ...TypeRef\n"
+        "  }\n"
+        "}\n"
+        "fragment InputValue on __InputValue {\n"
+        "  name\n"
+        f"{_description(descriptions, 2)}"
+        "  type { ...TypeRef }\n"
+        "  defaultValue\n"
+        "}\n"
+        "fragment TypeRef on __Type {\n"
+        f"{build_type_ref_selection(type_ref_depth)}\n"
+        "}\n"
+    )
+
+
+def build_introspection_query(
+    operation_name: str = "IntrospectionQuery",
+    descriptions: bool = True,
+    include_deprecated: bool = True,
+    type_ref_depth: int = DEFAULT_TYPE_REF_DEPTH,
+) -> str:
+    """Build the introspection query
+
+    Args:
+        operation_name: holds the name of the query operation
+        descriptions: if False, no descriptions are queried
+        include_deprecated: if False, deprecated fields and enum values are skipped
+        type_ref_depth: holds the number of nested `ofType` levels to query.
+            Type references that are nested deeper are cut off.
+
+    Returns:
+        the introspection query
+    """
+    fragments = build_introspection_fragments(
+        descriptions, include_deprecated, type_ref_depth
+    )
+    return (
+        f"query {operation_name} {{\n"
+        "  __schema {\n"
+        "    queryType { name }\n"
+        "    mutationType { name }\n"
+        "    subscriptionType { name }\n"
+        "    types {\n"
+        "      ...FullType\n"
+        "    }\n"
+        f"{_directives_selection(descriptions)}"
+        "  }\n"
+        "}\n"
+        f"{fragments}"
+    )
+
+
+def build_root_types_query(
+    operation_name: str = "RootTypesIntrospectionQuery",
+    descriptions: bool = True,
+    include_deprecated: bool = True,
+    type_ref_depth: int = DEFAULT_TYPE_REF_DEPTH,
+) -> str:
+    """Build the query to introspect only the root types and the directives
+
+    Args:
+        operation_name: holds the name of the query operation
+        descriptions: if False, no descriptions are queried
+        include_deprecated: if False, deprecated fields and enum values are skipped
+        type_ref_depth: holds the number of nested `ofType` levels to query.
+
+    Returns:
+        the root types introspection query
+    """
+    fragments = build_introspection_fragments(
+        descriptions, include_deprecated, type_ref_depth
+    )
+    return (
+        f"query {operation_name} {{\n"
+        "  __schema {\n"
+        "    queryType { ...FullType }\n"
+        "    mutationType { ...FullType }\n"
+        "    subscriptionType { ...FullType }\n"
+        f"{_directives_selection(descriptions)}"
+        "  }\n"
+        "}\n"
+        f"{fragments}"
+    )
+
+
+def build_types_query(
+    count: int,
+    operation_name: str = "TypesIntrospectionQuery",
+    descriptions: bool = True,
+    include_deprecated: bool = True,
+    type_ref_depth: int = DEFAULT_TYPE_REF_DEPTH,
+) -> str:
+    """Build the query to introspect the given number of types by their name
+
+    The names are passed as variables `$t0`, `$t1`, ...
+    and the types are returned under the aliases `t0`, `t1`, ...
+
+    Args:
+        count: holds the number of types to introspect
+        operation_name: holds the name of the query operation
+        descriptions: if False, no descriptions are queried
+        include_deprecated: if False, deprecated fields and enum values are skipped
+        type_ref_depth: holds the number of nested `ofType` levels to query.
+
+    Returns:
+        the types introspection query
+    """
+    fragments = build_introspection_fragments(
+        descriptions, include_deprecated, type_ref_depth
+    )
+    variables = ", ".join(f"$t{index}: String!" for index in range(count))
+    selections = "".join(
+        f"  t{index}: __type(name: $t{index}) {{ ...FullType }}\n"
+        for index in range(count)
+    )
+    return f"query {operation_name}({variables}) {{\n{selections}}}\n{fragments}"
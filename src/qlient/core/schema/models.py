@@ -1,7 +1,7 @@
 """This file contains the graphql schema"""
 import enum
 import logging
-from typing import Optional, Dict, List, Union, Any
+from typing import Optional, Dict, List, Union, Any, Mapping
 
 from qlient.core import __meta__
 
@@ -21,24 +21,65 @@ class Kind(enum.Enum):
     UNION = "UNION"
 
 
+def lookup_type(types: Mapping[str, "Type"], name: str) -> Optional["Type"]:
+    """Look up the type with the given name
+
+    Unlike `types.get(name)`, the lookup introspects types on demand
+    in the registries of partially introspected schemas.
+
+    Args:
+        types: holds the mapping of type name to type
+        name: holds the name of the type
+
+    Returns:
+        Either None (if there is no such type) or the type
+
+    Raises:
+        TypeNotLoaded when the type has to be introspected asynchronously first
+    """
+    try:
+        return types[name]
+    except KeyError:
+        return None
+
+
 class TypeRef:
     """Represents a basic graphql Type Reference"""
 
+    __slots__ = (
+        "kind",
+        "name",
+        "of_type_ref",
+        "_type",
+        "_types_registry",
+        "_graphql_representation",
+        "_leaf_type_name",
+        "_leaf_type",
+        "_canonical",
+    )
+
     kind: Optional[Kind]
     name: Optional[str]
     of_type_ref: Optional["TypeRef"]
     type: Optional["Type"]  # skipcq: PYL-W0622
 
     @classmethod
-    def parse(cls, type_ref: Union["TypeRef", Dict]) -> "TypeRef":
+    def parse(
+        cls,
+        type_ref: Union["TypeRef", Dict],
+        type_ref_pool: Optional["TypeRefPool"] = None,
+    ) -> "TypeRef":
         """Parse a single type reference
 
         Args:
             type_ref: holds the type reference to parse
+            type_ref_pool: optional, holds the pool to get the canonical type ref from
 
         Returns:
             the parsed type ref
         """
+        if type_ref_pool is not None:
+            return type_ref_pool.parse(type_ref)
         if isinstance(type_ref, dict):
             type_ref = cls(**type_ref)
         if not isinstance(type_ref, cls):
@@ -47,18 +88,21 @@ class TypeRef:
 
     @classmethod
     def parse_list(
-        cls, type_refs: Optional[List[Union["TypeRef", Dict]]]
+        cls,
+        type_refs: Optional[List[Union["TypeRef", Dict]]],
+        type_ref_pool: Optional["TypeRefPool"] = None,
     ) -> List["TypeRef"]:
         """Parse a list of type_refs
 
         Args:
             type_refs: holds the type_ref list to parse
+            type_ref_pool: optional, holds the pool to get the canonical type refs from
 
         Returns:
             a list of type_refs
         """
         return (
-            [cls.parse(type_ref) for type_ref in type_refs if type_ref]
+            [cls.parse(type_ref, type_ref_pool) for type_ref in type_refs if type_ref]
             if type_refs
             else []
         )
@@ -72,7 +116,29 @@ class TypeRef:
         self.kind = Kind(kind) if kind else None
         self.name = name
         self.of_type_ref = self.parse(ofType) if ofType else None
-        self.type: Optional["Type"] = None  # skipcq: PYL-W0622
+        self._type: Optional["Type"] = None
+        self._types_registry: Optional[Mapping[str, "Type"]] = None
+        # memoized derived values, see the according properties
+        self._graphql_representation: Optional[str] = None
+        self._leaf_type_name: Optional[str] = None
+        self._leaf_type: Optional["Type"] = None
+        # True if the type ref is shared by a pool, see `TypeRefPool`
+        self._canonical: bool = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the resolved types are not pickled, they are looked up again after unpickling.
+        # Otherwise pickling would recurse through the whole type graph.
+        return {
+            slot: getattr(self, slot)
+            for slot in self.__slots__
+            if slot not in ("_type", "_leaf_type")
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._type = None
+        self._leaf_type = None
+        for slot, value in state.items():
+            setattr(self, slot, value)
 
     def __str__(self) -> str:
         """Return a simple string representation of the type ref instance"""
@@ -90,6 +156,9 @@ class TypeRef:
         )
 
     def __gql__(self) -> str:
+        representation = self._graphql_representation
+        if representation is not None:
+            return representation
         representation = (
             self.of_type_ref.graphql_representation
             if self.of_type_ref is not None
@@ -99,89 +168,223 @@ class TypeRef:
             representation = f"{representation}!"
         if self.kind == Kind.LIST:
             representation = f"[{representation}]"
+        self._graphql_representation = representation
         return representation
 
-    def infer_type_refs(self, types_dict: Dict[str, "Type"]):
+    def infer_type_refs(self, types_dict: Mapping[str, "Type"]):
         """Method to recursively infer types down to the deepest type level
 
+        The actual type is only looked up the first time it is accessed.
+        This allows the types mapping to materialize types on demand.
+        Canonical type refs of a :ref:`TypeRefPool` are shared,
+        they stay linked with the registry of their pool and are not changed.
+
         Args:
             types_dict: holds the mapping of type name to type
         """
-        self.type = types_dict.get(self.name)
+        if self._canonical:
+            return
+        self._type = None
+        self._leaf_type = None
+        self._types_registry = types_dict
         if self.of_type_ref is not None:
             self.of_type_ref.infer_type_refs(types_dict)
 
+    @property
+    def type(self) -> Optional["Type"]:  # skipcq: PYL-W0622
+        """Property to return the type this type ref is pointing to
+
+        Returns:
+            Either None (if the types were not inferred yet) or the type
+        """
+        if self._type is None and self.name and self._types_registry is not None:
+            self._type = lookup_type(self._types_registry, self.name)
+        return self._type
+
     @property
     def graphql_representation(self) -> str:
         """Property for the graphql type representation
 
-        See docstring of :ref:`__gql__` for more information
+        See docstring of :ref:`__gql__` for more information.
+        The representation is only built once.
 
         Returns:
             the graphql type representation for this.
         """
         return self.__gql__()
 
+    @property
+    def leaf_type_ref(self) -> "TypeRef":
+        """Property to return the very last (leaf) `of_type` type reference
+
+        In contrast to :ref:`leaf_type`, the type itself is not looked up,
+        hence the kind of the leaf type is known without resolving the type.
+
+        Returns:
+            The very last (leaf) `of_type` Type Ref.
+        """
+        type_ref = self
+        while type_ref.of_type_ref is not None:
+            type_ref = type_ref.of_type_ref
+        return type_ref
+
     @property
     def leaf_type_name(self) -> Optional[str]:
         """Property to return the name of the very last (leaf) `of_type`
 
         As long as the `of_type` property is not None,
         it will call the `leaf_type_name` property of the `of_type`.
+        The name is only looked up once.
 
         Returns:
             The name of the very last (leaf) `of_type` Type Ref.
         """
-        return (
-            self.name if self.of_type_ref is None else self.of_type_ref.leaf_type_name
-        )
+        leaf_type_name = self._leaf_type_name
+        if leaf_type_name is None:
+            leaf_type_name = (
+                self.name
+                if self.of_type_ref is None
+                else self.of_type_ref.leaf_type_name
+            )
+            self._leaf_type_name = leaf_type_name
+        return leaf_type_name
 
     @property
     def leaf_type(self) -> Optional["Type"]:
         """Property to return the very last (leaf) `of_type` type.
 
+        The type is only looked up once it could be resolved.
+
         Returns:
             The type of the very last (leaf) `of_type`
         """
-        return self.type if self.of_type_ref is None else self.of_type_ref.leaf_type
+        leaf_type = self._leaf_type
+        if leaf_type is None:
+            leaf_type = (
+                self.type if self.of_type_ref is None else self.of_type_ref.leaf_type
+            )
+            self._leaf_type = leaf_type
+        return leaf_type
+
+
+class TypeRefPool:
+    """Canonicalizing factory for type references.
+
+    Each distinct `(kind, name, ofType)` chain is only created once
+    and the same instance is handed out every time it is parsed again.
+    This means that for example `[ID!]!` exists only once per schema
+    and two type references are equal if they are identical.
+
+    The type references handed out by the pool are shared,
+    hence they must not be changed.
+
+    Args:
+        types_registry: optional, holds the mapping of type name to type
+            that the type references are linked with.
+    """
+
+    __slots__ = ("types_registry", "_type_refs")
+
+    def __init__(self, types_registry: Optional[Mapping[str, "Type"]] = None):
+        self.types_registry: Optional[Mapping[str, "Type"]] = types_registry
+        self._type_refs: Dict[tuple, TypeRef] = {}
+
+    def parse(self, type_ref: Union[TypeRef, Dict]) -> TypeRef:
+        """Return the canonical type reference
+
+        Args:
+            type_ref: holds the type reference to parse
+
+        Returns:
+            the canonical type ref
+        """
+        if isinstance(type_ref, dict):
+            kind = type_ref.get("kind")
+            name = type_ref.get("name")
+            of_type = type_ref.get("ofType")
+        elif isinstance(type_ref, TypeRef):
+            kind = type_ref.kind.value if type_ref.kind else None
+            name = type_ref.name
+            of_type = type_ref.of_type_ref
+        else:
+            raise TypeError(f"Expected dict, {TypeRef.__name__} got {type(type_ref)}")
+        of_type_ref = self.parse(of_type) if of_type else None
+        # the nested type ref is canonical, hence its identity is a valid key
+        key = (kind, name, of_type_ref)
+        try:
+            return self._type_refs[key]
+        except KeyError:
+            pass
+        canonical = TypeRef(kind=kind, name=name, ofType=of_type_ref)
+        canonical._types_registry = self.types_registry
+        canonical._canonical = True
+        return self._type_refs.setdefault(key, canonical)
+
+    def __len__(self) -> int:
+        return len(self._type_refs)
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the type ref pool"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the type ref pool"""
+        class_name = self.__class__.__name__
+        return f"<{class_name}(type_refs={len(self)})>"
 
 
 class Input:
     """Represents a basic graphql Input"""
 
+    __slots__ = ("name", "description", "type", "default_value")
+
     name: Optional[str]
     description: Optional[str]
     type: Optional[TypeRef]  # skipcq: PYL-W0622
     default_value: Optional[Any]
 
     @classmethod
-    def parse(cls, input_value: Union["Input", Dict]) -> "Input":
+    def parse(
+        cls,
+        input_value: Union["Input", Dict],
+        type_ref_pool: Optional["TypeRefPool"] = None,
+    ) -> "Input":
         """Parse a single input value
 
         Args:
             input_value: holds the input value to parse
+            type_ref_pool: optional, holds the pool to get canonical type refs from
 
         Returns:
             the parsed input
         """
         if isinstance(input_value, dict):
-            input_value = cls(**input_value)
+            input_value = cls(**input_value, type_ref_pool=type_ref_pool)
         if not isinstance(input_value, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(input_value)}")
         return input_value
 
     @classmethod
-    def parse_list(cls, inputs: Optional[List[Union["Input", Dict]]]) -> List["Input"]:
+    def parse_list(
+        cls,
+        inputs: Optional[List[Union["Input", Dict]]],
+        type_ref_pool: Optional["TypeRefPool"] = None,
+    ) -> List["Input"]:
         """Parse a list of inputs
 
         Args:
             inputs: holds the input list to parse
+            type_ref_pool: optional, holds the pool to get canonical type refs from
 
         Returns:
             a list of inputs
         """
         return (
-            [cls.parse(input_value) for input_value in inputs if input_value]
+            [
+                cls.parse(input_value, type_ref_pool)
+                for input_value in inputs
+                if input_value
+            ]
             if inputs
             else []
         )
@@ -193,10 +396,11 @@ class Input:
         # skipcq: PYL-W0622
         type: Optional[TypeRef] = None,  # noqa
         defaultValue: Optional[Any] = None,  # noqa
+        type_ref_pool: Optional["TypeRefPool"] = None,
     ):
         self.name = name
         self.description = description
-        self.type = TypeRef.parse(type) if type else None
+        self.type = TypeRef.parse(type, type_ref_pool) if type else None
         self.default_value = defaultValue
 
     def __str__(self) -> str:
@@ -212,41 +416,55 @@ class Input:
 class Directive:
     """Represents a basic graphql Directive"""
 
+    __slots__ = ("name", "description", "locations", "args", "_arg_name_to_arg")
+
     name: Optional[str]
     description: Optional[str]
     locations: Optional[List[str]]
     args: Optional[List[Input]]
 
     @classmethod
-    def parse(cls, directive: Union["Directive", Dict]) -> "Directive":
+    def parse(
+        cls,
+        directive: Union["Directive", Dict],
+        type_ref_pool: Optional["TypeRefPool"] = None,
+    ) -> "Directive":
         """Parse a single directive
 
         Args:
             directive: holds the directive to parse
+            type_ref_pool: optional, holds the pool to get canonical type refs from
 
         Returns:
             the parsed directive
         """
         if isinstance(directive, dict):
-            directive = cls(**directive)
+            directive = cls(**directive, type_ref_pool=type_ref_pool)
         if not isinstance(directive, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(directive)}")
         return directive
 
     @classmethod
     def parse_list(
-        cls, directives: Optional[List[Union["Directive", Dict]]]
+        cls,
+        directives: Optional[List[Union["Directive", Dict]]],
+        type_ref_pool: Optional["TypeRefPool"] = None,
     ) -> List["Directive"]:
         """Parse a list of directives
 
         Args:
             directives: holds the directive list to parse
+            type_ref_pool: optional, holds the pool to get canonical type refs from
 
         Returns:
             a list of directives
         """
         return (
-            [cls.parse(directive) for directive in directives if directive]
+            [
+                cls.parse(directive, type_ref_pool)
+                for directive in directives
+                if directive
+            ]
             if directives
             else []
         )
@@ -257,20 +475,26 @@ class Directive:
         description: Optional[str] = None,
         locations: Optional[List[str]] = None,
         args: Optional[List[Input]] = None,
+        type_ref_pool: Optional["TypeRefPool"] = None,
     ):
         self.name: Optional[str] = name
         self.description: Optional[str] = description
         self.locations: Optional[List[str]] = locations
-        self.args: List[Input] = Input.parse_list(args)
+        self.args: List[Input] = Input.parse_list(args, type_ref_pool)
+        self._arg_name_to_arg: Optional[Dict[str, Input]] = None
 
     @property
     def arg_name_to_arg(self) -> Dict[str, Input]:
         """Property for mapping the argument name to the argument for faster lookups
 
+        The mapping is only built once, on first access.
+
         Returns:
             A dictionary where the argument name is mapped to the argument itself
         """
-        return {arg.name: arg for arg in self.args}
+        if self._arg_name_to_arg is None:
+            self._arg_name_to_arg = {arg.name: arg for arg in self.args}
+        return self._arg_name_to_arg
 
     def __str__(self) -> str:
         """Return a simple string representation of the directive instance"""
@@ -285,6 +509,16 @@ class Directive:
 class Field:
     """Represents a basic graphql Field"""
 
+    __slots__ = (
+        "name",
+        "description",
+        "args",
+        "type",
+        "is_deprecated",
+        "deprecation_reason",
+        "_arg_name_to_arg",
+    )
+
     name: Optional[str]
     description: Optional[str]
     args: Optional[List[Input]]
@@ -293,32 +527,46 @@ class Field:
     deprecation_reason: Optional[str]
 
     @classmethod
-    def parse(cls, field: Union["Field", Dict]) -> "Field":
+    def parse(
+        cls,
+        field: Union["Field", Dict],
+        type_ref_pool: Optional["TypeRefPool"] = None,
+    ) -> "Field":
         """Parse a single field
 
         Args:
             field: holds the field to parse
+            type_ref_pool: optional, holds the pool to get canonical type refs from
 
         Returns:
             the parsed field
         """
         if isinstance(field, dict):
-            field = cls(**field)
+            field = cls(**field, type_ref_pool=type_ref_pool)
         if not isinstance(field, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(field)}")
         return field
 
     @classmethod
-    def parse_list(cls, fields: Optional[List[Union["Field", Dict]]]) -> List["Field"]:
+    def parse_list(
+        cls,
+        fields: Optional[List[Union["Field", Dict]]],
+        type_ref_pool: Optional["TypeRefPool"] = None,
+    ) -> List["Field"]:
         """Parse a list of fields
 
         Args:
             fields: holds the field list to parse
+            type_ref_pool: optional, holds the pool to get canonical type refs from
 
         Returns:
             a list of fields
         """
-        return [cls.parse(field) for field in fields if field] if fields else []
+        return (
+            [cls.parse(field, type_ref_pool) for field in fields if field]
+            if fields
+            else []
+        )
 
     def __init__(
         self,
@@ -329,15 +577,17 @@ class Field:
         type: Optional[TypeRef] = None,  # noqa
         isDeprecated: Optional[bool] = None,  # noqa
         deprecationReason: Optional[str] = None,  # noqa
+        type_ref_pool: Optional["TypeRefPool"] = None,
     ):
         self.name: Optional[str] = name
         self.description: Optional[str] = description
-        self.args: List[Input] = Input.parse_list(args)
+        self.args: List[Input] = Input.parse_list(args, type_ref_pool)
         self.type: Optional[TypeRef] = (
-            TypeRef.parse(type) if type else None
+            TypeRef.parse(type, type_ref_pool) if type else None
         )  # skipcq: PYL-W0622
         self.is_deprecated: Optional[bool] = isDeprecated
         self.deprecation_reason: Optional[str] = deprecationReason
+        self._arg_name_to_arg: Optional[Dict[str, Input]] = None
 
     def __str__(self) -> str:
         """Return a simple string representation of the field instance"""
@@ -352,10 +602,14 @@ class Field:
     def arg_name_to_arg(self) -> Dict[str, Input]:
         """Property for mapping the argument name to the argument for faster lookups
 
+        The mapping is only built once, on first access.
+
         Returns:
             A dictionary where the argument name is mapped to the argument itself
         """
-        return {arg.name: arg for arg in self.args}
+        if self._arg_name_to_arg is None:
+            self._arg_name_to_arg = {arg.name: arg for arg in self.args}
+        return self._arg_name_to_arg
 
     @property
     def output_type(self) -> Optional["Type"]:
@@ -378,20 +632,41 @@ class Field:
             return None
         return leaf_type.name
 
+    @property
+    def output_kind(self) -> Optional[Kind]:
+        """Property to return the kind of the output type
+
+        The kind is taken from the leaf type reference,
+        so the output type itself only has to be looked up
+        if the type reference does not know its kind.
+
+        Returns:
+            Either None (if the kind is unknown) or the kind of the output type
+        """
+        if self.type is None:
+            return None
+        kind = self.type.leaf_type_ref.kind
+        if kind is None:
+            output_type = self.output_type
+            kind = output_type.kind if output_type is not None else None
+        return kind
+
     @property
     def is_object_kind(self) -> bool:
         """True if the field type is of kind OBJECT"""
-        return self.output_type and self.output_type.kind == Kind.OBJECT
+        return self.output_kind == Kind.OBJECT
 
     @property
     def is_scalar_kind(self) -> bool:
         """True if the field type is of kind SCALAR"""
-        return self.output_type and self.output_type.kind == Kind.SCALAR
+        return self.output_kind == Kind.SCALAR
 
 
 class EnumValue:
     """Represents a basic graphql enum value"""
 
+    __slots__ = ("name", "description", "is_deprecated", "deprecation_reason")
+
     @classmethod
     def parse(cls, enum_value: Union["EnumValue", Dict]) -> "EnumValue":
         """Parse a single field
@@ -451,6 +726,18 @@ class EnumValue:
 class Type:
     """Represents a basic graphql Type"""
 
+    __slots__ = (
+        "kind",
+        "name",
+        "description",
+        "fields",
+        "input_fields",
+        "interfaces",
+        "enum_values",
+        "possible_types",
+        "_field_name_to_field",
+    )
+
     kind: Optional[Kind]
     name: Optional[str]
     description: Optional[str]
@@ -461,17 +748,22 @@ class Type:
     possible_types: Optional[List[TypeRef]]
 
     @classmethod
-    def parse(cls, type_value: Union["Type", Dict]) -> "Type":
+    def parse(
+        cls,
+        type_value: Union["Type", Dict],
+        type_ref_pool: Optional["TypeRefPool"] = None,
+    ) -> "Type":
         """Parse a single field
 
         Args:
             type_value: holds the field to parse
+            type_ref_pool: optional, holds the pool to get canonical type refs from
 
         Returns:
             the parsed field
         """
         if isinstance(type_value, dict):
-            type_value = cls(**type_value)
+            type_value = cls(**type_value, type_ref_pool=type_ref_pool)
         if not isinstance(type_value, cls):
             raise TypeError(f"Expected dict, {cls.__name__} got {type(type_value)}")
         return type_value
@@ -486,17 +778,21 @@ class Type:
         interfaces: Optional[List[Union[TypeRef, Dict]]] = None,
         enumValues: Optional[List[Union[EnumValue, Dict]]] = None,  # noqa
         possibleTypes: Optional[List[Union[TypeRef, Dict]]] = None,  # noqa
+        type_ref_pool: Optional["TypeRefPool"] = None,
     ):
         self.kind: Optional[Kind] = Kind(kind) if kind else None
         self.name: Optional[str] = name
         self.description: Optional[str] = description
-        self.fields: List[Field] = Field.parse_list(fields)
-        self.input_fields: List[Input] = Input.parse_list(inputFields)
-        self.interfaces: List[TypeRef] = TypeRef.parse_list(interfaces)
+        self.fields: List[Field] = Field.parse_list(fields, type_ref_pool)
+        self.input_fields: List[Input] = Input.parse_list(inputFields, type_ref_pool)
+        self.interfaces: List[TypeRef] = TypeRef.parse_list(interfaces, type_ref_pool)
         self.enum_values: List[EnumValue] = EnumValue.parse_list(enumValues)
-        self.possible_types: List[TypeRef] = TypeRef.parse_list(possibleTypes)
+        self.possible_types: List[TypeRef] = TypeRef.parse_list(
+            possibleTypes, type_ref_pool
+        )
+        self._field_name_to_field: Optional[Dict[str, Field]] = None
 
-    def infer_types(self, types_dict: Dict[str, "Type"]):
+    def infer_types(self, types_dict: Mapping[str, "Type"]):
         """Method to infer the types for all graphql schema types.
 
         This method iterates over each and all fields,
@@ -527,13 +823,17 @@ class Type:
     def field_name_to_field(self) -> Dict[str, Field]:
         """Property for mapping the field name to the field for faster lookups
 
+        The mapping is only built once, on first access.
+
         Returns:
             A dictionary where the field name is mapped to the field itself
         """
-        return {
-            field.name: field
-            for field in self.fields or []  # because self.fields might be None
-        }
+        if self._field_name_to_field is None:
+            self._field_name_to_field = {
+                field.name: field
+                for field in self.fields or []  # because self.fields might be None
+            }
+        return self._field_name_to_field
 
     def __str__(self) -> str:
         """Return a simple string representation of the type instance"""
@@ -1,38 +1,97 @@
 """This file contains the graphql schema parser functions"""
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Mapping, Iterator
 
 from qlient.core._types import RawSchema
 from qlient.core.exceptions import NoTypesFound
-from qlient.core.schema.models import Type, Directive
+from qlient.core.schema.models import Type, Directive, TypeRefPool, lookup_type
 
 
 class ParseResult:
-    """Represents a parsed graphql schema"""
+    """Represents a parsed graphql schema
+
+    The fingerprint is only set by parsers that compute it on the way,
+    like the streaming parser, and is stored in schema snapshots.
+    """
 
     def __init__(
         self,
         query_type: Optional[Type] = None,
         mutation_type: Optional[Type] = None,
         subscription_type: Optional[Type] = None,
-        types: Optional[Dict[str, Type]] = None,
+        types: Optional[Mapping[str, Type]] = None,
         directives: Optional[Dict[str, Directive]] = None,
+        fingerprint: Optional[str] = None,
     ):
         self.query_type: Optional[Type] = query_type
         self.mutation_type: Optional[Type] = mutation_type
         self.subscription_type: Optional[Type] = subscription_type
-        self.types: Dict[str, Type] = types
+        self.types: Mapping[str, Type] = types
         self.directives: Optional[Dict[str, Directive]] = directives
+        self.fingerprint: Optional[str] = fingerprint
+
+
+class LazyTypesRegistry(Mapping[str, Type]):
+    """Represents a mapping of type names to types that parses types on demand.
+
+    A type is only parsed and linked the first time it is accessed.
+    All type names are known upfront,
+    so iterating over the registry or checking membership is cheap.
+    Iterating over the values however materializes every single type.
+    """
+
+    def __init__(self, types_list: List[Dict]):
+        self._raw_types: Dict[str, Dict] = {
+            type_dict["name"]: type_dict for type_dict in types_list if type_dict
+        }
+        self._types: Dict[str, Type] = {}
+        self.type_ref_pool: TypeRefPool = TypeRefPool(self)
+
+    def __getitem__(self, key: str) -> Type:
+        try:
+            return self._types[key]
+        except KeyError:
+            pass
+        _type = self._parse_type(self._raw_types[key])
+        # if another thread was faster, keep the type that got registered first
+        return self._types.setdefault(key, _type)
+
+    # skipcq: PY-D0003
+    def _parse_type(self, raw_type: Dict) -> Type:
+        return Type.parse(raw_type, self.type_ref_pool)
+
+    def __contains__(self, key) -> bool:
+        return key in self._raw_types
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw_types)
+
+    def __len__(self) -> int:
+        return len(self._raw_types)
+
+    @property
+    def materialized(self) -> List[str]:
+        """Property to list the names of all types that have been parsed so far"""
+        return list(self._types.keys())
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the registry"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the registry"""
+        class_name = self.__class__.__name__
+        return f"<{class_name}(types={len(self)}, materialized={len(self._types)})>"
 
 
-def extract_type(type_name: Optional[str], types: Dict[str, Type]) -> Optional[Type]:
+def extract_type(type_name: Optional[str], types: Mapping[str, Type]) -> Optional[Type]:
     """Extract a type from all types"""
     if not type_name:
         return None
-    return types.get(type_name)
+    return lookup_type(types, type_name)
 
 
 def extract_query_type(
-    schema: Dict, types: Optional[Dict[str, Type]]
+    schema: Dict, types: Optional[Mapping[str, Type]]
 ) -> Optional[Type]:
     """Extract the name of the query type from the schema"""
     query_type: Optional[Dict] = schema.get("queryType")
@@ -41,7 +100,7 @@ def extract_query_type(
 
 
 def extract_mutation_type(
-    schema: Dict, types: Optional[Dict[str, Type]]
+    schema: Dict, types: Optional[Mapping[str, Type]]
 ) -> Optional[Type]:
     """Extract the name of the mutation type from the schema"""
     mutation_type: Optional[Dict] = schema.get("mutationType")
@@ -52,7 +111,7 @@ def extract_mutation_type(
 
 
 def extract_subscription_type(
-    schema: Dict, types: Optional[Dict[str, Type]]
+    schema: Dict, types: Optional[Mapping[str, Type]]
 ) -> Optional[Type]:
     """Extract the name of the subscription type from the schema"""
     subscription_type: Optional[Dict] = schema.get("subscriptionType")
@@ -62,7 +121,9 @@ def extract_subscription_type(
     return extract_type(subscription_type_name, types)
 
 
-def parse_types(schema: Dict) -> Dict[str, Type]:
+def parse_types(
+    schema: Dict, type_ref_pool: Optional[TypeRefPool] = None
+) -> Dict[str, Type]:
     """Parse/Extract all types from the schema
 
     The types are required.
@@ -72,8 +133,12 @@ def parse_types(schema: Dict) -> Dict[str, Type]:
     This function returns a dictionary where each Type is associated with its name.
     This is possible due to the fact that a type name must be unique.
 
+    All type references are canonical and already linked to the returned types.
+
     Args:
         schema: holds the schema to parse
+        type_ref_pool: optional, holds an empty pool to create the type refs with,
+            its registry is set to the returned types
 
     Returns:
         holds a dictionary where each type name is mapped to it's parsed type
@@ -82,19 +147,43 @@ def parse_types(schema: Dict) -> Dict[str, Type]:
     if not types_list:
         raise NoTypesFound(schema)
 
-    types_list: List[Type] = [
-        Type.parse(type_dict) for type_dict in types_list if type_dict
-    ]
+    types_dict: Dict[str, Type] = {}
+    if type_ref_pool is None:
+        type_ref_pool = TypeRefPool()
+    type_ref_pool.types_registry = types_dict
+    for type_dict in types_list:
+        if not type_dict:
+            continue
+        _type = Type.parse(type_dict, type_ref_pool)
+        types_dict[_type.name] = _type
+
+    return types_dict
 
-    types_dict: Dict[str, Type] = {_type.name: _type for _type in types_list if _type}
 
-    for _type in types_dict.values():
-        _type.infer_types(types_dict)
+def parse_types_lazy(schema: Dict) -> LazyTypesRegistry:
+    """Create a registry of all types in the schema that parses each type on demand
 
-    return types_dict
+    In contrast to :ref:`parse_types`, no type is parsed upfront.
+    This keeps the startup cost proportional to the number of types actually used.
 
+    Args:
+        schema: holds the schema to parse
 
-def parse_directives(schema: Dict) -> Optional[Dict[str, Directive]]:
+    Returns:
+        holds a registry where each type name is mapped to it's (lazily) parsed type
+    """
+    types_list: List[Dict] = schema.get("types", [])
+    if not types_list:
+        raise NoTypesFound(schema)
+
+    return LazyTypesRegistry(types_list)
+
+
+def parse_directives(
+    schema: Dict,
+    types: Optional[Mapping[str, Type]] = None,
+    type_ref_pool: Optional[TypeRefPool] = None,
+) -> Optional[Dict[str, Directive]]:
     """Parse the directives of the schema
 
     A directive is an identifier preceded by a @ character,
@@ -104,6 +193,10 @@ def parse_directives(schema: Dict) -> Optional[Dict[str, Directive]]:
 
     Args:
         schema: holds the schema to parse
+        types: optional, holds the types to link the directive arguments with
+        type_ref_pool: optional, holds the pool of the schema to share
+            the type refs with. Defaults to the pool of the types registry
+            or a new pool.
 
     Returns:
         either None or a dictionary of directive names matching the directive
@@ -112,29 +205,40 @@ def parse_directives(schema: Dict) -> Optional[Dict[str, Directive]]:
     if not directives_list:
         return None
 
+    if type_ref_pool is None:
+        type_ref_pool = getattr(types, "type_ref_pool", None)
+    if type_ref_pool is None:
+        type_ref_pool = TypeRefPool(types)
+
     directives_dict: Dict[str, Directive] = {
         _directive.name: _directive
-        for _directive in Directive.parse_list(directives_list)
+        for _directive in Directive.parse_list(directives_list, type_ref_pool)
         if _directive
     }
 
     return directives_dict
 
 
-def parse_schema(schema: RawSchema) -> ParseResult:
+def parse_schema(schema: RawSchema, lazy: bool = False) -> ParseResult:
     """Parse the given graphql schema and return the parsed result
 
     Args:
         schema: holds the raw schema as a dictionary
+        lazy: if True, the types are only parsed the first time they are accessed
 
     Returns:
         parse result with all types, directives and stuff
     """
-    types = parse_types(schema)
+    if lazy:
+        types = parse_types_lazy(schema)
+        type_ref_pool = types.type_ref_pool
+    else:
+        type_ref_pool = TypeRefPool()
+        types = parse_types(schema, type_ref_pool)
     return ParseResult(
         query_type=extract_query_type(schema, types),
         mutation_type=extract_mutation_type(schema, types),
         subscription_type=extract_subscription_type(schema, types),
         types=types,
-        directives=parse_directives(schema),
+        directives=parse_directives(schema, types, type_ref_pool),
     )
@@ -0,0 +1,195 @@
+"""This file contains the registry of partially introspected schemas
+
+Big schemas are expensive to introspect, although a client often
+only uses a handful of their types.
+A partially introspected schema starts with the root types and the directives
+and introspects every other type the first time it is accessed.
+"""
+import logging
+import threading
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Mapping
+from typing import Optional
+
+from qlient.core import __meta__
+from qlient.core.exceptions import TypeNotLoaded
+from qlient.core.schema.models import Kind, Type, TypeRefPool
+
+logger = logging.getLogger(__meta__.__title__)
+
+# the built-in scalars are never introspected
+BUILTIN_SCALARS = ("String", "Int", "Float", "Boolean", "ID")
+
+RawTypes = Dict[str, Optional[Dict]]
+FetchTypes = Callable[[List[str]], RawTypes]
+FetchTypesAsync = Callable[[List[str]], Awaitable[RawTypes]]
+
+
+class RemoteTypesRegistry(Mapping[str, Type]):
+    """Represents a mapping of type names to types that introspects types on demand.
+
+    A type that is not loaded yet is introspected the first time it is accessed
+    with `registry[name]`.
+    Unlike the :ref:`LazyTypesRegistry`, the type names are not known upfront,
+    hence iterating over the registry only covers the types loaded so far.
+    For the same reason, `name in registry` and `registry.get(name)`
+    only check the types loaded so far and never introspect a type.
+
+    Args:
+        fetch_types: optional, holds the function to introspect types by their names.
+            Without it, accessing a type that is not loaded yet raises
+            :ref:`TypeNotLoaded`.
+        fetch_types_async: optional, holds the coroutine function
+            to introspect types by their names
+    """
+
+    def __init__(
+        self,
+        fetch_types: Optional[FetchTypes] = None,
+        fetch_types_async: Optional[FetchTypesAsync] = None,
+    ):
+        self.fetch_types: Optional[FetchTypes] = fetch_types
+        self.fetch_types_async: Optional[FetchTypesAsync] = fetch_types_async
+        self.type_ref_pool: TypeRefPool = TypeRefPool(self)
+        self._types: Dict[str, Type] = {
+            name: Type(Kind.SCALAR, name) for name in BUILTIN_SCALARS
+        }
+        self._missing: set = set()
+        # type names that were asked for but could not be fetched synchronously
+        self._pending: set = set()
+        self._lock = threading.Lock()
+
+    def add_raw_types(self, raw_types: RawTypes):
+        """Parse and register the introspected types
+
+        Args:
+            raw_types: holds the type names mapped to their introspected types.
+                Types that do not exist in the schema are mapped to None.
+        """
+        for name, raw_type in raw_types.items():
+            self._pending.discard(name)
+            if raw_type is None:
+                self._missing.add(name)
+                continue
+            _type = Type.parse(raw_type, self.type_ref_pool)
+            # if another thread was faster, keep the type that got registered first
+            self._types.setdefault(_type.name, _type)
+
+    def unknown(self, names: Iterable[str]) -> List[str]:
+        """Return the names of the types that were not introspected yet
+
+        Args:
+            names: holds the type names to check
+
+        Returns:
+            the distinct type names that are neither loaded nor missing
+        """
+        unknown = []
+        for name in names:
+            if (
+                name
+                and name not in self._types
+                and name not in self._missing
+                and name not in unknown
+            ):
+                unknown.append(name)
+        return unknown
+
+    def load(self, names: Iterable[str]):
+        """Introspect all given types that are not loaded yet with a single request
+
+        Args:
+            names: holds the names of the types to load
+
+        Raises:
+            TypeNotLoaded when the types can not be introspected synchronously
+        """
+        names = self.unknown(names)
+        if not names:
+            return
+        if self.fetch_types is None:
+            self._pending.update(names)
+            raise TypeNotLoaded(self, self.unknown(self._pending))
+        with self._lock:
+            names = self.unknown(names)
+            if names:
+                logger.debug(f"Introspecting types {names}")
+                self.add_raw_types(self.fetch_types(names))
+
+    def prefetch(self, names: Iterable[str]):
+        """Introspect the given types ahead of their first access
+
+        Batching the types that will be accessed next
+        saves a request for each single one of them.
+        Registries that can not introspect synchronously remember the names
+        and load them together with the next type that is not loaded.
+
+        Args:
+            names: holds the names of the types to load
+        """
+        if self.fetch_types is None:
+            self._pending.update(self.unknown(names))
+            return
+        self.load(names)
+
+    async def load_async(self, names: Iterable[str]):
+        """Introspect all given types that are not loaded yet with a single request
+
+        Args:
+            names: holds the names of the types to load
+
+        Raises:
+            TypeNotLoaded when the registry has no async fetch function
+        """
+        names = self.unknown(names)
+        if not names:
+            return
+        if self.fetch_types_async is None:
+            raise TypeNotLoaded(self, names)
+        logger.debug(f"Introspecting types {names}")
+        self.add_raw_types(await self.fetch_types_async(names))
+
+    def __getitem__(self, key: str) -> Type:
+        try:
+            return self._types[key]
+        except KeyError:
+            pass
+        if key not in self._missing:
+            self.load([key])
+        if key in self._missing:
+            raise KeyError(key)
+        return self._types[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._types
+
+    def get(self, key: str, default: Optional[Type] = None) -> Optional[Type]:
+        """Return the loaded type with the given name
+
+        Args:
+            key: holds the name of the type
+            default: holds the value to return if the type is not loaded
+
+        Returns:
+            Either the default (if the type is not loaded) or the type
+        """
+        return self._types.get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._types))
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    @property
+    def materialized(self) -> List[str]:
+        """Property to list the names of all types that have been loaded so far"""
+        return list(self._types.keys())
+
+    def __str__(self) -> str:
+        """Return a simple string representation of the registry"""
+        return repr(self)
+
+    def __repr__(self) -> str:
+        """Return a more detailed string representation of the registry"""
+        class_name = self.__class__.__name__
+        return f"<{class_name}(materialized={len(self)})>"
@@ -1,15 +1,50 @@
 """This module contains different schema providers"""
 import abc
 import io
+import json
 import logging
 import pathlib
-from typing import Union, IO
+import types
+from typing import Dict, IO, List, Optional, Tuple, Union
 
 from qlient.core import __meta__
-from qlient.core._internal import await_if_coro
+from qlient.core._internal import Executor, await_if_coro, run_in_executor
+from qlient.core._types import RawSchema
 from qlient.core.backends import Backend
-from qlient.core.models import GraphQLRequest
+from qlient.core.exceptions import SchemaException
+from qlient.core.models import GraphQLRequest, GraphQLResponse
+from qlient.core.schema.cache import (
+    IntrospectionCache,
+    IntrospectionCacheEntry,
+    SCHEMA_VALIDATOR_OPERATION_NAME,
+    SCHEMA_VALIDATOR_QUERY,
+    build_schema_validator_query,
+    compute_schema_validator,
+)
+from qlient.core.schema.codegen import load_schema_module
+from qlient.core.schema.fingerprint import fingerprint_raw_schema
+from qlient.core.schema.introspection import (
+    DEFAULT_TYPE_REF_DEPTH,
+    build_introspection_query,
+    build_root_types_query,
+    build_types_query,
+)
+from qlient.core.schema.parser import (
+    ParseResult,
+    extract_type,
+    parse_directives,
+    parse_schema,
+)
+from qlient.core.schema.partial import RemoteTypesRegistry
 from qlient.core.schema.schema import Schema
+from qlient.core.schema.snapshot import (
+    content_hash,
+    file_content_hash,
+    snapshot_path,
+    load_snapshot,
+    dump_snapshot,
+)
+from qlient.core.schema.streaming import parse_schema_stream
 
 logger = logging.getLogger(__meta__.__title__)
 
@@ -34,10 +69,77 @@ class SchemaProvider(abc.ABC):
         raise NotImplementedError
 
 
+def unwrap_introspection_result(raw_schema: RawSchema) -> RawSchema:
+    """Return the schema of a full introspection result
+
+    Schema files are often the dumped response of an introspection query.
+    Those wrap the schema inside of `{"data": {"__schema": ...}}`.
+
+    Args:
+        raw_schema: holds either the raw schema or a full introspection result
+
+    Returns:
+        the raw schema
+    """
+    if isinstance(raw_schema.get("data"), dict):
+        raw_schema = raw_schema["data"]
+    if isinstance(raw_schema.get("__schema"), dict):
+        raw_schema = raw_schema["__schema"]
+    return raw_schema
+
+
+def parse_schema_content(
+    content: Union[str, bytes],
+    lazy: bool = False,
+    keep_raw_schema: bool = True,
+) -> Tuple[ParseResult, Optional[RawSchema]]:
+    """Decode and parse the content of a schema file
+
+    Args:
+        content: holds the json content of the schema file
+        lazy: if True, the schema types are only parsed the first time they are used
+        keep_raw_schema: if False, the raw schema is not returned.
+            The parse result then holds the fingerprint instead.
+
+    Returns:
+        the parse result and, if kept, the raw schema
+    """
+    raw_schema = unwrap_introspection_result(json.loads(content))
+    parse_result = parse_schema(raw_schema, lazy=lazy)
+    if keep_raw_schema:
+        return parse_result, raw_schema
+    parse_result.fingerprint = fingerprint_raw_schema(raw_schema)
+    return parse_result, None
+
+
 class FileSchemaProvider(SchemaProvider):
-    """Schema provider to read the schema from the file."""
+    """Schema provider to read the schema from the file.
 
-    def __init__(self, file: Union[str, pathlib.Path, IO, io.IOBase]):
+    Args:
+        file: holds the path to or the file object of the schema file
+        lazy: if True, the schema types are only parsed the first time they are used
+        snapshot_dir: optional, holds the directory to cache pre-parsed schemas in.
+            The snapshots are keyed by the content hash of the schema file,
+            hence a changed schema file never loads an outdated snapshot.
+            Warning: snapshots are pickled and loading them can run arbitrary code.
+            Only use a directory that no other user can write to;
+            snapshots that are not owned by the current user
+            or that other users can modify are ignored.
+        streaming: if True, the file is read chunk by chunk
+            and the types are parsed one at a time.
+            This keeps the peak memory low but can not be combined with `lazy`.
+        keep_raw_schema: if False, the schema does not hold on to the raw schema.
+            Such schemas are compared by their fingerprint instead.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, pathlib.Path, IO, io.IOBase],
+        lazy: bool = False,
+        snapshot_dir: Union[str, pathlib.Path, None] = None,
+        streaming: bool = False,
+        keep_raw_schema: bool = True,
+    ):
         filepath = None
         if isinstance(file, str):
             file = pathlib.Path(file)
@@ -46,18 +148,145 @@ class FileSchemaProvider(SchemaProvider):
             file = file.open("r")
         self.filepath: str = filepath or getattr(file, "name", None)
         self.file = file
+        self.lazy: bool = lazy
+        self.snapshot_dir: Optional[pathlib.Path] = (
+            pathlib.Path(snapshot_dir) if snapshot_dir is not None else None
+        )
+        self.streaming: bool = streaming
+        self.keep_raw_schema: bool = keep_raw_schema
 
     def load_schema(self) -> Schema:
         """Method to load the schema from the local file
 
+        When a snapshot directory is given and a snapshot of the file exists,
+        the schema is loaded from the snapshot instead.
+        Note that a schema loaded from a snapshot does not hold the raw schema.
+
+        Returns:
+            the schema from the file
+        """
+        logger.debug(f"Reading local schema from `{self.file}`")
+        if self.snapshot_dir is None:
+            return self._parse_schema(lazy=self.lazy)
+
+        if self.streaming:
+            # hash the file chunk by chunk and read it again for parsing
+            source_hash = file_content_hash(self.file)
+            self.file.seek(0)
+            content = None
+        else:
+            content = self.file.read()
+            source_hash = content_hash(content)
+
+        path = snapshot_path(self.snapshot_dir, source_hash)
+        parse_result = load_snapshot(path, source_hash)
+        if parse_result is not None:
+            return Schema.from_parse_result(parse_result, self)
+
+        # the snapshot holds the full schema, hence never parse it lazily here
+        schema = self._parse_schema(content=content)
+        try:
+            dump_snapshot(schema.parse_result, path, source_hash)
+        except OSError as e:
+            logger.warning(f"Unable to write schema snapshot `{path}`: {e}")
+        return schema
+
+    # skipcq: PY-D0003
+    def _parse_schema(
+        self,
+        content: Union[str, bytes, None] = None,
+        lazy: bool = False,
+    ) -> Schema:
+        if self.streaming:
+            parse_result, raw_schema, fingerprint = parse_schema_stream(
+                self.file, keep_raw_schema=self.keep_raw_schema
+            )
+            return Schema.from_parse_result(
+                parse_result, self, raw_schema=raw_schema, fingerprint=fingerprint
+            )
+
+        if content is None:
+            content = self.file.read()
+        parse_result, raw_schema = parse_schema_content(
+            content, lazy=lazy, keep_raw_schema=self.keep_raw_schema
+        )
+        return Schema.from_parse_result(parse_result, self, raw_schema=raw_schema)
+
+
+class AsyncFileSchemaProvider(FileSchemaProvider):
+    """Schema provider to read the schema from the file without blocking the event loop.
+
+    The file is read in a thread, the schema is decoded and parsed in the executor.
+    Streaming loads and loads with snapshots are bound to the file,
+    hence they run as a whole in a thread.
+
+    Args:
+        file: see :ref:`FileSchemaProvider`
+        parse_executor: holds either "thread", "process", an executor instance
+            or None to parse the schema right on the event loop
+        **kwargs: holds the other arguments of the :ref:`FileSchemaProvider`
+    """
+
+    def __init__(
+        self,
+        file: Union[str, pathlib.Path, IO, io.IOBase],
+        parse_executor: Executor = "thread",
+        **kwargs,
+    ):
+        super(AsyncFileSchemaProvider, self).__init__(file, **kwargs)
+        self.parse_executor: Executor = parse_executor
+
+    async def load_schema(self) -> Schema:  # skipcq: PYL-W0236
+        """Method to load the schema from the local file
+
         Returns:
             the schema from the file
         """
+        if self.parse_executor is None:
+            return super(AsyncFileSchemaProvider, self).load_schema()
+        if self.streaming or self.snapshot_dir is not None:
+            return await run_in_executor(
+                "thread", super(AsyncFileSchemaProvider, self).load_schema
+            )
+
         logger.debug(f"Reading local schema from `{self.file}`")
-        import json
+        content = await run_in_executor("thread", self.file.read)
+        parse_result, raw_schema = await run_in_executor(
+            self.parse_executor,
+            parse_schema_content,
+            content,
+            lazy=self.lazy,
+            keep_raw_schema=self.keep_raw_schema,
+        )
+        return Schema.from_parse_result(parse_result, self, raw_schema=raw_schema)
+
 
-        raw_schema = json.load(self.file)
-        return Schema(raw_schema, self)
+class ModuleSchemaProvider(SchemaProvider):
+    """Schema provider to load the schema from a generated schema module.
+
+    Schema modules are generated ahead of time with
+    `python -m qlient.core.schema.codegen schema.json my_schema.py`.
+    Loading the schema then only imports the module and builds the schema types,
+    which skips the json decoding and the parsing altogether.
+
+    Args:
+        module: holds either the generated module or its import name
+        lazy: if True, the schema types are only built the first time they are used
+    """
+
+    def __init__(self, module: Union[str, types.ModuleType], lazy: bool = False):
+        self.module: Union[str, types.ModuleType] = module
+        self.lazy: bool = lazy
+
+    def load_schema(self) -> Schema:
+        """Method to load the schema from the generated module
+
+        Returns:
+            the schema from the module
+        """
+        logger.debug(f"Loading schema from module `{self.module}`")
+        parse_result = load_schema_module(self.module, lazy=self.lazy)
+        return Schema.from_parse_result(parse_result, self)
 
 
 class BackendSchemaProvider(SchemaProvider):
@@ -67,119 +296,358 @@ class BackendSchemaProvider(SchemaProvider):
     to load the schema directly from the backend.
 
     NOTE! This only works when the graphql backend has allowed introspection.
+
+    Args:
+        backend: holds the backend to send the introspection query to
+        lazy: if True, the schema types are only parsed the first time they are used
+        cache: optional, holds the cache to store the introspected schema in
+        cache_key: optional, holds the key of the schema in the cache.
+            Defaults to the cache key of the backend.
+            Without any key, the cache is not used.
+        descriptions: if False, the descriptions are not introspected
+        include_deprecated: if False, deprecated fields and enum values
+            are not introspected
+        type_ref_depth: holds the number of nested `ofType` levels to introspect
+        partial: if True, only the root types and the directives are introspected
+            upfront. Every other type is introspected the first time it is used.
+            Partially introspected schemas are never cached.
     """
 
     backend: Backend  # just a type hint
 
     INTROSPECTION_OPERATION_NAME = "IntrospectionQuery"
-    INTROSPECTION_QUERY = """
-            query IntrospectionQuery {
-              __schema {
-                queryType { name }
-                mutationType { name }
-                subscriptionType { name }
-                types {
-                  ...FullType
-                }
-                directives {
-                  name
-                  description
-                  locations
-                  args {
-                    ...InputValue
-                  }
-                }
-              }
-            }
-            fragment FullType on __Type {
-              kind
-              name
-              description
-              fields(includeDeprecated: true) {
-                name
-                description
-                args {
-                  ...InputValue
-                }
-                type {
-                  ...TypeRef
-                }
-                isDeprecated
-                deprecationReason
-              }
-              inputFields {
-                ...InputValue
-              }
-              interfaces {
-                ...TypeRef
-              }
-              enumValues(includeDeprecated: true) {
-                name
-                description
-                isDeprecated
-                deprecationReason
-              }
-              possibleTypes {
-                ...TypeRef
-              }
-            }
-            fragment InputValue on __InputValue {
-              name
-              description
-              type { ...TypeRef }
-              defaultValue
-            }
-            fragment TypeRef on __Type {
-              kind
-              name
-              ofType {
-                kind
-                name
-                ofType {
-                  kind
-                  name
-                  ofType {
-                    kind
-                    name
-                    ofType {
-                      kind
-                      name
-                      ofType {
-                        kind
-                        name
-                        ofType {
-                          kind
-                          name
-                          ofType {
-                            kind
-                            name
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-            """
-
-    def __init__(self, backend: Backend):
+    INTROSPECTION_QUERY = build_introspection_query(INTROSPECTION_OPERATION_NAME)
+
+    ROOT_TYPES_OPERATION_NAME = "RootTypesIntrospectionQuery"
+    TYPES_OPERATION_NAME = "TypesIntrospectionQuery"
+
+    VALIDATOR_OPERATION_NAME = SCHEMA_VALIDATOR_OPERATION_NAME
+    VALIDATOR_QUERY = SCHEMA_VALIDATOR_QUERY
+
+    # partial schemas introspect their types either synchronously or asynchronously
+    PARTIAL_MODE = "sync"
+
+    def __init__(
+        self,
+        backend: Backend,
+        lazy: bool = False,
+        cache: Optional[IntrospectionCache] = None,
+        cache_key: Optional[str] = None,
+        descriptions: bool = True,
+        include_deprecated: bool = True,
+        type_ref_depth: int = DEFAULT_TYPE_REF_DEPTH,
+        partial: bool = False,
+    ):
         self.backend: Backend = backend
+        self.lazy: bool = lazy
+        self.cache: Optional[IntrospectionCache] = cache
+        self._cache_key: Optional[str] = cache_key
+        self.partial: bool = partial
+        self.introspection_options: Dict = {
+            "descriptions": descriptions,
+            "include_deprecated": include_deprecated,
+            "type_ref_depth": type_ref_depth,
+        }
+
+        self.introspection_query: str = self.INTROSPECTION_QUERY
+        self.validator_query: str = self.VALIDATOR_QUERY
+        # holds the variant of the introspection, None for the full introspection
+        self.query_variant: Optional[str] = None
+        if (descriptions, include_deprecated, type_ref_depth) != (
+            True,
+            True,
+            DEFAULT_TYPE_REF_DEPTH,
+        ):
+            self.introspection_query = build_introspection_query(
+                self.INTROSPECTION_OPERATION_NAME,
+                descriptions=descriptions,
+                include_deprecated=include_deprecated,
+                type_ref_depth=type_ref_depth,
+            )
+            self.validator_query = build_schema_validator_query(
+                include_deprecated, type_ref_depth
+            )
+            # reduced schemas must not be mixed up with full schemas
+            self.query_variant = content_hash(self.introspection_query)[:16]
+        if partial:
+            # partial schemas must not be mixed up with full schemas,
+            # nor with the partial schemas that introspect in the other mode
+            variant = self.query_variant or "full"
+            self.query_variant = f"partial-{self.PARTIAL_MODE}-{variant}"
+        if cache is not None and self.cache_key is None:
+            logger.warning(
+                f"The introspection cache is not used for `{backend}`, "
+                f"it can not tell the server apart. Pass a `cache_key` "
+                f"or give the backend an `endpoint`."
+            )
+
+    @property
+    def cache_key(self) -> Optional[str]:
+        """Property to return the key of the schema in the introspection cache
+
+        Schemas introspected with a reduced introspection query
+        get their own cache key.
+
+        Returns:
+            Either None (if neither a cache key is given nor the backend has one)
+            or the cache key
+        """
+        cache_key = self._cache_key
+        if cache_key is None:
+            cache_key = self.backend.cache_key
+        if cache_key is None:
+            return None
+        if self.query_variant is not None:
+            cache_key = f"{cache_key}#{self.query_variant}"
+        return cache_key
+
+    def create_introspection_request(self) -> GraphQLRequest:
+        """Create the request to introspect the full schema
+
+        Returns:
+            the introspection request
+        """
+        return GraphQLRequest(
+            query=self.introspection_query,
+            operation_name=self.INTROSPECTION_OPERATION_NAME,
+            variables={},
+        )
+
+    def create_root_types_request(self) -> GraphQLRequest:
+        """Create the request to introspect the root types and the directives
+
+        Returns:
+            the root types introspection request
+        """
+        return GraphQLRequest(
+            query=build_root_types_query(
+                self.ROOT_TYPES_OPERATION_NAME, **self.introspection_options
+            ),
+            operation_name=self.ROOT_TYPES_OPERATION_NAME,
+            variables={},
+        )
+
+    def create_types_request(self, names: List[str]) -> GraphQLRequest:
+        """Create the request to introspect the given types
+
+        Args:
+            names: holds the names of the types to introspect
+
+        Returns:
+            the types introspection request
+        """
+        return GraphQLRequest(
+            query=build_types_query(
+                len(names), self.TYPES_OPERATION_NAME, **self.introspection_options
+            ),
+            operation_name=self.TYPES_OPERATION_NAME,
+            variables={f"t{index}": name for index, name in enumerate(names)},
+        )
+
+    @staticmethod
+    def extract_types(
+        names: List[str], response: GraphQLResponse
+    ) -> Dict[str, Optional[Dict]]:
+        """Extract the introspected types from the response of the types request
+
+        Args:
+            names: holds the names of the requested types
+            response: holds the response of the types request
+
+        Returns:
+            the type names mapped to the introspected types
+            or None if the type does not exist
+
+        Raises:
+            SchemaException when the response holds no data
+        """
+        data = response.data
+        if not isinstance(data, dict):
+            raise SchemaException(
+                data, f"Unable to introspect the types {names}: {response.errors}"
+            )
+        return {name: data.get(f"t{index}") for index, name in enumerate(names)}
+
+    def fetch_types(self, names: List[str]) -> Dict[str, Optional[Dict]]:
+        """Introspect the given types using the backend
+
+        Args:
+            names: holds the names of the types to introspect
+
+        Returns:
+            the type names mapped to the introspected types
+            or None if the type does not exist
+        """
+        response = self.backend.execute_query(self.create_types_request(names))
+        return self.extract_types(names, response)
+
+    def create_types_registry(self) -> RemoteTypesRegistry:
+        """Create the registry of a partially introspected schema
+
+        Returns:
+            the registry that introspects the types on demand
+        """
+        return RemoteTypesRegistry(fetch_types=self.fetch_types)
+
+    # skipcq: PY-D0003
+    def _partial_schema(self, raw_schema: RawSchema) -> Schema:
+        types = self.create_types_registry()
+        root_types = {}
+        for key in ("queryType", "mutationType", "subscriptionType"):
+            raw_type = raw_schema.get(key)
+            root_types[key] = raw_type.get("name") if raw_type else None
+            if raw_type:
+                types.add_raw_types({raw_type["name"]: raw_type})
+        parse_result = ParseResult(
+            query_type=extract_type(root_types["queryType"], types),
+            mutation_type=extract_type(root_types["mutationType"], types),
+            subscription_type=extract_type(root_types["subscriptionType"], types),
+            types=types,
+            directives=parse_directives(raw_schema, types, types.type_ref_pool),
+            # the fingerprint only covers the root types and the directives
+            fingerprint=fingerprint_raw_schema(raw_schema),
+        )
+        return Schema.from_parse_result(parse_result, self)
+
+    def create_validator_request(self) -> GraphQLRequest:
+        """Create the request to revalidate a cached schema
+
+        Returns:
+            the validator request
+        """
+        return GraphQLRequest(
+            query=self.validator_query,
+            operation_name=self.VALIDATOR_OPERATION_NAME,
+            variables={},
+        )
+
+    def compute_validator(self, raw_schema: RawSchema) -> Optional[str]:
+        """Compute the validator of a freshly introspected schema
+
+        Overwrite this together with :ref:`extract_validator`
+        to revalidate cached schemas by other means (e.g. a version field).
+
+        Args:
+            raw_schema: holds the introspected raw schema
+
+        Returns:
+            the validator to store the schema with
+        """
+        return compute_schema_validator(
+            raw_schema, self.introspection_options["type_ref_depth"]
+        )
+
+    def extract_validator(self, response: GraphQLResponse) -> Optional[str]:
+        """Extract the validator from the response of the validator request
+
+        Args:
+            response: holds the response of the validator request
+
+        Returns:
+            Either None (if the response holds no schema) or the validator
+        """
+        data = response.data
+        if not isinstance(data, dict) or not isinstance(data.get("__schema"), dict):
+            return None
+        return compute_schema_validator(
+            data["__schema"], self.introspection_options["type_ref_depth"]
+        )
+
+    def load_cache_entry(self) -> Optional[IntrospectionCacheEntry]:
+        """Load the cache entry of the backend
+
+        Returns:
+            Either None (if there is no cache or no entry) or the cache entry
+        """
+        cache_key = self.cache_key
+        if self.cache is None or cache_key is None:
+            return None
+        return self.cache.load(cache_key)
+
+    def store_cache_entry(self, raw_schema: RawSchema, fingerprint: str):
+        """Store the freshly introspected raw schema in the cache
+
+        Args:
+            raw_schema: holds the introspected raw schema
+            fingerprint: holds the content fingerprint of the raw schema
+        """
+        cache_key = self.cache_key
+        if self.cache is None or cache_key is None:
+            return
+        self.cache.store(
+            cache_key,
+            raw_schema,
+            self.compute_validator(raw_schema),
+            fingerprint=fingerprint,
+        )
+
+    # skipcq: PY-D0003
+    def _cached_schema(self, entry: IntrospectionCacheEntry) -> Schema:
+        return Schema(
+            entry.raw_schema, self, lazy=self.lazy, fingerprint=entry.fingerprint
+        )
+
+    # skipcq: PY-D0003
+    def _introspected_schema(self, raw_schema: RawSchema) -> Schema:
+        schema = Schema(raw_schema, self, lazy=self.lazy)
+        if self.cache is not None:
+            self.store_cache_entry(raw_schema, schema.fingerprint)
+        return schema
+
+    def is_revalidated(
+        self,
+        entry: IntrospectionCacheEntry,
+        response: GraphQLResponse,
+    ) -> bool:
+        """Check if the cached schema is still up to date
+
+        On success, the time to live of the cache entry is restarted.
+
+        Args:
+            entry: holds the outdated cache entry
+            response: holds the response of the validator request
+
+        Returns:
+            True if the cached schema can still be used
+        """
+        validator = self.extract_validator(response)
+        if validator is None or validator != entry.validator:
+            logger.debug(f"Cached schema of `{entry.key}` is outdated")
+            return False
+        logger.debug(f"Cached schema of `{entry.key}` revalidated")
+        self.cache.touch(entry)
+        return True
 
     def load_schema(self) -> Schema:
         """Send the introspection query to the backend and return the given schema
 
+        When an introspection cache is given, a cached schema is used
+        as long as its time to live has not expired.
+        An expired schema is revalidated with a much smaller query
+        and only introspected again when it has changed.
+
         Returns:
             the given schema from the backend.
         """
+        if self.partial:
+            logger.debug(f"Loading remote root types using `{self.backend}`")
+            response = self.backend.execute_query(self.create_root_types_request())
+            return self._partial_schema(response.data["__schema"])
+
+        entry = self.load_cache_entry()
+        if entry is not None:
+            if entry.is_fresh(self.cache.ttl):
+                logger.debug(f"Using cached schema of `{entry.key}`")
+                return self._cached_schema(entry)
+            if entry.validator is not None:
+                response = self.backend.execute_query(self.create_validator_request())
+                if self.is_revalidated(entry, response):
+                    return self._cached_schema(entry)
+
         logger.debug(f"Loading remote schema using `{self.backend}`")
-        request = GraphQLRequest(
-            query=self.INTROSPECTION_QUERY,
-            operation_name=self.INTROSPECTION_OPERATION_NAME,
-            variables={},
-        )
+        request = self.create_introspection_request()
         schema_content = self.backend.execute_query(request)
-        return Schema(schema_content.data["__schema"], self)
+        return self._introspected_schema(schema_content.data["__schema"])
 
 
 class AsyncBackendSchemaProvider(BackendSchemaProvider):
@@ -189,19 +657,175 @@ class AsyncBackendSchemaProvider(BackendSchemaProvider):
     to load the schema directly from the backend.
 
     NOTE! This only works when the graphql backend has allowed introspection.
+
+    The introspected schema is parsed in the executor,
+    so other coroutines keep running while a big schema is parsed.
+
+    Args:
+        backend: see :ref:`BackendSchemaProvider`
+        parse_executor: holds either "thread", "process", an executor instance
+            or None to parse the schema right on the event loop
+        **kwargs: holds the other arguments of the :ref:`BackendSchemaProvider`
     """
 
+    PARTIAL_MODE = "async"
+
+    # holds the fingerprint and the validator of the schema in use
+    _known_validator: Tuple[Optional[str], Optional[str]] = (None, None)
+
+    def __init__(
+        self,
+        backend: Backend,
+        parse_executor: Executor = "thread",
+        **kwargs,
+    ):
+        super(AsyncBackendSchemaProvider, self).__init__(backend, **kwargs)
+        self.parse_executor: Executor = parse_executor
+
+    @property
+    def _io_executor(self) -> Executor:
+        # blocking file access runs in a thread, unless nothing should be offloaded
+        return "thread" if self.parse_executor is not None else None
+
+    # skipcq: PY-D0003
+    async def _parse_schema_async(
+        self,
+        raw_schema: RawSchema,
+        fingerprint: Optional[str] = None,
+    ) -> Schema:
+        parse_result = await run_in_executor(
+            self.parse_executor, parse_schema, raw_schema, lazy=self.lazy
+        )
+        return Schema.from_parse_result(
+            parse_result, self, raw_schema=raw_schema, fingerprint=fingerprint
+        )
+
+    # skipcq: PY-D0003
+    async def _introspected_schema_async(self, raw_schema: RawSchema) -> Schema:
+        schema = await self._parse_schema_async(raw_schema)
+        if self.cache is not None:
+            # fingerprinting and writing the cache entry block as well
+            await run_in_executor(
+                self._io_executor,
+                self.store_cache_entry,
+                raw_schema,
+                schema.fingerprint,
+            )
+        return schema
+
+    async def fetch_types_async(self, names: List[str]) -> Dict[str, Optional[Dict]]:
+        """Introspect the given types asynchronously using the backend
+
+        Args:
+            names: holds the names of the types to introspect
+
+        Returns:
+            the type names mapped to the introspected types
+            or None if the type does not exist
+        """
+        response = await await_if_coro(
+            self.backend.execute_query(self.create_types_request(names))
+        )
+        return self.extract_types(names, response)
+
+    def create_types_registry(self) -> RemoteTypesRegistry:
+        """Create the registry of a partially introspected schema
+
+        The types can not be introspected synchronously,
+        they have to be loaded with `await registry.load_async(names)`.
+
+        Returns:
+            the registry that introspects the types on demand
+        """
+        return RemoteTypesRegistry(fetch_types_async=self.fetch_types_async)
+
+    # skipcq: PY-D0003
+    async def _introspect_schema_async(self) -> Schema:
+        logger.debug(f"Loading remote schema using `{self.backend}`")
+        request = self.create_introspection_request()
+        response = await await_if_coro(self.backend.execute_query(request))
+        return await self._introspected_schema_async(response.data["__schema"])
+
+    async def refresh_schema(self, schema: Schema) -> Optional[Schema]:
+        """Load the schema again if it has changed on the server
+
+        The schema is first revalidated with the validator query.
+        Only if it has changed, the full schema is introspected
+        and parsed off the event loop.
+        Partially introspected schemas are compared by their root types
+        and directives only, changes of the other types are not detected.
+        Hence the async client does not refresh them in the background.
+
+        Args:
+            schema: holds the schema that is currently in use
+
+        Returns:
+            Either None (if the schema has not changed) or the new schema
+        """
+        if self.partial:
+            response = await await_if_coro(
+                self.backend.execute_query(self.create_root_types_request())
+            )
+            new_schema = self._partial_schema(response.data["__schema"])
+        else:
+            if schema.raw_schema is not None:
+                response = await await_if_coro(
+                    self.backend.execute_query(self.create_validator_request())
+                )
+                validator = self.extract_validator(response)
+                if validator is not None and validator == self._schema_validator(
+                    schema
+                ):
+                    logger.debug(f"Schema of `{self.backend}` has not changed")
+                    return None
+            new_schema = await self._introspect_schema_async()
+
+        if new_schema.fingerprint == schema.fingerprint:
+            logger.debug(f"Schema of `{self.backend}` has not changed")
+            return None
+        logger.debug(f"Schema of `{self.backend}` has changed")
+        return new_schema
+
+    # skipcq: PY-D0003
+    def _schema_validator(self, schema: Schema) -> Optional[str]:
+        # the validator of the schema in use is only computed once
+        fingerprint, validator = self._known_validator
+        if fingerprint is None or fingerprint != schema.fingerprint:
+            validator = self.compute_validator(schema.raw_schema)
+            self._known_validator = (schema.fingerprint, validator)
+        return validator
+
     async def load_schema(self) -> Schema:  # skipcq: PYL-W0236
         """Send the introspection query to the backend and return the given schema
 
         Returns:
             the given schema from the backend.
         """
-        logger.debug(f"Loading remote schema using `{self.backend}`")
-        request = GraphQLRequest(
-            query=self.INTROSPECTION_QUERY,
-            operation_name=self.INTROSPECTION_OPERATION_NAME,
-            variables={},
-        )
-        schema_content = await await_if_coro(self.backend.execute_query(request))
-        return Schema(schema_content.data["__schema"], self)
+        if self.partial:
+            logger.debug(f"Loading remote root types using `{self.backend}`")
+            response = await await_if_coro(
+                self.backend.execute_query(self.create_root_types_request())
+            )
+            return self._partial_schema(response.data["__schema"])
+
+        entry = await run_in_executor(self._io_executor, self.load_cache_entry)
+        if entry is not None:
+            if entry.is_fresh(self.cache.ttl):
+                logger.debug(f"Using cached schema of `{entry.key}`")
+                return await self._parse_schema_async(
+                    entry.raw_schema, entry.fingerprint
+                )
+            if entry.validator is not None:
+                response = await await_if_coro(
+                    self.backend.execute_query(self.create_validator_request())
+                )
+                # touching the cache file blocks, just like reading it
+                is_revalidated = await run_in_executor(
+                    self._io_executor, self.is_revalidated, entry, response
+                )
+                if is_revalidated:
+                    return await self._parse_schema_async(
+                        entry.raw_schema, entry.fingerprint
+                    )
+
+        return await self._introspect_schema_async()
@@ -2,46 +2,159 @@ import logging
 import typing
 
 from qlient.core import __meta__
+from qlient.core._internal import LRUCache
 from qlient.core._types import RawSchema
-from qlient.core.schema.models import Type, Directive
+from qlient.core.schema.fingerprint import fingerprint_raw_schema
+from qlient.core.schema.models import Type, Directive, lookup_type
 from qlient.core.schema.parser import parse_schema, ParseResult
 
 logger = logging.getLogger(__meta__.__title__)
 
 SchemaProviderType = typing.Type["SchemaProvider"]
 
+# the maximum number of validated selections each schema keeps
+PREPARED_SELECTIONS_CACHE_SIZE = 1024
+
 
 class Schema:
-    """Represents a graphql schema"""
+    """Represents a graphql schema
+
+    Schemas are compared and hashed by the content fingerprint of their raw schema.
+    Providers that get the fingerprint for free (e.g. from a snapshot or a cache)
+    hand it over when loading the schema.
+    Otherwise, it is computed once, the first time it is needed.
+
+    Args:
+        raw_schema: holds the raw schema as a dictionary
+        provider: holds the provider that loaded the schema
+        lazy: if True, the types are only parsed the first time they are accessed
+        fingerprint: optional, holds the already known fingerprint of the raw schema
+    """
 
     def __init__(
         self,
         raw_schema: RawSchema,
         provider: SchemaProviderType,
+        lazy: bool = False,
+        fingerprint: typing.Optional[str] = None,
     ):
-        self.raw_schema: RawSchema = raw_schema
+        self.raw_schema: typing.Optional[RawSchema] = raw_schema
         self.schema_provider: SchemaProviderType = provider
 
-        parse_result: ParseResult = parse_schema(self.raw_schema)
+        parse_result: ParseResult = parse_schema(self.raw_schema, lazy=lazy)
+        self._apply_parse_result(parse_result, fingerprint)
+        logger.debug("Schema successfully introspected")
+
+    @classmethod
+    def from_parse_result(
+        cls,
+        parse_result: ParseResult,
+        provider: SchemaProviderType,
+        raw_schema: typing.Optional[RawSchema] = None,
+        fingerprint: typing.Optional[str] = None,
+    ) -> "Schema":
+        """Create a schema from an already parsed schema
 
+        Args:
+            parse_result: holds the already parsed and linked schema
+            provider: holds the provider that loaded the schema
+            raw_schema: optional, holds the raw schema as a dictionary
+            fingerprint: optional, holds the content fingerprint of the raw schema.
+                Defaults to the fingerprint of the parse result.
+
+        Returns:
+            the schema
+        """
+        schema = cls.__new__(cls)
+        schema.raw_schema = raw_schema
+        schema.schema_provider = provider
+        schema._apply_parse_result(parse_result, fingerprint)
+        return schema
+
+    # skipcq: PY-D0003
+    def _apply_parse_result(
+        self,
+        parse_result: ParseResult,
+        fingerprint: typing.Optional[str] = None,
+    ):
         self.query_type: typing.Optional[Type] = parse_result.query_type
         self.mutation_type: typing.Optional[Type] = parse_result.mutation_type
         self.subscription_type: typing.Optional[Type] = parse_result.subscription_type
-        self.types_registry: typing.Dict[str, Type] = parse_result.types
+        self.types_registry: typing.Mapping[str, Type] = parse_result.types
         self.directives_registry: typing.Dict[str, Directive] = parse_result.directives
-        logger.debug("Schema successfully introspected")
+        if fingerprint is None:
+            fingerprint = parse_result.fingerprint
+        self._fingerprint: typing.Optional[str] = fingerprint
+        # holds the prepared automatic field selections of the request builder,
+        # keyed by the type name and the lookup depth
+        self.auto_selections: typing.Dict[typing.Tuple[str, int], typing.Any] = {}
+        # holds the validated selections, keyed by the selection and the parent type.
+        # A swapped schema comes with an empty cache.
+        self.prepared_selections: LRUCache = LRUCache(PREPARED_SELECTIONS_CACHE_SIZE)
 
-    def __eq__(self, other: "Schema"):
-        return (
-            self.raw_schema == other.raw_schema
-            and self.schema_provider == other.schema_provider
+    @property
+    def parse_result(self) -> ParseResult:
+        """Property to return the parsed schema
+
+        Returns:
+            the parse result with all types, directives, root types and the fingerprint
+        """
+        return ParseResult(
+            query_type=self.query_type,
+            mutation_type=self.mutation_type,
+            subscription_type=self.subscription_type,
+            types=self.types_registry,
+            directives=self.directives_registry,
+            fingerprint=self.fingerprint,
         )
 
+    @property
+    def fingerprint(self) -> typing.Optional[str]:
+        """Property to return the content fingerprint of the schema
+
+        Returns:
+            Either None (if neither a fingerprint nor a raw schema is known)
+            or the hex digest of the fingerprint
+        """
+        if self._fingerprint is None and self.raw_schema is not None:
+            self._fingerprint = fingerprint_raw_schema(self.raw_schema)
+        return self._fingerprint
+
+    def prefetch_types(self, names: typing.Iterable[str]):
+        """Load the given types ahead of their first access
+
+        This only has an effect on partially introspected schemas,
+        which then introspect all of these types with a single request.
+
+        Args:
+            names: holds the names of the types that are about to be used
+        """
+        prefetch = getattr(self.types_registry, "prefetch", None)
+        if prefetch is not None:
+            prefetch(names)
+
+    def __eq__(self, other: "Schema"):
+        if self is other:
+            return True
+        if not isinstance(other, Schema):
+            return NotImplemented
+        if self.schema_provider != other.schema_provider:
+            return False
+        return self.fingerprint is not None and self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        if self.fingerprint is None:
+            return id(self)
+        return hash(self.fingerprint)
+
     def __getattr__(self, key) -> typing.Optional[Type]:
+        if key.startswith("__") and key.endswith("__"):
+            # e.g. `__setstate__` while the schema is copied or unpickled
+            raise AttributeError(key)
         return self[key]
 
     def __getitem__(self, key) -> typing.Optional[Type]:
-        return self.types_registry.get(key)
+        return lookup_type(self.types_registry, key)
 
     def __str__(self) -> str:
         """Return a simple string representation of the schema instance"""
@@ -0,0 +1,187 @@
+"""This file contains the functions to store and load pre-parsed schema snapshots
+
+A snapshot holds the already parsed and linked schema object graph
+(types, directives and root types).
+Loading a snapshot therefore skips the json decoding and the schema parsing.
+
+Snapshots are pickled, and unpickling a file can execute arbitrary code.
+Hence a snapshot is only unpickled if it starts with the expected plain header
+and if neither the file nor its directory can be written by other users.
+"""
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+import stat
+import tempfile
+from typing import Optional, Union, IO
+
+from qlient.core import __meta__
+from qlient.core.schema.parser import ParseResult
+
+logger = logging.getLogger(__meta__.__title__)
+
+# increase this whenever the layout of the pickled schema models changes
+SNAPSHOT_FORMAT_VERSION = 5
+SNAPSHOT_SUFFIX = ".qlient-schema"
+SNAPSHOT_MAGIC = b"QLIENT-SCHEMA-SNAPSHOT"
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    """Create the hash of the given content
+
+    Args:
+        content: holds the content to hash
+
+    Returns:
+        the hex digest of the content
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_content_hash(file: IO, chunk_size: int = 64 * 1024) -> str:
+    """Create the hash of the content of the given file, chunk by chunk
+
+    The result is the same as of :ref:`content_hash` for the whole content.
+
+    Args:
+        file: holds the file object to read from
+        chunk_size: holds the number of characters (or bytes) to read at once
+
+    Returns:
+        the hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    chunk = file.read(chunk_size)
+    while chunk:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        digest.update(chunk)
+        chunk = file.read(chunk_size)
+    return digest.hexdigest()
+
+
+def snapshot_path(
+    snapshot_dir: Union[str, pathlib.Path], source_hash: str
+) -> pathlib.Path:
+    """Create the path of the snapshot for the given source hash
+
+    Args:
+        snapshot_dir: holds the directory where the snapshots are stored
+        source_hash: holds the content hash of the snapshot source
+
+    Returns:
+        the path to the snapshot file
+    """
+    file_name = f"v{SNAPSHOT_FORMAT_VERSION}-{source_hash}{SNAPSHOT_SUFFIX}"
+    return pathlib.Path(snapshot_dir) / file_name
+
+
+def snapshot_header(source_hash: str) -> bytes:
+    """Create the plain header of a snapshot
+
+    The header is checked before anything of the snapshot is unpickled.
+
+    Args:
+        source_hash: holds the content hash of the snapshot source
+
+    Returns:
+        the header line of the snapshot
+    """
+    header = f" {SNAPSHOT_FORMAT_VERSION} {__meta__.__version__} {source_hash}\n"
+    return SNAPSHOT_MAGIC + header.encode("ascii")
+
+
+# skipcq: PY-D0003
+def _is_trusted(path: pathlib.Path) -> bool:
+    if not hasattr(os, "getuid"):
+        # there are no unix ownership and permission bits to check
+        return True
+    for checked_path in (path, path.parent):
+        status = checked_path.stat()
+        if status.st_uid != os.getuid():
+            logger.warning(
+                f"Refusing to load schema snapshot `{path}`, "
+                f"`{checked_path}` is not owned by the current user"
+            )
+            return False
+        if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            logger.warning(
+                f"Refusing to load schema snapshot `{path}`, "
+                f"`{checked_path}` is writable by other users"
+            )
+            return False
+    return True
+
+
+def dump_snapshot(
+    parse_result: ParseResult,
+    path: Union[str, pathlib.Path],
+    source_hash: str,
+):
+    """Store the parse result as snapshot
+
+    The snapshot is written to a temporary file first
+    and then moved to its final destination.
+    This makes sure that no other process reads a partially written snapshot.
+
+    Args:
+        parse_result: holds the parsed schema to store
+        path: holds the path to write the snapshot to
+        source_hash: holds the content hash of the snapshot source
+    """
+    path = pathlib.Path(path)
+    # only the current user may write the snapshots, see :ref:`load_snapshot`
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=str(path.parent))
+    try:
+        with os.fdopen(file_descriptor, "wb") as tmp_file:
+            tmp_file.write(snapshot_header(source_hash))
+            pickle.dump(parse_result, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    logger.debug(f"Schema snapshot written to `{path}`")
+
+
+def load_snapshot(
+    path: Union[str, pathlib.Path],
+    source_hash: str,
+) -> Optional[ParseResult]:
+    """Load the parse result from a snapshot
+
+    Unpickling can execute arbitrary code, hence the snapshot is ignored
+    if it does not start with the expected header,
+    if it is not owned by the current user
+    or if it or its directory is writable by other users.
+
+    Args:
+        path: holds the path to read the snapshot from
+        source_hash: holds the expected content hash of the snapshot source
+
+    Returns:
+        Either None (if there is no valid snapshot) or the parse result
+    """
+    path = pathlib.Path(path)
+    if not path.is_file():
+        return None
+    try:
+        if not _is_trusted(path):
+            return None
+        with path.open("rb") as snapshot_file:
+            header = snapshot_header(source_hash)
+            if snapshot_file.read(len(header)) != header:
+                logger.debug(f"Ignoring outdated schema snapshot `{path}`")
+                return None
+            parse_result = pickle.load(snapshot_file)
+    except Exception as e:  # skipcq: PYL-W0703
+        logger.warning(f"Unable to load schema snapshot `{path}`: {e}")
+        return None
+    if not isinstance(parse_result, ParseResult):
+        return None
+    logger.debug(f"Schema snapshot loaded from `{path}`")
+    return parse_result
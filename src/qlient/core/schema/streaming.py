@@ -0,0 +1,236 @@
+"""This file contains the streaming schema parser
+
+The streaming parser reads the schema file chunk by chunk
+and builds the schema types one entry of the `types` array at a time.
+The decoded json of a type is dropped as soon as the type is parsed,
+hence the full json document is never held in memory.
+"""
+import codecs
+import json
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from qlient.core._types import RawSchema, JSON
+from qlient.core.exceptions import NoTypesFound, SchemaParseException
+from qlient.core.schema.fingerprint import SchemaFingerprint
+from qlient.core.schema.models import Type, TypeRefPool
+from qlient.core.schema.parser import (
+    ParseResult,
+    extract_query_type,
+    extract_mutation_type,
+    extract_subscription_type,
+    parse_directives,
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# the keys that wrap the schema in a dumped introspection result
+_WRAPPER_KEYS = ("data", "__schema")
+# the keys next to the schema in a dumped introspection result
+_RESPONSE_KEYS = ("errors", "extensions")
+_WHITESPACE = " \t\n\r"
+
+
+class JSONStreamReader:
+    """Class to read a json document from a file, chunk by chunk.
+
+    Args:
+        file: holds the file object to read from
+        chunk_size: holds the number of characters (or bytes) to read at once
+    """
+
+    def __init__(self, file: IO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.file: IO = file
+        self.chunk_size: int = chunk_size
+        self.decoder: json.JSONDecoder = json.JSONDecoder()
+        self.buffer: str = ""
+        self.position: int = 0
+        self.exhausted: bool = False
+        # binary files might split a multibyte character between two chunks
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer
+
+        Returns:
+            False if the end of the file was reached
+        """
+        if self.exhausted:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.exhausted = True
+            return False
+        if isinstance(chunk, bytes):
+            chunk = self._utf8_decoder.decode(chunk)
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non whitespace character without consuming it
+
+        Returns:
+            the next character or an empty string at the end of the file
+        """
+        while True:
+            buffer = self.buffer
+            position = self.position
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            self.position = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        """Consume the given character
+
+        Args:
+            char: holds the character that is expected next
+
+        Raises:
+            SchemaParseException when the next character is a different one
+        """
+        actual = self.peek()
+        if actual != char:
+            raise SchemaParseException(
+                {}, f"Expected `{char}` at position {self.position}, got `{actual}`"
+            )
+        self.position += 1
+
+    def decode(self) -> JSON:
+        """Decode the next json value
+
+        Returns:
+            the decoded json value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number at the end of the buffer might continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.position = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over the keys of the next json object
+
+        The value of each key must be consumed before the next key is requested.
+
+        Yields:
+            the keys of the object
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.position += 1
+                continue
+            self.expect("}")
+            return
+
+    def iter_array(self) -> Iterator[JSON]:
+        """Iterate over the decoded values of the next json array
+
+        Yields:
+            the decoded values of the array
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() == ",":
+                self.position += 1
+                continue
+            self.expect("]")
+            return
+
+
+def iter_schema_items(reader: JSONStreamReader) -> Iterator[Tuple[str, Any]]:
+    """Iterate over the top level items of the schema
+
+    Dumped introspection results (`{"data": {"__schema": ...}}`) are unwrapped
+    and their `errors` and `extensions` are skipped.
+    Every entry of the `types` array is yielded on its own.
+
+    Args:
+        reader: holds the reader to read the schema from
+
+    Yields:
+        tuples of the top level key and the (partial) value
+    """
+    for key in reader.iter_object():
+        if key in _WRAPPER_KEYS and reader.peek() == "{":
+            yield from iter_schema_items(reader)
+        elif key in _RESPONSE_KEYS:
+            reader.decode()
+        elif key == "types" and reader.peek() == "[":
+            for type_dict in reader.iter_array():
+                yield key, type_dict
+        else:
+            yield key, reader.decode()
+
+
+def parse_schema_stream(
+    file: Union[IO, Any],
+    keep_raw_schema: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[ParseResult, Optional[RawSchema], str]:
+    """Parse the schema from the given file while streaming it
+
+    Args:
+        file: holds the file object to read from
+        keep_raw_schema: if True, the raw schema is assembled and returned as well
+        chunk_size: holds the number of characters (or bytes) to read at once
+
+    Returns:
+        a tuple of the parse result, the raw schema (if kept) and the fingerprint
+    """
+    reader = JSONStreamReader(file, chunk_size)
+    fingerprint = SchemaFingerprint()
+    raw_schema: Dict[str, JSON] = {}
+    raw_types: List[Dict] = []
+
+    types: Dict[str, Type] = {}
+    type_ref_pool = TypeRefPool(types)
+    for key, value in iter_schema_items(reader):
+        fingerprint.update(key, value)
+        if key != "types":
+            raw_schema[key] = value
+            continue
+        if not value:
+            continue
+        _type = Type.parse(value, type_ref_pool)
+        types[_type.name] = _type
+        if keep_raw_schema:
+            raw_types.append(value)
+
+    if not types:
+        raise NoTypesFound(raw_schema)
+
+    parse_result = ParseResult(
+        query_type=extract_query_type(raw_schema, types),
+        mutation_type=extract_mutation_type(raw_schema, types),
+        subscription_type=extract_subscription_type(raw_schema, types),
+        types=types,
+        directives=parse_directives(raw_schema, types, type_ref_pool),
+        fingerprint=fingerprint.hexdigest(),
+    )
+    if keep_raw_schema:
+        raw_schema["types"] = raw_types
+        return parse_result, raw_schema, parse_result.fingerprint
+    return parse_result, None, parse_result.fingerprint
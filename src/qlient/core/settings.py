@@ -1,18 +1,96 @@
 """This file contains the settings that can be overwritten in the qlient Client"""
+import concurrent.futures
+import pathlib
+from typing import Union, Optional
 
 
 class Settings:
-    """Class that represents the settings that can be adjusted to your liking"""
+    """Class that represents the settings that can be adjusted to your liking
+
+    Args:
+        use_schema_description: if True, the schema descriptions are used
+        allow_auto_lookup: if True, the fields are looked up automatically
+            when no fields were selected
+        lookup_recursion_depth: holds the depth of the automatic field lookup
+        introspection_cache_dir: optional, holds the directory
+            to cache the introspected schema in.
+            Only backends with a cache key (by default their endpoint) are cached.
+        introspection_cache_ttl: holds the time in seconds
+            a cached schema is used without revalidating it
+        share_schema: if True, all clients that use the same backend instance
+            share the same schema and, where possible, the same service proxies.
+            Clients with other backends load the schema themselves
+            and only share it when it has the same fingerprint.
+        introspect_descriptions: if False, the schema descriptions
+            are not introspected. Defaults to `use_schema_description`.
+        introspect_deprecated: if False, deprecated fields and enum values
+            are not introspected
+        introspection_type_ref_depth: holds the number of nested `ofType` levels
+            to introspect
+        partial_introspection: if True, only the root types are introspected
+            upfront and every other type the first time it is used
+        schema_refresh_interval: optional, holds the time in seconds
+            between two checks of the async client whether the schema has changed.
+            Defaults to None, which never refreshes the schema.
+            Partially introspected schemas are never refreshed in the background.
+        schema_parse_executor: holds the executor the async client parses
+            the schema in. Either "thread", "process", an executor instance
+            or None to parse the schema right on the event loop.
+            "process" uses a process pool shared by all clients.
+            Its worker process is started on first use and kept alive afterwards,
+            and the schema is pickled to and from that process.
+        request_cache_size: holds the number of built query documents
+            each service proxy keeps. 0 disables the cache.
+        pretty_queries: if True, the query documents are written
+            with one field per line instead of on a single line
+        persisted_queries: if True, queries and mutations are sent as
+            automatic persisted queries, only sending the hash of known queries.
+            The backend has to send the `extensions` of the request.
+    """
 
     def __init__(
         self,
         use_schema_description: bool = True,
         allow_auto_lookup: bool = True,
         lookup_recursion_depth: int = 1,
+        introspection_cache_dir: Union[str, pathlib.Path, None] = None,
+        introspection_cache_ttl: float = 3600,
+        share_schema: bool = False,
+        introspect_descriptions: Optional[bool] = None,
+        introspect_deprecated: bool = True,
+        introspection_type_ref_depth: int = 7,
+        partial_introspection: bool = False,
+        schema_refresh_interval: Optional[float] = None,
+        schema_parse_executor: Union[str, concurrent.futures.Executor, None] = "thread",
+        request_cache_size: int = 256,
+        pretty_queries: bool = False,
+        persisted_queries: bool = False,
     ):
         self.use_schema_description: bool = use_schema_description
         self.allow_auto_lookup: bool = allow_auto_lookup
         self.lookup_recursion_depth: int = lookup_recursion_depth
+        self.introspection_cache_dir: Optional[pathlib.Path] = (
+            pathlib.Path(introspection_cache_dir)
+            if introspection_cache_dir is not None
+            else None
+        )
+        self.introspection_cache_ttl: float = introspection_cache_ttl
+        self.share_schema: bool = share_schema
+        self.introspect_descriptions: bool = (
+            use_schema_description
+            if introspect_descriptions is None
+            else introspect_descriptions
+        )
+        self.introspect_deprecated: bool = introspect_deprecated
+        self.introspection_type_ref_depth: int = introspection_type_ref_depth
+        self.partial_introspection: bool = partial_introspection
+        self.schema_refresh_interval: Optional[float] = schema_refresh_interval
+        self.schema_parse_executor: Union[
+            str, concurrent.futures.Executor, None
+        ] = schema_parse_executor
+        self.request_cache_size: int = request_cache_size
+        self.pretty_queries: bool = pretty_queries
+        self.persisted_queries: bool = persisted_queries
 
     def __str__(self) -> str:
         """Return a simple string representation of the settings"""
@@ -25,6 +103,18 @@ class Settings:
             f"<{class_name}("
             f"use_schema_description={self.use_schema_description}, "
             f"allow_auto_lookup={self.allow_auto_lookup}, "
-            f"lookup_recursion_depth={self.lookup_recursion_depth}"
+            f"lookup_recursion_depth={self.lookup_recursion_depth}, "
+            f"introspection_cache_dir={self.introspection_cache_dir}, "
+            f"introspection_cache_ttl={self.introspection_cache_ttl}, "
+            f"share_schema={self.share_schema}, "
+            f"introspect_descriptions={self.introspect_descriptions}, "
+            f"introspect_deprecated={self.introspect_deprecated}, "
+            f"introspection_type_ref_depth={self.introspection_type_ref_depth}, "
+            f"partial_introspection={self.partial_introspection}, "
+            f"schema_refresh_interval={self.schema_refresh_interval}, "
+            f"schema_parse_executor={self.schema_parse_executor}, "
+            f"request_cache_size={self.request_cache_size}, "
+            f"pretty_queries={self.pretty_queries}, "
+            f"persisted_queries={self.persisted_queries}"
             f")>"
         )
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import json
 import pathlib
 from typing import List, AsyncGenerator
@@ -29,6 +30,20 @@ path_to_swapi_schema = schema_files_dir / "swapi_schema.json"
 path_to_github_schema = schema_files_dir / "github_schema.json"
 
 
+def retype_swapi_film_id(raw_swapi_schema):
+    """Return a copy of the swapi schema where `film(id: ID)` became `film(id: Int!)`"""
+    raw_schema = copy.deepcopy(raw_swapi_schema)
+    root = next(t for t in raw_schema["types"] if t["name"] == "Root")
+    film = next(f for f in root["fields"] if f["name"] == "film")
+    film_id = next(a for a in film["args"] if a["name"] == "id")
+    film_id["type"] = {
+        "kind": "NON_NULL",
+        "name": None,
+        "ofType": {"kind": "SCALAR", "name": "Int", "ofType": None},
+    }
+    return raw_schema
+
+
 @pytest.fixture(scope="session")
 def raw_swapi_schema():
     with open(path_to_swapi_schema) as f:
@@ -1,4 +1,7 @@
+import pytest
+
 from qlient.core.builder import GQLQueryBuilder
+from qlient.core.models import Directive, Field, Fields
 
 
 # skipcq: PY-D0003
@@ -206,3 +209,171 @@ def test_remove_duplicate_spaces():
         " {  query  {  hero  {  name  }  }  } "
     )
     assert expected == actual
+
+
+# skipcq: PY-D0003
+def test_query_cache():
+    from qlient.core.builder import QueryCache
+
+    cache = QueryCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.put("a", "query a { a }")
+    cache.put("b", "query b { b }")
+    assert cache.get("a").query == "query a { a }"
+    # "b" is the least recently used query now
+    cache.put("c", "query c { c }")
+    assert cache.get("b") is None
+    assert cache.get("c").query == "query c { c }"
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert isinstance(repr(cache), str)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+    disabled = QueryCache(maxsize=0)
+    assert disabled.put("a", "query a { a }").query == "query a { a }"
+    assert disabled.get("a") is None
+
+
+# skipcq: PY-D0003
+def test_query_document_hash():
+    import hashlib
+
+    from qlient.core.builder import QueryCache
+
+    cache = QueryCache()
+    document = cache.put("a", "query a { a }")
+    expected = hashlib.sha256(b"query a { a }").hexdigest()
+    assert document.query_hash == expected
+    # the hash is computed once and kept along with the cached document
+    assert cache.get("a")._query_hash == expected
+
+
+# skipcq: PY-D0003
+def test_query_cache_selection_key():
+    from qlient.core.builder import QueryCache
+    from qlient.core.models import Field, Fields, auto
+
+    assert QueryCache.selection_key(auto) == (("auto",), auto)
+    assert QueryCache.selection_key(None) == (("none",), None)
+    assert QueryCache.selection_key(["a", "b"])[0] == ("names", ("a", "b"))
+
+    key, fields = QueryCache.selection_key(iter(["a", Field("b")]))
+    assert fields == Fields("a", "b")
+    assert key == ("fields", Fields("a", "b"))
+    assert QueryCache.selection_key(Field("a"))[0] == ("fields", Fields("a"))
+
+
+# skipcq: PY-D0003
+@pytest.mark.parametrize(
+    "fields,variables",
+    [
+        (None, {}),
+        (Fields(), {}),
+        (Fields("title", "director"), {"id": "ID"}),
+        (
+            Fields(
+                Field("title", _alias="name", _directive=Directive("include")),
+                Field("planetConnection", _sub_fields=Fields()),
+                characterConnection={"characters": ["name"]},
+            ),
+            {"id": "ID", "filmID": "ID"},
+        ),
+    ],
+)
+def test_query_serializer_matches_query_builder(swapi_schema, fields, variables):
+    from qlient.core.builder import QuerySerializer
+
+    from qlient.core.models import PreparedFields
+
+    def prepare():
+        # bypass the cache of prepared selections, so nothing is memoized yet
+        if not fields:
+            return None
+        prepared = PreparedFields()
+        prepared.prepare(swapi_schema.Film, swapi_schema, fields.selected_fields)
+        return prepared
+
+    actual = QuerySerializer().serialize("query", "film", variables, prepare())
+
+    selection = prepare()
+    query_builder = GQLQueryBuilder()
+    query_builder.operation(
+        "query", "film", {f"${key}": value for key, value in variables.items()}
+    )
+    query_builder.action("film", {key: f"${key}" for key in variables})
+    if selection is not None:
+        query_builder.fields(selection.__gql__())
+    assert actual == query_builder.build()
+    # the memoized text is the same as the one of the selection
+    if selection is not None:
+        assert QuerySerializer().serialize("query", "film", variables, selection) == (
+            actual
+        )
+
+
+# skipcq: PY-D0003
+def test_query_serializer_pretty(swapi_schema):
+    from qlient.core.builder import QuerySerializer
+
+    selection = Fields("title", characterConnection={"characters": ["name"]}).prepare(
+        swapi_schema.Film, swapi_schema
+    )
+    actual = QuerySerializer(pretty=True).serialize(
+        "query", "film", {"id": "ID"}, selection
+    )
+    assert actual == (
+        "query film($id: ID) {\n"
+        "  film(id: $id) {\n"
+        "    title\n"
+        "    characterConnection {\n"
+        "      characters {\n"
+        "        name\n"
+        "      }\n"
+        "    }\n"
+        "  }\n"
+        "}"
+    )
+
+
+# skipcq: PY-D0003
+def test_batch_request_builder(swapi_schema):
+    from qlient.core.builder import BatchRequestBuilder
+    from qlient.core.settings import Settings
+
+    film = swapi_schema.query_type.field_name_to_field["film"]
+    request = (
+        BatchRequestBuilder("query", swapi_schema, Settings())
+        .context("context")
+        .operation(film, ["title"], id="1")
+        .operation(film, ["director"], id="2")
+        .build()
+    )
+    assert request.query == (
+        "query batch($_0_id: ID, $_1_id: ID) { "
+        "_0: film(id: $_0_id) { title } "
+        "_1: film(id: $_1_id) { director } }"
+    )
+    assert request.variables == {"_0_id": "1", "_1_id": "2"}
+    assert request.operation_name == "batch"
+    assert request.context == "context"
+
+    with pytest.raises(KeyError):
+        BatchRequestBuilder("query", swapi_schema, Settings()).operation(
+            film, ["title"], foo="bar"
+        ).build()
+
+
+# skipcq: PY-D0003
+def test_request_builder_pretty_queries(swapi_schema, fake_backend):
+    from qlient.core.proxies import QueryServiceProxy
+    from qlient.core.settings import Settings
+
+    settings = Settings(pretty_queries=True)
+    proxy = QueryServiceProxy(fake_backend, settings, swapi_schema, [])
+    request = proxy.film.create_request(["title"], id="1")
+    assert (
+        request.query == "query film($id: ID) {\n  film(id: $id) {\n    title\n  }\n}"
+    )
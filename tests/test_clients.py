@@ -1,5 +1,7 @@
 import pytest
 
+from conftest import retype_swapi_film_id
+
 from qlient.core import (
     Client,
     AsyncClient,
@@ -57,6 +59,20 @@ def test_client_mutation(strawberry_backend):
     assert result.data["addBook"] == {"title": "1984", "author": "George Orwell"}
 
 
+def test_client_prepared_operation(strawberry_backend):
+    client = Client(strawberry_backend)
+    get_books = client.query.getBooks.prepare(["title"])
+    for _ in range(2):
+        response = get_books()
+        assert response.data == {"getBooks": [{"title": "The Great Gatsby"}]}
+
+    count = client.subscription.count.prepare(None, ["target"])
+    request = count.create_request(_subscription_id="1", target=3)
+    assert isinstance(request, GraphQLSubscriptionRequest)
+    assert request.subscription_id == "1"
+    assert request.variables == {"target": 3}
+
+
 def test_client_subscription(strawberry_backend):
     client = Client(strawberry_backend)
     result = client.subscription.count(target=5)
@@ -100,6 +116,26 @@ async def test_async_client_query(async_strawberry_backend):
         assert isinstance(result.data["getBooks"], list)
 
 
+@pytest.mark.asyncio
+async def test_async_client_partial_introspection(async_strawberry_backend):
+    settings = Settings(partial_introspection=True)
+    async with AsyncClient(async_strawberry_backend, settings=settings) as client:
+        result = await client.query.getBooks()
+        assert result.data["getBooks"][0].keys() == {"title", "author"}
+        assert "Book" in client.schema.types_registry.materialized
+
+
+@pytest.mark.asyncio
+async def test_async_client_does_not_refresh_partial_schemas(
+    async_strawberry_backend,
+):
+    settings = Settings(partial_introspection=True, schema_refresh_interval=0.01)
+    async with AsyncClient(async_strawberry_backend, settings=settings) as client:
+        assert client.schema is not None
+        # the refresh check would only cover the root types
+        assert client._refresh_task is None
+
+
 @pytest.mark.asyncio
 async def test_async_client_mutation(async_strawberry_backend):
     async with AsyncClient(async_strawberry_backend) as client:
@@ -146,3 +182,356 @@ async def test_async_client_mutation_non_async_backend(strawberry_backend):
         assert isinstance(result, GraphQLResponse)
         assert isinstance(result.data["addBook"], dict)
         assert result.data["addBook"] == {"title": "1984", "author": "George Orwell"}
+
+
+# skipcq: PY-D0003
+def test_client_introspection_cache(strawberry_backend, tmp_path, mocker):
+    settings = Settings(introspection_cache_dir=tmp_path)
+    # the endpoint identifies the server in the cache
+    strawberry_backend.endpoint = "https://books.example.com/graphql"
+    first = Client(strawberry_backend, settings=settings)
+    assert first.schema is not None
+    assert list(tmp_path.iterdir())
+
+    spy = mocker.spy(strawberry_backend, "execute_query")
+    second = Client(strawberry_backend, settings=settings)
+    assert second.schema.raw_schema == first.schema.raw_schema
+    assert spy.call_count == 0
+
+
+# skipcq: PY-D0003
+def test_client_introspection_settings(strawberry_backend):
+    settings = Settings(use_schema_description=False, introspection_type_ref_depth=3)
+    client = Client(strawberry_backend, settings=settings)
+    from qlient.core.schema.providers import BackendSchemaProvider
+
+    provider = client._create_schema_provider(BackendSchemaProvider)
+    assert "description" not in provider.introspection_query
+    assert provider.introspection_query.count("ofType") == 3
+    assert client.schema.query_type is not None
+
+
+class _ChangingSchemaBackend:
+    def __init__(self, raw_schema):
+        self.raw_schema = raw_schema
+        self.operations = []
+
+    async def execute_query(self, request):
+        from qlient.core.models import GraphQLResponse as Response
+
+        self.operations.append(request.operation_name)
+        return Response(request, {"data": {"__schema": self.raw_schema}})
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_client_refresh_schema(raw_swapi_schema):
+    from qlient.core.backends import AsyncBackend
+    from qlient.core.schema.models import Kind
+    from qlient.core.schema.providers import AsyncBackendSchemaProvider
+
+    class MyAsyncBackend(_ChangingSchemaBackend, AsyncBackend):
+        pass
+
+    backend = MyAsyncBackend(raw_swapi_schema)
+    async with AsyncClient(backend) as client:
+        old_schema = client.schema
+        old_query = client.query
+        in_flight = old_query.film
+
+        # unchanged schema, only the validator query is sent
+        assert not await client.refresh_schema()
+        assert client.schema is old_schema
+        assert backend.operations[-1] == (
+            AsyncBackendSchemaProvider.VALIDATOR_OPERATION_NAME
+        )
+
+        # only an argument type changed, the schema gets swapped
+        backend.raw_schema = retype_swapi_film_id(raw_swapi_schema)
+        assert await client.refresh_schema()
+        assert client.schema is not old_schema
+        film = client.schema.query_type.field_name_to_field["film"]
+        assert film.arg_name_to_arg["id"].type.kind == Kind.NON_NULL
+        retyped_schema = client.schema
+
+        backend.raw_schema = {
+            **raw_swapi_schema,
+            "types": [t for t in raw_swapi_schema["types"] if t["name"] != "Planet"],
+        }
+        assert await client.refresh_schema()
+        assert client.schema is not retyped_schema
+        assert client.schema.Planet is None
+        assert client.query is not old_query
+        assert client.query.schema is client.schema
+        # requests already in flight keep using the old schema
+        assert in_flight.proxy.schema is old_schema
+        assert old_schema.Planet is not None
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_client_background_schema_refresh(raw_swapi_schema):
+    import asyncio
+
+    from qlient.core.backends import AsyncBackend
+
+    class MyAsyncBackend(_ChangingSchemaBackend, AsyncBackend):
+        pass
+
+    backend = MyAsyncBackend(raw_swapi_schema)
+    settings = Settings(schema_refresh_interval=0.01)
+    async with AsyncClient(backend, settings=settings) as client:
+        old_schema = client.schema
+        backend.raw_schema = {
+            **raw_swapi_schema,
+            "types": raw_swapi_schema["types"][1:],
+        }
+        for _ in range(200):
+            if client.schema is not old_schema:
+                break
+            await asyncio.sleep(0.01)
+        assert client.schema is not old_schema
+        refresh_task = client._refresh_task
+        assert not refresh_task.done()
+    assert refresh_task.cancelled()
+    assert client._refresh_task is None
+
+
+class _PersistedQueriesServer:
+    """Stand-in for a server with automatic persisted queries"""
+
+    def __init__(self, backend, supported: bool = True):
+        self.backend = backend
+        self.supported = supported
+        self.persisted = {}
+        self.sent = []
+
+    def _resolve(self, request):
+        from qlient.core.models import GraphQLRequest, query_hash
+
+        self.sent.append((request.query is not None, request.extensions))
+        persisted_query = (request.extensions or {}).get("persistedQuery")
+        if persisted_query is None:
+            return request, None
+        if not self.supported:
+            return None, {"errors": [{"message": "PersistedQueryNotSupported"}]}
+        sha256_hash = persisted_query["sha256Hash"]
+        if request.query is not None:
+            assert query_hash(request.query) == sha256_hash
+            self.persisted[sha256_hash] = request.query
+        if sha256_hash not in self.persisted:
+            return None, {
+                "errors": [
+                    {
+                        "message": "PersistedQueryNotFound",
+                        "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    }
+                ]
+            }
+        resolved = GraphQLRequest(
+            query=self.persisted[sha256_hash],
+            variables=request.variables,
+            operation_name=request.operation_name,
+        )
+        return resolved, None
+
+    def execute_query(self, request):
+        resolved, errors = self._resolve(request)
+        if resolved is None:
+            return GraphQLResponse(request, errors)
+        return self.backend.execute_query(resolved)
+
+    def execute_mutation(self, request):
+        return self.execute_query(request)
+
+    def execute_subscription(self, request):
+        return self.backend.execute_subscription(request)
+
+
+def test_client_persisted_queries(strawberry_backend):
+    from qlient.core.backends import Backend
+
+    class MyBackend(_PersistedQueriesServer, Backend):
+        pass
+
+    backend = MyBackend(strawberry_backend)
+    client = Client(backend, settings=Settings(persisted_queries=True))
+    assert client.schema is not None
+    backend.sent.clear()  # skip the introspection query
+    expected = {"getBooks": [{"title": "The Great Gatsby"}]}
+
+    # the first request registers the query, the second only sends the hash
+    for _ in range(2):
+        response = client.query.getBooks(["title"])
+        assert response.data == expected
+    assert [query_sent for query_sent, _ in backend.sent] == [False, True, False]
+    sha256_hash = client.query.getBooks.create_request(["title"]).query_hash
+    assert backend.sent[-1][1] == {
+        "persistedQuery": {"version": 1, "sha256Hash": sha256_hash}
+    }
+    assert list(backend.persisted) == [sha256_hash]
+    assert not client.subscription.use_persisted_queries
+
+
+def test_client_persisted_queries_not_supported(strawberry_backend):
+    from qlient.core.backends import Backend
+
+    class MyBackend(_PersistedQueriesServer, Backend):
+        pass
+
+    backend = MyBackend(strawberry_backend, supported=False)
+    client = Client(backend, settings=Settings(persisted_queries=True))
+    assert client.schema is not None
+    backend.sent.clear()  # skip the introspection query
+
+    for _ in range(2):
+        response = client.query.getBooks(["title"])
+        assert response.data == {"getBooks": [{"title": "The Great Gatsby"}]}
+    # after the first rejection, only the plain query is sent
+    assert backend.sent == [(False, backend.sent[0][1]), (True, None), (True, None)]
+    assert not client.query.use_persisted_queries
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_client_persisted_queries(async_strawberry_backend):
+    from qlient.core.backends import AsyncBackend
+
+    class MyAsyncBackend(_PersistedQueriesServer, AsyncBackend):
+        async def execute_query(self, request):
+            resolved, errors = self._resolve(request)
+            if resolved is None:
+                return GraphQLResponse(request, errors)
+            return await self.backend.execute_query(resolved)
+
+        async def execute_mutation(self, request):
+            return await self.execute_query(request)
+
+    backend = MyAsyncBackend(async_strawberry_backend)
+    settings = Settings(persisted_queries=True)
+    async with AsyncClient(backend, settings=settings) as client:
+        backend.sent.clear()  # skip the introspection query
+        for _ in range(2):
+            response = await client.query.getBooks(["title"])
+            assert response.data == {"getBooks": [{"title": "The Great Gatsby"}]}
+    assert [query_sent for query_sent, _ in backend.sent] == [False, True, False]
+
+
+def test_client_batch(strawberry_backend):
+    from qlient.core.backends import Backend
+    from qlient.core.exceptions import QlientException
+
+    class MyBackend(_PersistedQueriesServer, Backend):
+        pass
+
+    backend = MyBackend(strawberry_backend)
+    client = Client(backend)
+    assert client.schema is not None
+    backend.sent.clear()  # skip the introspection query
+
+    batch = client.query.create_batch()
+    assert batch.getBooks(["title"]) == 0
+    assert batch.getBooks(iter(["author"])) == 1
+    assert len(batch) == 2
+    assert isinstance(repr(batch), str)
+    first, second = batch.send()
+    # both calls are sent within a single request
+    assert len(backend.sent) == 1
+    assert first.data == {"getBooks": [{"title": "The Great Gatsby"}]}
+    assert second.data == {"getBooks": [{"author": "F. Scott Fitzgerald"}]}
+    assert first.errors is None
+    # the batch document is cached like the documents of single operations
+    batch.send()
+    assert client.query.query_cache.hits == 1
+
+    assert client.query.create_batch().send() == []
+    with pytest.raises(AttributeError):
+        client.query.create_batch().iDoNotExist()
+    with pytest.raises(QlientException):
+        client.subscription.create_batch()
+
+
+def test_batch_split_response_errors(swapi_schema, fake_backend):
+    from qlient.core.models import GraphQLRequest
+
+    proxy = QueryServiceProxy(fake_backend, Settings(), swapi_schema, [])
+    batch = proxy.create_batch()
+    batch.film(["title"], id="1")
+    batch.film(["title"], id="2")
+    request = batch.create_request()
+    assert request.operation_name == "batch"
+    assert request.query.startswith("query batch")
+    path_error = {"message": "not found", "path": ["_1", "title"]}
+    shared_error = {"message": "rate limited"}
+    # errors with a path outside of the generated aliases belong to all calls
+    unknown_path_error = {"message": "oops", "path": ["film", "title"]}
+    response = GraphQLResponse(
+        request,
+        {
+            "data": {"_0": {"title": "A New Hope"}, "_1": None},
+            "errors": [path_error, shared_error, unknown_path_error],
+        },
+    )
+
+    first, second = batch.split_response(response)
+    # the split responses keep the merged request that was sent
+    assert first.request is request and second.request is request
+    assert first.data == {"film": {"title": "A New Hope"}}
+    assert first.errors == [shared_error, unknown_path_error]
+    assert second.data == {"film": None}
+    assert second.errors == [
+        {"message": "not found", "path": ["film", "title"]},
+        shared_error,
+        unknown_path_error,
+    ]
+
+    failed = batch.split_response(
+        GraphQLResponse(GraphQLRequest(), {"data": None, "errors": [shared_error]})
+    )
+    assert [r.data for r in failed] == [None, None]
+    assert [r.errors for r in failed] == [[shared_error], [shared_error]]
+
+
+def test_batch_operation_name(swapi_schema, fake_backend):
+    proxy = QueryServiceProxy(fake_backend, Settings(), swapi_schema, [])
+    batch = proxy.create_batch(_operation_name="films")
+    batch.film(["title"], id="1")
+    request = batch.create_request()
+    assert request.operation_name == "films"
+    assert request.query.startswith("query films")
+    # the operation name is part of the cached document
+    other = proxy.create_batch()
+    other.film(["title"], id="1")
+    assert other.create_request().operation_name == "batch"
+    assert other.create_request().query.startswith("query batch")
+
+
+def test_batch_does_not_shadow_operations(raw_swapi_schema, fake_backend):
+    import copy
+
+    from qlient.core.schema.schema import Schema
+
+    raw_schema = copy.deepcopy(raw_swapi_schema)
+    root = next(t for t in raw_schema["types"] if t["name"] == "Root")
+    next(f for f in root["fields"] if f["name"] == "film")["name"] = "batch"
+    proxy = QueryServiceProxy(fake_backend, Settings(), Schema(raw_schema, None), [])
+    # a root operation named batch is still reachable as an attribute
+    assert proxy.batch.create_request(["title"], id="1").operation_name == "batch"
+    batch = proxy.create_batch()
+    batch.batch(["title"], id="1")
+    assert batch.create_request().query.startswith("query batch")
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_client_batch(async_strawberry_backend):
+    async with AsyncClient(async_strawberry_backend) as client:
+        batch = client.query.create_batch()
+        batch.getBooks(["title"])
+        batch.getBooks(["author"])
+        first, second = await batch.send()
+        get_books = await client.query.getBooks.prepare_async(["title"])
+        response = await get_books()
+    assert response.data == first.data
+    assert first.data == {"getBooks": [{"title": "The Great Gatsby"}]}
+    assert second.data == {"getBooks": [{"author": "F. Scott Fitzgerald"}]}
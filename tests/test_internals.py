@@ -1,6 +1,13 @@
+import concurrent.futures
+
 import pytest
 
-from qlient.core._internal import await_if_coro
+from qlient.core._internal import (
+    LRUCache,
+    await_if_coro,
+    get_process_pool,
+    run_in_executor,
+)
 
 
 @pytest.mark.asyncio
@@ -17,3 +24,51 @@ async def test_await_if_coro_with_result():
         return None
 
     assert await await_if_coro(_()) is None
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+async def test_run_in_executor(executor):
+    assert await run_in_executor(executor, divmod, 7, 2) == (3, 1)
+    assert await run_in_executor(executor, int, "11", base=2) == 3
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_run_in_executor_instance():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        assert await run_in_executor(executor, divmod, 7, 2) == (3, 1)
+    with pytest.raises(ValueError):
+        await run_in_executor("fiber", divmod, 7, 2)
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_run_in_executor_shares_the_process_pool():
+    import os
+
+    first_pid = await run_in_executor("process", os.getpid)
+    assert first_pid != os.getpid()
+    # the worker process is kept alive between the calls
+    assert await run_in_executor("process", os.getpid) == first_pid
+    assert get_process_pool() is get_process_pool()
+
+
+# skipcq: PY-D0003
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    assert cache.get("a") is None
+    assert cache.put("a", 1) == 1
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    # "b" is the least recently used value now
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert isinstance(repr(cache), str)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert LRUCache(maxsize=0).put("a", 1) == 1
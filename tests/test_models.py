@@ -1,6 +1,7 @@
 import pytest
 
 from qlient.core.models import Field, Directive, Fields, PreparedDirective
+from qlient.core.models import GraphQLResponse
 
 
 # skipcq: PY-D0003
@@ -360,3 +361,141 @@ def test_graphql_response(graphql_response):
     assert graphql_response.data == {"testOperation": {"foo": "", "bar": ""}}
     assert graphql_response.errors == []
     assert graphql_response.extensions == []
+
+
+# skipcq: PY-D0003
+def test_persisted_query_error(graphql_request):
+    from qlient.core.persisted_queries import (
+        hash_only_request,
+        persisted_query_error,
+        register_query_request,
+    )
+
+    not_found = {"errors": [{"extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}]}
+    assert persisted_query_error(GraphQLResponse(graphql_request, not_found)) == (
+        "PersistedQueryNotFound"
+    )
+    not_supported = {"errors": [{"message": "PersistedQueryNotSupported"}]}
+    assert persisted_query_error(GraphQLResponse(graphql_request, not_supported)) == (
+        "PersistedQueryNotSupported"
+    )
+    other = {"errors": [{"message": "Cannot query field"}]}
+    assert persisted_query_error(GraphQLResponse(graphql_request, other)) is None
+
+    hash_only = hash_only_request(graphql_request)
+    assert hash_only.query is None
+    assert hash_only.variables == graphql_request.variables
+    assert hash_only.extensions["persistedQuery"] == {
+        "version": 1,
+        "sha256Hash": graphql_request.query_hash,
+    }
+    assert register_query_request(graphql_request).query == graphql_request.query
+
+
+# skipcq: PY-D0003
+def test_selection_nodes_are_shared():
+    sub_fields = Fields("b", "c")
+    field = Field("a", _alias="x", _sub_fields=sub_fields)
+    assert hash(field) == hash(("x", "a", None, sub_fields))
+    assert hash(sub_fields) == hash((Field("b"), Field("c")))
+    # the sub selection is shared, not copied
+    assert field.sub_fields is sub_fields
+
+    selection = Fields("d", field)
+    combined = selection + Field("e") + ["f"]
+    assert [f.name for f in combined.selected_fields] == ["d", "a", "e", "f"]
+    assert combined.selected_fields[1] is field
+    assert selection.selected_fields == [Field("d"), field]
+    assert field in combined and "e" in combined and "e" not in selection
+    assert selection + None is selection
+    assert len(combined) == 4
+
+
+# skipcq: PY-D0003
+def test_changing_a_field_invalidates_cached_hashes():
+    inner = Field("b")
+    field = Field("a", _sub_fields=Fields(inner))
+    selection = Fields(field)
+    before = hash(selection)
+
+    field.alias = "x"
+    assert hash(field) == hash(("x", "a", None, field.sub_fields))
+    assert hash(selection) != before
+
+    # changes of nested fields reach the selections that contain them
+    before = hash(selection)
+    inner.name = "c"
+    assert hash(selection) != before
+    assert hash(selection) == hash(Fields(Field("a", "x", _sub_fields=["c"])))
+
+    field.sub_fields = ["d"]
+    assert isinstance(field.sub_fields, Fields)
+    assert field.sub_fields == Fields("d")
+    field.directive = None
+    field.name = "e"
+    assert field.name == "e"
+
+
+# skipcq: PY-D0003
+def test_fields_composition_is_chained():
+    base = Fields("a")
+    left = base + Field("b")
+    right = base + Field("c")
+    # the branches of a shared base do not see each other
+    assert [f.name for f in left.selected_fields] == ["a", "b"]
+    assert [f.name for f in right.selected_fields] == ["a", "c"]
+    assert base.selected_fields == [Field("a")]
+
+    # long chains are flattened without recursion
+    selection = Fields()
+    for index in range(20000):
+        selection = selection + Field(f"f{index}")
+    selection = selection + Field("f0")
+    assert len(selection) == 20000
+    assert selection == Fields(*(f"f{index}" for index in range(20000)))
+
+
+# skipcq: PY-D0003
+def test_prepared_selections_are_cached(raw_swapi_schema):
+    from qlient.core.schema.schema import Schema
+
+    schema = Schema(raw_swapi_schema, None)
+    selection = Fields("title", characterConnection=["totalCount"])
+    prepared = selection.prepare(schema.Film, schema)
+    assert (
+        Fields("title", characterConnection=["totalCount"]).prepare(schema.Film, schema)
+        is prepared
+    )
+    assert prepared.__gql__() == "title characterConnection { totalCount }"
+    assert prepared.__gql__() is prepared.__gql__()
+    # the sub selection is cached on its own parent type
+    assert Fields("totalCount").prepare(schema.FilmCharactersConnection, schema) is (
+        prepared.fields[1].sub_fields
+    )
+    assert Fields("title").prepare(schema.Film, schema) is not prepared
+
+    # another schema, e.g. a swapped one, validates the selection again
+    other_schema = Schema(raw_swapi_schema, None)
+    assert len(other_schema.prepared_selections) == 0
+    other = selection.prepare(other_schema.Film, other_schema)
+    assert other is not prepared
+    assert other.fields[0].parent_type is other_schema.Film
+
+
+# skipcq: PY-D0003
+def test_models_are_slotted(graphql_request, graphql_subscription_request):
+    from qlient.core.models import PreparedField, PreparedFields
+
+    models = (
+        Directive("include"),
+        PreparedDirective(),
+        Field("a"),
+        PreparedField(),
+        Fields("a"),
+        PreparedFields(),
+        graphql_request,
+        graphql_subscription_request,
+        GraphQLResponse(graphql_request, {}),
+    )
+    for model in models:
+        assert not hasattr(model, "__dict__")
@@ -41,3 +41,146 @@ def test_query_service_proxy(swapi_schema, fake_backend):
 
     with pytest.raises(AttributeError):
         _ = proxy["iDoNotExists"]
+
+
+def test_operation_proxy_query_cache(swapi_schema, fake_backend):
+    proxy = QueryServiceProxy(fake_backend, Settings(), swapi_schema, [])
+    uncached = QueryServiceProxy(
+        fake_backend, Settings(request_cache_size=0), swapi_schema, []
+    )
+
+    first = proxy.film.create_request(["title"], id="1")
+    second = proxy.film.create_request(["title"], id="2", _context="context")
+    assert (proxy.query_cache.hits, proxy.query_cache.misses) == (1, 1)
+    assert second.query == first.query
+    assert second.query == uncached.film.create_request(["title"], id="2").query
+    assert second.variables == {"id": "2"}
+    assert second.operation_name == "film"
+    assert second.context == "context"
+
+    # another selection or other variables are built again
+    proxy.film.create_request(["title", "director"], id="1")
+    proxy.film.create_request(["title"], filmID="1")
+    assert (proxy.query_cache.hits, proxy.query_cache.misses) == (1, 3)
+    assert len(uncached.query_cache) == 0
+
+    # the default selection is cached as well
+    query = proxy.allFilms.create_request().query
+    assert proxy.allFilms.create_request().query == query
+    assert query == uncached.allFilms.create_request().query
+    assert proxy.query_cache.hits == 2
+
+
+def test_query_cache_follows_settings(swapi_schema, fake_backend):
+    settings = Settings()
+    proxy = QueryServiceProxy(fake_backend, settings, swapi_schema, [])
+    query = proxy.allFilms.create_request().query
+
+    # settings that change the document are part of the cache key
+    settings.lookup_recursion_depth = 2
+    deeper = proxy.allFilms.create_request().query
+    assert len(deeper) > len(query)
+    settings.pretty_queries = True
+    assert proxy.allFilms.create_request().query != deeper
+    settings.allow_auto_lookup = False
+    settings.pretty_queries = False
+    assert proxy.allFilms.create_request().query != query
+
+    batch = proxy.create_batch()
+    batch.allFilms()
+    batched = batch.create_request().query
+    settings.allow_auto_lookup = True
+    assert batch.create_request().query != batched
+
+    settings.lookup_recursion_depth = 1
+    assert proxy.allFilms.create_request().query == query
+
+
+def test_auto_selection_is_memoized(raw_swapi_schema, fake_backend):
+    from qlient.core.schema.schema import Schema
+
+    schema = Schema(raw_swapi_schema, None)
+    settings = Settings(request_cache_size=0)
+    proxy = QueryServiceProxy(fake_backend, settings, schema, [])
+    query = proxy.allFilms.create_request().query
+    prepared = schema.auto_selections[("FilmsConnection", 1)]
+    assert proxy.allFilms.create_request().query == query
+    assert schema.auto_selections[("FilmsConnection", 1)] is prepared
+
+    # the selection depends on the lookup depth
+    deeper = QueryServiceProxy(
+        fake_backend, Settings(lookup_recursion_depth=2), schema, []
+    )
+    assert len(deeper.allFilms.create_request().query) > len(query)
+    assert ("FilmsConnection", 2) in schema.auto_selections
+
+    # a new schema starts without any selections
+    new_schema = Schema(raw_swapi_schema, None)
+    assert new_schema.auto_selections == {}
+    new_proxy = QueryServiceProxy(fake_backend, settings, new_schema, [])
+    assert new_proxy.allFilms.create_request().query == query
+    assert new_schema.auto_selections[("FilmsConnection", 1)] is not prepared
+
+
+def test_prepared_operation(swapi_schema, fake_backend):
+    from qlient.core.proxies import PreparedOperation
+
+    settings = Settings(persisted_queries=True)
+    proxy = QueryServiceProxy(fake_backend, settings, swapi_schema, [])
+    prepared = proxy.film.prepare(["title"], ["id"], _context="default")
+    assert isinstance(prepared, PreparedOperation)
+    assert isinstance(str(prepared), str)
+    assert isinstance(repr(prepared), str)
+    assert prepared.variable_types == {"id": "ID"}
+    assert prepared.selection is not None
+
+    request = prepared.create_request(id="1")
+    assert request.query == proxy.film.create_request(["title"], id="1").query
+    assert request.variables == {"id": "1"}
+    assert request.operation_name == "film"
+    assert request.context == "default"
+    assert request.query_hash == prepared.document.query_hash
+    assert prepared.create_request(_context="other").context == "other"
+
+    with pytest.raises(KeyError):
+        prepared.create_request(filmID="1")
+    with pytest.raises(KeyError):
+        proxy.film.prepare(["title"], ["foo"])
+
+
+def test_lazy_operation_bindings(github_schema, swapi_schema, fake_backend):
+    from qlient.core.proxies import LazyOperations, MutationServiceProxy
+
+    proxy = MutationServiceProxy(fake_backend, Settings(), github_schema, [])
+    assert isinstance(proxy.operations, LazyOperations)
+    assert isinstance(repr(proxy.operations), str)
+    names = [field.name for field in github_schema.mutation_type.fields]
+    assert proxy.supported_bindings == names
+    assert "addComment" in proxy
+    assert "addComment" in dir(proxy)
+    # nothing is created before the first access
+    assert proxy.operations.materialized == []
+
+    operation = proxy.addComment
+    assert proxy["addComment"] is operation
+    assert proxy.operations.materialized == ["addComment"]
+    with pytest.raises(AttributeError):
+        _ = proxy.iDoNotExist
+    assert [name for name, _ in proxy] == names
+
+    # a schema without mutations has no bindings at all
+    empty = MutationServiceProxy(fake_backend, Settings(), swapi_schema, [])
+    assert empty.supported_bindings == []
+
+
+# skipcq: PY-D0003
+def test_changed_fields_are_not_served_from_the_query_cache(swapi_schema, fake_backend):
+    from qlient.core.models import Field, Fields
+
+    proxy = QueryServiceProxy(fake_backend, Settings(), swapi_schema, [])
+    field = Field("title")
+    selection = Fields(field)
+    assert "title" in proxy.film.create_request(selection, id="1").query
+    field.name = "director"
+    query = proxy.film.create_request(selection, id="1").query
+    assert "director" in query and "title" not in query
@@ -0,0 +1,243 @@
+import gc
+import threading
+
+import pytest
+
+from qlient.core import Client, AsyncClient, Settings
+from qlient.core.proxies import QueryServiceProxy
+from qlient.core.registry import SchemaRegistry, schema_registry
+from qlient.core.schema.schema import Schema
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_registry():
+    schema_registry.clear()
+    yield
+    schema_registry.clear()
+
+
+# skipcq: PY-D0003
+def test_schema_registry_register(raw_swapi_schema):
+    registry = SchemaRegistry()
+    schema = Schema(raw_swapi_schema, None)
+    assert registry.register("swapi", schema) is schema
+    # the same content is not registered twice
+    assert registry.register("swapi", Schema(raw_swapi_schema, None)) is schema
+    assert registry.get("swapi") is schema
+
+    # a changed schema replaces the registered one
+    other_types = raw_swapi_schema["types"][1:]
+    other_schema = Schema({**raw_swapi_schema, "types": other_types}, None)
+    assert registry.register("swapi", other_schema) is other_schema
+    assert registry.get("swapi") is other_schema
+    assert len(registry) == 1
+    assert isinstance(repr(registry), str)
+
+
+# skipcq: PY-D0003
+def test_schema_registry_weak_references(raw_swapi_schema):
+    registry = SchemaRegistry()
+    registry.register("swapi", Schema(raw_swapi_schema, None))
+    gc.collect()
+    assert registry.get("swapi") is None
+    assert len(registry) == 0
+
+
+# skipcq: PY-D0003
+def test_schema_registry_get_or_load_threads(raw_swapi_schema):
+    registry = SchemaRegistry()
+    loads = []
+    barrier = threading.Barrier(8)
+    results = []
+
+    def load():
+        loads.append(1)
+        return Schema(raw_swapi_schema, None)
+
+    def worker():
+        barrier.wait()
+        results.append(registry.get_or_load("swapi", load))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+    # the load locks are dropped once the schema is loaded
+    assert registry._load_locks == {}
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_schema_registry_get_or_load_async(raw_swapi_schema):
+    import asyncio
+
+    registry = SchemaRegistry()
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return Schema(raw_swapi_schema, None)
+
+    results = await asyncio.gather(
+        *(registry.get_or_load_async("swapi", load) for _ in range(8))
+    )
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+    assert registry._async_loads == {}
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_schema_registry_get_or_load_async_failure(raw_swapi_schema):
+    import asyncio
+
+    registry = SchemaRegistry()
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("introspection failed")
+
+    results = await asyncio.gather(
+        *(registry.get_or_load_async("swapi", load) for _ in range(4)),
+        return_exceptions=True,
+    )
+    assert len(loads) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert registry._async_loads == {}
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_schema_registry_get_or_load_async_cancelled(raw_swapi_schema):
+    import asyncio
+
+    registry = SchemaRegistry()
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.05 if len(loads) == 1 else 0)
+        return Schema(raw_swapi_schema, None)
+
+    first = asyncio.ensure_future(registry.get_or_load_async("swapi", load))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(registry.get_or_load_async("swapi", load))
+    await asyncio.sleep(0)
+    first.cancel()
+    # the waiting coroutine loads the schema itself
+    schema = await second
+    assert schema.query_type.name == "Root"
+    assert len(loads) == 2
+    assert first.cancelled()
+
+
+# skipcq: PY-D0003
+def test_schema_registry_service_proxy(swapi_schema, fake_backend):
+    registry = SchemaRegistry()
+    settings = Settings()
+    proxy = registry.get_service_proxy(
+        QueryServiceProxy, fake_backend, settings, swapi_schema, []
+    )
+    assert proxy is registry.get_service_proxy(
+        QueryServiceProxy, fake_backend, settings, swapi_schema, []
+    )
+    assert proxy is not registry.get_service_proxy(
+        QueryServiceProxy, fake_backend, Settings(), swapi_schema, []
+    )
+
+
+# skipcq: PY-D0003
+def test_client_share_schema(strawberry_backend, mocker):
+    settings = Settings(share_schema=True)
+    first = Client(strawberry_backend, settings=settings)
+    spy = mocker.spy(strawberry_backend, "execute_query")
+    second = Client(strawberry_backend, settings=settings)
+    assert first.schema is not None
+    assert second.schema is first.schema
+    assert spy.call_count == 1
+    assert second.query is first.query
+
+    # clients without shared schemas load their own
+    assert Client(strawberry_backend).schema is not first.schema
+
+
+class _SchemaServer:
+    def __init__(self, raw_schema):
+        self.raw_schema = raw_schema
+        self.operations = []
+
+    def execute_query(self, request):
+        from qlient.core.models import GraphQLResponse
+
+        self.operations.append(request.operation_name)
+        return GraphQLResponse(request, {"data": {"__schema": self.raw_schema}})
+
+
+# skipcq: PY-D0003
+def test_client_share_schema_per_backend(raw_swapi_schema, raw_github_schema):
+    from qlient.core.backends import Backend
+
+    # neither of them has an endpoint, so their class does not tell them apart
+    class MyBackend(_SchemaServer, Backend):
+        pass
+
+    settings = Settings(share_schema=True)
+    swapi = Client(MyBackend(raw_swapi_schema), settings=settings)
+    github_backend = MyBackend(raw_github_schema["data"]["__schema"])
+    github = Client(github_backend, settings=settings)
+    assert swapi.schema is not github.schema
+    assert swapi.schema.query_type.name == "Root"
+    assert github.schema.query_type.name == "Query"
+
+    # another backend of the same server loads the schema itself,
+    # but gets the shared instance as the fingerprint matches
+    other_backend = MyBackend(raw_swapi_schema)
+    other_swapi = Client(other_backend, settings=settings)
+    assert other_swapi.schema is swapi.schema
+    assert len(other_backend.operations) == 1
+
+    # clients of the same backend share it without loading it again
+    assert Client(other_backend, settings=settings).schema is swapi.schema
+    assert len(other_backend.operations) == 1
+
+
+# skipcq: PY-D0003
+def test_backend_key(fake_backend):
+    from qlient.core.registry import BackendKey
+
+    assert BackendKey(fake_backend) == BackendKey(fake_backend)
+    assert hash(BackendKey(fake_backend)) == hash(BackendKey(fake_backend))
+    assert BackendKey(fake_backend) != BackendKey(fake_backend, "partial")
+    assert BackendKey(fake_backend) != BackendKey(type(fake_backend)())
+    assert isinstance(repr(BackendKey(fake_backend)), str)
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_client_share_schema(async_strawberry_backend):
+    settings = Settings(share_schema=True)
+    async with AsyncClient(async_strawberry_backend, settings=settings) as first:
+        async with AsyncClient(async_strawberry_backend, settings=settings) as second:
+            assert second.schema is first.schema
+            assert second.query is first.query
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_clients_share_one_introspection(async_strawberry_backend, mocker):
+    import asyncio
+
+    settings = Settings(share_schema=True)
+    spy = mocker.spy(async_strawberry_backend, "execute_query")
+    clients = [
+        AsyncClient(async_strawberry_backend, settings=settings) for _ in range(4)
+    ]
+    await asyncio.gather(*(client.__aenter__() for client in clients))
+    assert spy.call_count == 1
+    assert all(client.schema is clients[0].schema for client in clients)
@@ -0,0 +1,116 @@
+import types
+
+import pytest
+
+from conftest import path_to_swapi_schema
+from qlient.core.proxies import QueryServiceProxy
+from qlient.core.schema.codegen import (
+    generate_schema_module,
+    load_schema_module,
+    main,
+    write_schema_module,
+)
+from qlient.core.schema.providers import ModuleSchemaProvider
+from qlient.core.settings import Settings
+
+
+# skipcq: PY-D0003
+def _import_schema_module(schema) -> types.ModuleType:
+    module = types.ModuleType("generated_schema")
+    exec(generate_schema_module(schema), module.__dict__)  # skipcq: PYL-W0122
+    return module
+
+
+# skipcq: PY-D0003
+def _describe_type(_type):
+    return (
+        _type.kind,
+        _type.name,
+        _type.description,
+        [
+            (
+                field.name,
+                field.description,
+                field.type.graphql_representation,
+                field.output_type_name,
+                field.is_deprecated,
+                field.deprecation_reason,
+                [
+                    (arg.name, arg.type.graphql_representation, arg.default_value)
+                    for arg in field.args
+                ],
+            )
+            for field in _type.fields
+        ],
+        [
+            (input_field.name, input_field.type.graphql_representation)
+            for input_field in _type.input_fields
+        ],
+        [interface.name for interface in _type.interfaces],
+        [(value.name, value.is_deprecated) for value in _type.enum_values],
+        [possible_type.name for possible_type in _type.possible_types],
+    )
+
+
+# skipcq: PY-D0003
+@pytest.mark.parametrize("schema_fixture", ["swapi_schema", "github_schema"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_schema_module_roundtrip(request, schema_fixture, lazy):
+    schema = request.getfixturevalue(schema_fixture)
+    parse_result = load_schema_module(_import_schema_module(schema), lazy=lazy)
+
+    assert parse_result.fingerprint == schema.fingerprint
+    assert parse_result.query_type.name == schema.query_type.name
+    assert set(parse_result.types) == set(schema.types_registry)
+    for name, _type in schema.types_registry.items():
+        assert _describe_type(parse_result.types[name]) == _describe_type(_type)
+    assert set(parse_result.directives) == set(schema.directives_registry)
+    for name, directive in schema.directives_registry.items():
+        generated = parse_result.directives[name]
+        assert generated.locations == directive.locations
+        assert [arg.name for arg in generated.args] == [
+            arg.name for arg in directive.args
+        ]
+
+
+# skipcq: PY-D0003
+def test_schema_module_lazy(github_schema):
+    module = _import_schema_module(github_schema)
+    parse_result = load_schema_module(module, lazy=True)
+    assert parse_result.types.materialized == ["Query", "Mutation"]
+    repository = parse_result.types["Repository"]
+    owner = repository.field_name_to_field["owner"]
+    assert owner.output_type is parse_result.types["RepositoryOwner"]
+
+
+# skipcq: PY-D0003
+def test_module_schema_provider(tmp_path, monkeypatch, swapi_schema, fake_backend):
+    write_schema_module(swapi_schema, tmp_path / "swapi_generated.py")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    provider = ModuleSchemaProvider("swapi_generated")
+    schema = provider.load_schema()
+    assert schema.fingerprint == swapi_schema.fingerprint
+    assert schema.raw_schema is None
+
+    settings = Settings()
+    generated_proxy = QueryServiceProxy(fake_backend, settings, schema, [])
+    parsed_proxy = QueryServiceProxy(fake_backend, settings, swapi_schema, [])
+    assert (
+        generated_proxy.film.create_request(id="1").query
+        == parsed_proxy.film.create_request(id="1").query
+    )
+
+
+# skipcq: PY-D0003
+def test_schema_module_outdated(swapi_schema):
+    module = _import_schema_module(swapi_schema)
+    module.FORMAT_VERSION = -1
+    with pytest.raises(ValueError):
+        load_schema_module(module)
+
+
+# skipcq: PY-D0003
+def test_codegen_main(tmp_path, swapi_schema):
+    module_file = tmp_path / "swapi_generated.py"
+    main([str(path_to_swapi_schema), str(module_file)])
+    assert module_file.read_text() == generate_schema_module(swapi_schema)
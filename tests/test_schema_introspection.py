@@ -0,0 +1,80 @@
+import graphql
+import pytest
+
+from qlient.core.schema.cache import build_schema_validator_query
+from qlient.core.schema.introspection import (
+    build_introspection_query,
+    build_root_types_query,
+    build_type_ref_selection,
+    build_types_query,
+)
+
+VARIANTS = [
+    {},
+    {"descriptions": False},
+    {"include_deprecated": False},
+    {"type_ref_depth": 3},
+    {"descriptions": False, "include_deprecated": False, "type_ref_depth": 0},
+]
+
+
+@pytest.fixture(scope="module")
+def client_schema(raw_swapi_schema) -> graphql.GraphQLSchema:
+    return graphql.build_client_schema({"__schema": raw_swapi_schema})
+
+
+# skipcq: PY-D0003
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_introspection_query_is_valid(client_schema, variant):
+    document = graphql.parse(build_introspection_query(**variant))
+    assert graphql.validate(client_schema, document) == []
+
+
+# skipcq: PY-D0003
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_partial_introspection_queries_are_valid(client_schema, variant):
+    for query in (build_root_types_query(**variant), build_types_query(3, **variant)):
+        assert graphql.validate(client_schema, graphql.parse(query)) == []
+
+
+# skipcq: PY-D0003
+def test_types_query_result(client_schema, raw_swapi_schema):
+    document = graphql.parse(build_types_query(2))
+    result = graphql.execute(
+        client_schema, document, variable_values={"t0": "Film", "t1": "Unknown"}
+    )
+    assert not result.errors
+    raw_film = next(t for t in raw_swapi_schema["types"] if t["name"] == "Film")
+    assert result.data["t0"]["name"] == "Film"
+    assert len(result.data["t0"]["fields"]) == len(raw_film["fields"])
+    assert result.data["t1"] is None
+
+
+# skipcq: PY-D0003
+@pytest.mark.parametrize("include_deprecated", [True, False])
+def test_schema_validator_query_is_valid(client_schema, include_deprecated):
+    document = graphql.parse(build_schema_validator_query(include_deprecated))
+    assert graphql.validate(client_schema, document) == []
+
+
+# skipcq: PY-D0003
+def test_introspection_query_variants():
+    full_query = build_introspection_query()
+    assert "description" in full_query
+    assert "isDeprecated" in full_query
+    assert full_query.count("ofType") == 7
+
+    reduced_query = build_introspection_query(
+        descriptions=False, include_deprecated=False, type_ref_depth=2
+    )
+    assert "description" not in reduced_query
+    assert "isDeprecated" not in reduced_query
+    assert "includeDeprecated: false" in reduced_query
+    assert reduced_query.count("ofType") == 2
+
+
+# skipcq: PY-D0003
+def test_type_ref_selection_depth():
+    assert build_type_ref_selection(0) == "  kind\n  name"
+    with pytest.raises(ValueError):
+        build_type_ref_selection(-1)
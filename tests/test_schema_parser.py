@@ -96,3 +96,38 @@ def test_parse_schema(raw_swapi_schema):
     assert parse_result.query_type is not None
     assert parse_result.mutation_type is None
     assert parse_result.subscription_type is None
+
+
+# skipcq: PY-D0003
+def test_parse_schema_types_lazy(raw_swapi_schema):
+    from qlient.core.schema.parser import parse_types_lazy, LazyTypesRegistry
+    from qlient.core.schema.models import Type
+
+    types = parse_types_lazy(raw_swapi_schema)
+    assert isinstance(types, LazyTypesRegistry)
+    assert len(types) == len(raw_swapi_schema["types"])
+    assert "Film" in types
+    assert types.materialized == []
+
+    film = types["Film"]
+    assert isinstance(film, Type)
+    assert types["Film"] is film
+    assert types.materialized == ["Film"]
+    assert types.get("iDoNotExist") is None
+
+
+# skipcq: PY-D0003
+def test_parse_schema_types_lazy_no_types():
+    from qlient.core.schema.parser import parse_types_lazy
+
+    with pytest.raises(NoTypesFound):
+        parse_types_lazy({})
+
+
+# skipcq: PY-D0003
+def test_parse_schema_lazy(raw_swapi_schema):
+    from qlient.core.schema.parser import parse_schema, ParseResult
+
+    parse_result: ParseResult = parse_schema(raw_swapi_schema, lazy=True)
+    assert parse_result.query_type.name == "Root"
+    assert parse_result.types.materialized == ["Root"]
@@ -1,11 +1,14 @@
 # skipcq: PY-D0003
+import asyncio
+import gc
 import io
 import json
+import os
 import tempfile
 
 import pytest
 
-from conftest import path_to_swapi_schema
+from conftest import path_to_swapi_schema, retype_swapi_film_id
 from qlient.core.models import GraphQLRequest, GraphQLResponse
 from qlient.core.schema.providers import FileSchemaProvider, SchemaProvider
 from qlient.core.schema.schema import Schema
@@ -102,3 +105,557 @@ def test_backend_schema_provider(raw_swapi_schema):
 
     my_provider = BackendSchemaProvider(MyBackend())
     assert my_provider.load_schema() == Schema(raw_swapi_schema, my_provider)
+
+
+# skipcq: PY-D0003
+def test_file_schema_provider_unwraps_introspection_result():
+    from conftest import path_to_github_schema
+
+    schema = FileSchemaProvider(path_to_github_schema).load_schema()
+    assert schema.query_type.name == "Query"
+
+
+# skipcq: PY-D0003
+def test_file_schema_provider_snapshot(tmp_path, raw_swapi_schema):
+    cold_schema = FileSchemaProvider(
+        path_to_swapi_schema, snapshot_dir=tmp_path
+    ).load_schema()
+    assert cold_schema.raw_schema == raw_swapi_schema
+    assert len(list(tmp_path.iterdir())) == 1
+
+    warm_schema = FileSchemaProvider(
+        path_to_swapi_schema, snapshot_dir=tmp_path
+    ).load_schema()
+    # schemas loaded from a snapshot do not keep the raw schema
+    assert warm_schema.raw_schema is None
+    # but still know their fingerprint
+    assert warm_schema.fingerprint == cold_schema.fingerprint
+    assert warm_schema.query_type.name == cold_schema.query_type.name
+    assert set(warm_schema.types_registry) == set(cold_schema.types_registry)
+    film_field = warm_schema.query_type.field_name_to_field["film"]
+    assert film_field.output_type is warm_schema.types_registry["Film"]
+
+
+# skipcq: PY-D0003
+def test_file_schema_provider_snapshot_invalidation(tmp_path, raw_swapi_schema):
+    schema_file = tmp_path / "schema.json"
+    snapshot_dir = tmp_path / "snapshots"
+    schema_file.write_text(json.dumps(raw_swapi_schema))
+    FileSchemaProvider(schema_file, snapshot_dir=snapshot_dir).load_schema()
+
+    changed_schema = {**raw_swapi_schema, "mutationType": None}
+    changed_schema["types"] = [
+        _type for _type in raw_swapi_schema["types"] if _type["name"] != "Film"
+    ]
+    schema_file.write_text(json.dumps(changed_schema))
+    schema = FileSchemaProvider(schema_file, snapshot_dir=snapshot_dir).load_schema()
+    assert schema.raw_schema == changed_schema
+    assert "Film" not in schema.types_registry
+    assert len(list(snapshot_dir.iterdir())) == 2
+
+
+# skipcq: PY-D0003
+def test_file_schema_provider_corrupt_snapshot(tmp_path, raw_swapi_schema):
+    from qlient.core.schema.snapshot import content_hash, snapshot_path
+
+    source_hash = content_hash(path_to_swapi_schema.read_bytes())
+    snapshot_path(tmp_path, source_hash).write_bytes(b"definitely not a snapshot")
+
+    schema = FileSchemaProvider(
+        path_to_swapi_schema, snapshot_dir=tmp_path
+    ).load_schema()
+    assert schema.raw_schema == raw_swapi_schema
+
+
+_unpickled = []
+
+
+# skipcq: PY-D0003
+def _record_unpickling():
+    _unpickled.append(True)
+
+
+class _RecordsUnpickling:
+    def __reduce__(self):
+        return _record_unpickling, ()
+
+
+# skipcq: PY-D0003
+def test_load_snapshot_checks_header_before_unpickling(tmp_path):
+    import pickle
+
+    from qlient.core.schema.snapshot import load_snapshot, snapshot_header
+
+    _unpickled.clear()
+    path = tmp_path / "snapshot"
+    path.write_bytes(pickle.dumps(_RecordsUnpickling()))
+    assert load_snapshot(path, "hash") is None
+    path.write_bytes(snapshot_header("other") + pickle.dumps(_RecordsUnpickling()))
+    assert load_snapshot(path, "hash") is None
+    assert not _unpickled
+
+    # only a snapshot with the expected header gets unpickled
+    path.write_bytes(snapshot_header("hash") + pickle.dumps(_RecordsUnpickling()))
+    assert load_snapshot(path, "hash") is None
+    assert _unpickled == [True]
+
+
+# skipcq: PY-D0003
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="requires unix permissions")
+def test_load_snapshot_refuses_writable_snapshots(tmp_path):
+    from qlient.core.schema.snapshot import content_hash, snapshot_path
+
+    source_hash = content_hash(path_to_swapi_schema.read_bytes())
+    path = snapshot_path(tmp_path, source_hash)
+    FileSchemaProvider(path_to_swapi_schema, snapshot_dir=tmp_path).load_schema()
+    assert path.is_file()
+
+    def load_raw_schema():
+        provider = FileSchemaProvider(path_to_swapi_schema, snapshot_dir=tmp_path)
+        return provider.load_schema().raw_schema
+
+    # loaded from the snapshot, hence there is no raw schema
+    assert load_raw_schema() is None
+
+    path.chmod(0o666)
+    assert load_raw_schema() is not None
+
+    path.chmod(0o600)
+    tmp_path.chmod(0o777)
+    try:
+        assert load_raw_schema() is not None
+    finally:
+        tmp_path.chmod(0o700)
+
+
+# skipcq: PY-D0003
+def test_file_schema_provider_streaming(raw_swapi_schema):
+    my_provider = FileSchemaProvider(path_to_swapi_schema, streaming=True)
+    schema = my_provider.load_schema()
+    assert schema.raw_schema == raw_swapi_schema
+    assert schema == Schema(raw_swapi_schema, my_provider)
+
+
+# skipcq: PY-D0003
+@pytest.mark.parametrize("streaming", [True, False])
+def test_file_schema_provider_without_raw_schema(raw_swapi_schema, streaming):
+    my_provider = FileSchemaProvider(
+        path_to_swapi_schema, streaming=streaming, keep_raw_schema=False
+    )
+    schema = my_provider.load_schema()
+    assert schema.raw_schema is None
+    assert schema.query_type.name == "Root"
+    # the schemas are compared by their fingerprint
+    assert schema == Schema(raw_swapi_schema, my_provider)
+    other_types = raw_swapi_schema["types"][1:]
+    assert schema != Schema({**raw_swapi_schema, "types": other_types}, my_provider)
+
+
+# skipcq: PY-D0003
+def test_file_schema_provider_streaming_snapshot(tmp_path):
+    cold_schema = FileSchemaProvider(
+        path_to_swapi_schema, snapshot_dir=tmp_path, streaming=True
+    ).load_schema()
+    warm_schema = FileSchemaProvider(
+        path_to_swapi_schema, snapshot_dir=tmp_path, streaming=True
+    ).load_schema()
+    assert cold_schema.raw_schema is not None
+    assert warm_schema.raw_schema is None
+    assert set(warm_schema.types_registry) == set(cold_schema.types_registry)
+
+
+class _CountingBackend:
+    def __init__(self, raw_schema):
+        self.raw_schema = raw_schema
+        self.operations = []
+        self.endpoint = "https://example.com/graphql"
+
+    def execute_query(self, request: GraphQLRequest) -> GraphQLResponse:
+        self.operations.append(request.operation_name)
+        return GraphQLResponse(request, {"data": {"__schema": self.raw_schema}})
+
+
+# skipcq: PY-D0003
+def test_schema_validator_matches_validator_query(strawberry_backend):
+    from qlient.core.schema.cache import compute_schema_validator
+    from qlient.core.schema.providers import BackendSchemaProvider
+
+    provider = BackendSchemaProvider(strawberry_backend)
+    full = strawberry_backend.execute_query(provider.create_introspection_request())
+    small = strawberry_backend.execute_query(provider.create_validator_request())
+    assert provider.extract_validator(small) == compute_schema_validator(
+        full.data["__schema"]
+    )
+
+
+# skipcq: PY-D0003
+def test_backend_schema_provider_cache(tmp_path, raw_swapi_schema):
+    from qlient.core.backends import Backend
+    from qlient.core.schema.cache import IntrospectionCache
+    from qlient.core.schema.providers import BackendSchemaProvider
+
+    class MyBackend(_CountingBackend, Backend):
+        pass
+
+    backend = MyBackend(raw_swapi_schema)
+    cache = IntrospectionCache(tmp_path, ttl=3600)
+    introspection = BackendSchemaProvider.INTROSPECTION_OPERATION_NAME
+    validator = BackendSchemaProvider.VALIDATOR_OPERATION_NAME
+
+    # cache miss
+    provider = BackendSchemaProvider(backend, cache=cache)
+    assert provider.load_schema() == Schema(raw_swapi_schema, provider)
+    assert backend.operations == [introspection]
+    assert "example.com" in provider.cache_key
+
+    # fresh cache hit, no request at all
+    backend.operations.clear()
+    assert provider.load_schema() == Schema(raw_swapi_schema, provider)
+    assert backend.operations == []
+    assert (
+        cache.load(provider.cache_key).fingerprint == provider.load_schema().fingerprint
+    )
+
+    # expired but unchanged, only revalidate
+    cache.ttl = 0
+    assert provider.load_schema() == Schema(raw_swapi_schema, provider)
+    assert backend.operations == [validator]
+
+    # expired and only an argument type changed, introspect again
+    backend.operations.clear()
+    retyped_schema = retype_swapi_film_id(raw_swapi_schema)
+    backend.raw_schema = retyped_schema
+    assert provider.load_schema() == Schema(retyped_schema, provider)
+    assert backend.operations == [validator, introspection]
+    assert cache.load(provider.cache_key).raw_schema == retyped_schema
+
+    # expired and a type was removed, introspect again
+    backend.operations.clear()
+    changed_schema = dict(raw_swapi_schema, types=raw_swapi_schema["types"][1:])
+    backend.raw_schema = changed_schema
+    assert provider.load_schema() == Schema(changed_schema, provider)
+    assert backend.operations == [validator, introspection]
+    assert cache.load(provider.cache_key).raw_schema == changed_schema
+
+
+# skipcq: PY-D0003
+def test_schema_validator_covers_types(raw_swapi_schema):
+    import copy
+
+    from qlient.core.schema.cache import compute_schema_validator
+
+    validator = compute_schema_validator(raw_swapi_schema)
+    assert validator != compute_schema_validator(retype_swapi_film_id(raw_swapi_schema))
+
+    def changed(change):
+        raw_schema = copy.deepcopy(raw_swapi_schema)
+        root = next(t for t in raw_schema["types"] if t["name"] == "Root")
+        change(raw_schema, root["fields"][0])
+        return compute_schema_validator(raw_schema)
+
+    def default_value(_, field):
+        field["args"][0]["defaultValue"] = "10"
+
+    def deprecation(_, field):
+        field["isDeprecated"] = True
+        field["deprecationReason"] = "use something else"
+
+    def directive(raw_schema, _):
+        raw_schema["directives"] = raw_schema["directives"][1:]
+
+    for change in (default_value, deprecation, directive):
+        assert changed(change) != validator, change.__name__
+
+    def description(_, field):
+        field["description"] = "changed"
+
+    # descriptions are not covered by the validator
+    assert changed(description) == validator
+
+
+# skipcq: PY-D0003
+def test_introspection_cache_touch_keeps_content(tmp_path, raw_swapi_schema):
+    import os
+
+    from qlient.core.schema.cache import IntrospectionCache
+
+    cache = IntrospectionCache(tmp_path, ttl=3600)
+    cache.store("swapi", raw_swapi_schema, "validator")
+    path = cache.path("swapi")
+    os.utime(path, (0, 0))
+    content = path.read_bytes()
+    assert not cache.load("swapi").is_fresh(cache.ttl)
+
+    entry = cache.touch(cache.load("swapi"))
+    assert entry.is_fresh(cache.ttl)
+    assert cache.load("swapi").is_fresh(cache.ttl)
+    assert path.read_bytes() == content
+
+
+# skipcq: PY-D0003
+def test_backend_schema_provider_cache_needs_a_key(tmp_path, strawberry_backend):
+    from qlient.core.schema.cache import IntrospectionCache
+    from qlient.core.schema.providers import BackendSchemaProvider
+
+    # the backend has no endpoint, hence its class does not identify the server
+    assert strawberry_backend.cache_key is None
+    cache = IntrospectionCache(tmp_path)
+    provider = BackendSchemaProvider(strawberry_backend, cache=cache)
+    assert provider.cache_key is None
+    assert provider.load_schema().query_type.name == "Query"
+    assert not list(tmp_path.iterdir())
+
+    provider = BackendSchemaProvider(strawberry_backend, cache=cache, cache_key="b")
+    assert provider.load_schema().query_type.name == "Query"
+    assert list(tmp_path.iterdir())
+
+
+# skipcq: PY-D0003
+def test_backend_schema_provider_corrupt_cache(tmp_path, raw_swapi_schema):
+    from qlient.core.backends import Backend
+    from qlient.core.schema.cache import IntrospectionCache
+    from qlient.core.schema.providers import BackendSchemaProvider
+
+    class MyBackend(_CountingBackend, Backend):
+        pass
+
+    backend = MyBackend(raw_swapi_schema)
+    cache = IntrospectionCache(tmp_path)
+    provider = BackendSchemaProvider(backend, cache=cache, cache_key="swapi")
+    cache.path("swapi").write_text("{not json")
+    assert provider.load_schema() == Schema(raw_swapi_schema, provider)
+    assert backend.operations == [BackendSchemaProvider.INTROSPECTION_OPERATION_NAME]
+    assert cache.load("swapi") is not None
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_backend_schema_provider_cache(tmp_path, raw_swapi_schema, mocker):
+    import threading
+
+    from qlient.core.backends import AsyncBackend
+    from qlient.core.schema.cache import IntrospectionCache
+    from qlient.core.schema.providers import AsyncBackendSchemaProvider
+
+    class MyAsyncBackend(AsyncBackend):
+        def __init__(self):
+            self.operations = []
+
+        async def execute_query(self, request: GraphQLRequest) -> GraphQLResponse:
+            self.operations.append(request.operation_name)
+            return GraphQLResponse(request, {"data": {"__schema": raw_swapi_schema}})
+
+    backend = MyAsyncBackend()
+    cache = IntrospectionCache(tmp_path, ttl=0)
+    provider = AsyncBackendSchemaProvider(backend, cache=cache, cache_key="swapi")
+    touch = cache.touch
+    touched_in = []
+
+    def record_touch(entry):
+        touched_in.append(threading.current_thread())
+        return touch(entry)
+
+    mocker.patch.object(cache, "touch", record_touch)
+    assert await provider.load_schema() == Schema(raw_swapi_schema, provider)
+    assert await provider.load_schema() == Schema(raw_swapi_schema, provider)
+    assert backend.operations == [
+        AsyncBackendSchemaProvider.INTROSPECTION_OPERATION_NAME,
+        AsyncBackendSchemaProvider.VALIDATOR_OPERATION_NAME,
+    ]
+    # the revalidated cache file is touched off the event loop
+    assert len(touched_in) == 1
+    assert touched_in[0] is not threading.current_thread()
+
+
+# skipcq: PY-D0003
+def test_backend_schema_provider_reduced_introspection(strawberry_backend):
+    from qlient.core.schema.cache import compute_schema_validator
+    from qlient.core.schema.providers import BackendSchemaProvider
+
+    full_provider = BackendSchemaProvider(strawberry_backend, cache_key="books")
+    provider = BackendSchemaProvider(
+        strawberry_backend,
+        cache_key="books",
+        descriptions=False,
+        include_deprecated=False,
+    )
+    assert provider.introspection_query != full_provider.introspection_query
+    assert provider.cache_key != full_provider.cache_key
+
+    schema = provider.load_schema()
+    assert schema.query_type is not None
+    assert all(
+        "description" not in type_dict for type_dict in schema.raw_schema["types"]
+    )
+
+    # the validator query skips the same fields as the introspection query
+    response = strawberry_backend.execute_query(provider.create_validator_request())
+    assert provider.extract_validator(response) == compute_schema_validator(
+        schema.raw_schema
+    )
+
+
+# skipcq: PY-D0003
+def test_backend_schema_provider_partial(strawberry_backend, mocker):
+    from qlient.core.builder import RequestBuilder
+    from qlient.core.models import auto
+    from qlient.core.schema.partial import RemoteTypesRegistry
+    from qlient.core.schema.providers import BackendSchemaProvider
+    from qlient.core.settings import Settings
+
+    full_schema = BackendSchemaProvider(strawberry_backend).load_schema()
+    provider = BackendSchemaProvider(strawberry_backend, partial=True, cache_key="b")
+    spy = mocker.spy(strawberry_backend, "execute_query")
+    schema = provider.load_schema()
+    assert isinstance(schema.types_registry, RemoteTypesRegistry)
+    assert spy.call_count == 1
+    assert schema.query_type.name == "Query"
+    assert "Book" not in schema.types_registry.materialized
+    assert schema.fingerprint is not None
+    full_provider = BackendSchemaProvider(strawberry_backend, cache_key="b")
+    assert provider.cache_key != full_provider.cache_key
+
+    def build(_schema):
+        field = _schema.query_type.field_name_to_field["getBooks"]
+        builder = RequestBuilder("query", field, _schema, Settings())
+        return builder.fields(auto).variables().build().query
+
+    # the types used by the query are introspected on demand, exactly once
+    assert build(schema) == build(full_schema)
+    assert spy.call_count == 2
+    assert build(schema) == build(full_schema)
+    assert spy.call_count == 2
+    assert schema.Book.field_name_to_field.keys() == {"title", "author"}
+
+    # unknown types are introspected once and then remembered
+    # membership tests and get only look at the loaded types
+    assert "Unknown" not in schema.types_registry
+    assert schema.types_registry.get("Unknown") is None
+    assert spy.call_count == 2
+
+    # unknown types are introspected once and then remembered
+    assert schema["Unknown"] is None
+    assert schema["Unknown"] is None
+    assert spy.call_count == 3
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_backend_schema_provider_partial(async_strawberry_backend):
+    from qlient.core.exceptions import TypeNotLoaded
+    from qlient.core.schema.providers import AsyncBackendSchemaProvider
+
+    provider = AsyncBackendSchemaProvider(async_strawberry_backend, partial=True)
+    schema = await provider.load_schema()
+    assert schema.query_type.name == "Query"
+    # membership tests and get neither fetch nor raise
+    assert "Book" not in schema.types_registry
+    assert schema.types_registry.get("Book") is None
+    with pytest.raises(TypeNotLoaded) as exc_info:
+        _ = schema.types_registry["Book"]
+    assert exc_info.value.type_names == ["Book"]
+
+    await schema.types_registry.load_async(exc_info.value.type_names)
+    assert "Book" in schema.types_registry
+    assert schema.types_registry.get("Book").name == "Book"
+    assert schema.types_registry["Book"].name == "Book"
+
+
+# skipcq: PY-D0003
+def test_partial_schema_cache_key_depends_on_mode(
+    strawberry_backend, async_strawberry_backend
+):
+    from qlient.core.schema.providers import (
+        AsyncBackendSchemaProvider,
+        BackendSchemaProvider,
+    )
+
+    def cache_key(provider_class, backend, **kwargs):
+        return provider_class(backend, cache_key="books", **kwargs).cache_key
+
+    # full schemas can be shared between sync and async clients
+    assert cache_key(BackendSchemaProvider, strawberry_backend) == cache_key(
+        AsyncBackendSchemaProvider, async_strawberry_backend
+    )
+    # partial schemas introspect their types either synchronously or asynchronously
+    assert cache_key(BackendSchemaProvider, strawberry_backend, partial=True) != (
+        cache_key(AsyncBackendSchemaProvider, async_strawberry_backend, partial=True)
+    )
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parse_executor", [None, "thread", "process"])
+@pytest.mark.parametrize("keep_raw_schema", [True, False])
+async def test_async_file_schema_provider(
+    raw_swapi_schema, parse_executor, keep_raw_schema
+):
+    from qlient.core.schema.providers import AsyncFileSchemaProvider
+
+    provider = AsyncFileSchemaProvider(
+        path_to_swapi_schema,
+        parse_executor=parse_executor,
+        keep_raw_schema=keep_raw_schema,
+    )
+    schema = await provider.load_schema()
+    assert schema == Schema(raw_swapi_schema, provider)
+    assert schema.Film.field_name_to_field["title"].type.type is schema.String
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_file_schema_provider_snapshot(tmp_path, raw_swapi_schema):
+    from qlient.core.schema.providers import AsyncFileSchemaProvider
+
+    for _ in range(2):
+        provider = AsyncFileSchemaProvider(path_to_swapi_schema, snapshot_dir=tmp_path)
+        assert await provider.load_schema() == Schema(raw_swapi_schema, provider)
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+async def _max_event_loop_lag(coroutine) -> float:
+    """Return the longest time the event loop was blocked while awaiting"""
+    loop = asyncio.get_event_loop()
+    lags = []
+
+    async def _ticker():
+        while True:
+            start = loop.time()
+            await asyncio.sleep(0.001)
+            lags.append(loop.time() - start)
+
+    # start the threads of the default executor upfront
+    await loop.run_in_executor(None, int)
+    # a garbage collection blocks every thread, no matter who parses the schema
+    gc.collect()
+    gc.disable()
+    ticker = asyncio.ensure_future(_ticker())
+    await asyncio.sleep(0.01)
+    try:
+        await coroutine
+        # let the ticker record the tick that was blocked last
+        await asyncio.sleep(0.01)
+    finally:
+        ticker.cancel()
+        gc.enable()
+    return max(lags)
+
+
+# skipcq: PY-D0003
+@pytest.mark.asyncio
+async def test_async_backend_schema_provider_event_loop_lag(raw_github_schema):
+    from qlient.core.backends import AsyncBackend
+    from qlient.core.schema.providers import AsyncBackendSchemaProvider
+
+    class LocalBackend(AsyncBackend):
+        async def execute_query(self, request: GraphQLRequest) -> GraphQLResponse:
+            return GraphQLResponse(request, raw_github_schema)
+
+    blocking = AsyncBackendSchemaProvider(LocalBackend(), parse_executor=None)
+    offloaded = AsyncBackendSchemaProvider(LocalBackend(), parse_executor="thread")
+    blocking_lag = await _max_event_loop_lag(blocking.load_schema())
+    offloaded_lag = await _max_event_loop_lag(offloaded.load_schema())
+    assert offloaded_lag < blocking_lag
+    assert await offloaded.load_schema() == Schema(
+        raw_github_schema["data"]["__schema"], offloaded
+    )
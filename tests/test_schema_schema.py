@@ -18,3 +18,70 @@ def test_schema(swapi_schema):
         str(swapi_schema)
         == "<Schema(query_type=<Type(name=`Root`)>, mutation_type=None, subscription_type=None)>"
     )
+
+
+# skipcq: PY-D0003
+def test_lazy_schema(raw_github_schema):
+    schema = Schema(raw_github_schema["data"]["__schema"], None, lazy=True)
+    assert schema.query_type.name == "Query"
+    assert schema.types_registry.materialized == ["Query", "Mutation"]
+
+    repository = schema["Repository"]
+    assert isinstance(repository, Type)
+    owner = repository.field_name_to_field["owner"]
+    # the output type is only materialized once it is accessed
+    assert "RepositoryOwner" not in schema.types_registry.materialized
+    assert owner.output_type.name == "RepositoryOwner"
+    assert "RepositoryOwner" in schema.types_registry.materialized
+
+
+# skipcq: PY-D0003
+def test_lazy_schema_builds_same_query(raw_swapi_schema, swapi_schema, fake_backend):
+    from qlient.core import Settings
+    from qlient.core.proxies import QueryServiceProxy
+
+    lazy_schema = Schema(raw_swapi_schema, None, lazy=True)
+    eager_proxy = QueryServiceProxy(fake_backend, Settings(), swapi_schema, [])
+    lazy_proxy = QueryServiceProxy(fake_backend, Settings(), lazy_schema, [])
+
+    assert (
+        lazy_proxy.film.create_request(id="1").query
+        == eager_proxy.film.create_request(id="1").query
+    )
+
+
+# skipcq: PY-D0003
+def test_schema_fingerprint(raw_swapi_schema):
+    from qlient.core.schema.fingerprint import fingerprint_raw_schema
+
+    provider = object()
+    schema = Schema(raw_swapi_schema, provider)
+    assert schema.fingerprint == fingerprint_raw_schema(raw_swapi_schema)
+
+    # the fingerprint does not depend on the key order
+    reordered = dict(reversed(list(raw_swapi_schema.items())))
+    same_schema = Schema(reordered, provider)
+    assert same_schema == schema
+    assert hash(same_schema) == hash(schema)
+    assert len({schema, same_schema}) == 1
+
+    other_types = raw_swapi_schema["types"][1:]
+    other_schema = Schema({**raw_swapi_schema, "types": other_types}, provider)
+    assert other_schema != schema
+    assert Schema(raw_swapi_schema, object()) != schema
+
+
+# skipcq: PY-D0003
+def test_schema_fingerprint_from_parse_result(swapi_schema):
+    schema = Schema.from_parse_result(swapi_schema.parse_result, object())
+    assert schema.raw_schema is None
+    assert schema.fingerprint == swapi_schema.fingerprint
+
+
+# skipcq: PY-D0003
+def test_schema_copy(swapi_schema):
+    import copy
+
+    schema_copy = copy.copy(swapi_schema)
+    assert schema_copy == swapi_schema
+    assert schema_copy.Film is swapi_schema.Film
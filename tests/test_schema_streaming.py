@@ -0,0 +1,78 @@
+# skipcq: PY-D0003
+import io
+import json
+
+import pytest
+
+from conftest import path_to_github_schema
+from qlient.core.exceptions import NoTypesFound, SchemaParseException
+from qlient.core.schema.fingerprint import fingerprint_raw_schema
+from qlient.core.schema.streaming import (
+    JSONStreamReader,
+    parse_schema_stream,
+    iter_schema_items,
+)
+
+
+# skipcq: PY-D0003
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_json_stream_reader(chunk_size):
+    document = '{"a": 12345, "b": [1, {"c": "ü€"}, null], "d": {}, "e": []}'
+    reader = JSONStreamReader(io.BytesIO(document.encode()), chunk_size)
+
+    keys = []
+    for key in reader.iter_object():
+        keys.append(key)
+        if key == "b":
+            assert list(reader.iter_array()) == [1, {"c": "ü€"}, None]
+        else:
+            reader.decode()
+    assert keys == ["a", "b", "d", "e"]
+    assert reader.peek() == ""
+
+
+# skipcq: PY-D0003
+def test_json_stream_reader_invalid_document():
+    reader = JSONStreamReader(io.StringIO('["a" "b"]'))
+    with pytest.raises(SchemaParseException):
+        list(reader.iter_array())
+
+
+# skipcq: PY-D0003
+def test_iter_schema_items_unwraps_introspection_result():
+    document = {
+        "data": {"__schema": {"queryType": {"name": "Query"}, "types": [{}, {}]}},
+        "errors": None,
+    }
+    reader = JSONStreamReader(io.StringIO(json.dumps(document)), 4)
+    assert list(iter_schema_items(reader)) == [
+        ("queryType", {"name": "Query"}),
+        ("types", {}),
+        ("types", {}),
+    ]
+
+
+# skipcq: PY-D0003
+def test_parse_schema_stream(raw_github_schema):
+    raw_schema = raw_github_schema["data"]["__schema"]
+    with path_to_github_schema.open("rb") as schema_file:
+        parse_result, kept_raw_schema, fingerprint = parse_schema_stream(
+            schema_file, keep_raw_schema=True, chunk_size=4096
+        )
+    assert kept_raw_schema == raw_schema
+    assert fingerprint == fingerprint_raw_schema(raw_schema)
+    assert parse_result.query_type.name == "Query"
+    assert parse_result.mutation_type.name == "Mutation"
+    assert set(parse_result.types) == {_type["name"] for _type in raw_schema["types"]}
+    assert parse_result.directives["include"].name == "include"
+
+    repository = parse_result.types["Repository"]
+    assert repository.field_name_to_field["owner"].output_type.name == (
+        "RepositoryOwner"
+    )
+
+
+# skipcq: PY-D0003
+def test_parse_schema_stream_no_types():
+    with pytest.raises(NoTypesFound):
+        parse_schema_stream(io.StringIO('{"queryType": {"name": "Query"}}'))
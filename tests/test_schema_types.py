@@ -64,3 +64,151 @@ def test_input_values():
 
     input_type = Input(name="first_name")
     assert input_type.name == "first_name"
+
+
+# skipcq: PY-D0003
+def test_schema_models_are_slotted():
+    from qlient.core.schema.models import (
+        TypeRef,
+        Input,
+        Field,
+        EnumValue,
+        Directive,
+        Type,
+    )
+
+    for model in (TypeRef(), Input(), Field(), EnumValue(), Directive(), Type()):
+        assert not hasattr(model, "__dict__")
+
+
+# skipcq: PY-D0003
+def test_type_ref_pickle_does_not_keep_type():
+    import pickle
+    from qlient.core.schema.models import TypeRef, Type
+
+    types = {"String": Type(kind="SCALAR", name="String")}
+    type_ref = TypeRef(kind="NON_NULL", ofType=TypeRef(kind="SCALAR", name="String"))
+    type_ref.infer_type_refs(types)
+    assert type_ref.leaf_type is types["String"]
+
+    unpickled = pickle.loads(pickle.dumps(type_ref))
+    assert unpickled.graphql_representation == "String!"
+    assert unpickled.leaf_type is not types["String"]
+    assert unpickled.leaf_type.name == "String"
+
+
+# skipcq: PY-D0003
+def test_type_ref_pool():
+    from qlient.core.schema.models import TypeRef, TypeRefPool, Type
+
+    types = {"ID": Type(kind="SCALAR", name="ID")}
+    pool = TypeRefPool(types)
+    raw_type_ref = {
+        "kind": "NON_NULL",
+        "name": None,
+        "ofType": {
+            "kind": "LIST",
+            "name": None,
+            "ofType": {"kind": "SCALAR", "name": "ID"},
+        },
+    }
+    first = pool.parse(raw_type_ref)
+    second = TypeRef.parse(raw_type_ref, pool)
+    assert first is second
+    assert first.graphql_representation == "[ID]!"
+    assert first.leaf_type is types["ID"]
+    # the nested chain is shared as well
+    assert pool.parse({"kind": "SCALAR", "name": "ID"}) is first.of_type_ref.of_type_ref
+    assert len(pool) == 3
+
+    assert (
+        pool.parse(TypeRef(kind="SCALAR", name="ID")) is first.of_type_ref.of_type_ref
+    )
+
+
+# skipcq: PY-D0003
+def test_type_ref_pool_invalid_input():
+    import pytest
+    from qlient.core.schema.models import TypeRefPool
+
+    with pytest.raises(TypeError):
+        TypeRefPool().parse("String")
+
+
+# skipcq: PY-D0003
+def test_schema_type_refs_are_canonical(github_schema):
+    repository = github_schema["Repository"]
+    name_type_ref = repository.field_name_to_field["name"].type
+    name_with_owner_type_ref = repository.field_name_to_field["nameWithOwner"].type
+    assert name_type_ref.graphql_representation == "String!"
+    assert name_type_ref is name_with_owner_type_ref
+    assert name_type_ref.leaf_type is github_schema["String"]
+
+
+# skipcq: PY-D0003
+def test_lookup_indexes_are_cached(github_schema):
+    repository = github_schema["Repository"]
+    assert repository.field_name_to_field is repository.field_name_to_field
+    assert repository.field_name_to_field["name"].name == "name"
+
+    issues = repository.field_name_to_field["issues"]
+    assert issues.arg_name_to_arg is issues.arg_name_to_arg
+    assert issues.arg_name_to_arg["first"].name == "first"
+
+    include = github_schema.directives_registry["include"]
+    assert include.arg_name_to_arg is include.arg_name_to_arg
+    assert include.arg_name_to_arg["if"].type.graphql_representation == "Boolean!"
+
+
+# skipcq: PY-D0003
+def test_type_ref_derived_values_are_memoized():
+    from qlient.core.schema.models import TypeRef, Type
+
+    types = {"ID": Type(kind="SCALAR", name="ID")}
+    type_ref = TypeRef(
+        kind="NON_NULL", ofType=TypeRef(kind="LIST", ofType=TypeRef("SCALAR", "ID"))
+    )
+    type_ref.infer_type_refs(types)
+
+    representation = type_ref.graphql_representation
+    assert representation == "[ID]!"
+    assert type_ref.graphql_representation is representation
+    assert type_ref.__gql__() is representation
+    assert type_ref.leaf_type_name == "ID"
+    assert type_ref.leaf_type is types["ID"]
+
+    # re-inferring the types drops the memoized leaf type
+    other_types = {"ID": Type(kind="SCALAR", name="ID")}
+    type_ref.infer_type_refs(other_types)
+    assert type_ref.leaf_type is other_types["ID"]
+
+
+# skipcq: PY-D0003
+def test_canonical_type_refs_are_not_relinked():
+    import pytest
+    from qlient.core.schema.models import Type, TypeRefPool
+
+    types = {"ID": Type(kind="SCALAR", name="ID")}
+    type_ref = TypeRefPool(types).parse({"kind": "SCALAR", "name": "ID"})
+    holder = Type(kind="OBJECT", name="Holder", interfaces=[])
+    holder.interfaces.append(type_ref)
+
+    # relinking would change the type ref for every other holder
+    other_types = {"ID": Type(kind="SCALAR", name="ID")}
+    holder.infer_types(other_types)
+    assert type_ref.type is types["ID"]
+    with pytest.raises(AttributeError):
+        type_ref.type = other_types["ID"]
+
+
+# skipcq: PY-D0003
+def test_directives_share_the_type_refs_of_the_schema(raw_swapi_schema):
+    from qlient.core.schema.parser import parse_schema
+
+    for lazy in (False, True):
+        parse_result = parse_schema(raw_swapi_schema, lazy=lazy)
+        page_info = parse_result.types["PageInfo"]
+        has_next_page = page_info.field_name_to_field["hasNextPage"].type
+        include = parse_result.directives["include"]
+        assert include.arg_name_to_arg["if"].type is has_next_page
+        assert has_next_page.leaf_type is parse_result.types["Boolean"]
@@ -6,5 +6,13 @@ def test_settings():
     assert settings.allow_auto_lookup
     assert settings.lookup_recursion_depth
     assert settings.use_schema_description
+    assert settings.introspection_cache_dir is None
+    assert settings.introspection_cache_ttl > 0
+    assert not settings.partial_introspection
+    assert settings.request_cache_size > 0
+    assert not settings.pretty_queries
+    assert not settings.persisted_queries
+    assert settings.schema_refresh_interval is None
+    assert settings.schema_parse_executor == "thread"
 
     assert isinstance(str(settings), str)